@@ -15,7 +15,8 @@
 
 """RIDE -- Robot Framework test data editor
 
-Usage: ride.py [--noupdatecheck] [--debugconsole] [--version] [inpath]
+Usage: ride.py [--noupdatecheck] [--debugconsole] [--startuptimes]
+               [--profilestartup] [--version] [inpath]
 
 RIDE can be started either without any arguments or by giving a path to a test
 data file or directory to be opened.
@@ -24,6 +25,11 @@ To disable update checker use --noupdatecheck.
 
 To start debug console for RIDE problem debugging use --debugconsole option.
 
+To write the time spent in each startup phase to a JSON file use
+--startuptimes. To dump a cProfile profile of the whole startup use
+--profilestartup. Both files are written to the system temporary directory
+and their paths are reported in the RIDE log.
+
 To see RIDE's version use --version.
 
 RIDE's API is still evolving while the project is moving towards the 1.0
@@ -52,9 +58,13 @@ sys.path.append(os.path.join(os.path.dirname(__file__), 'spec'))
 sys.path.append(os.path.join(os.path.dirname(__file__), 'lib'))
 
 
+_OPTIONS = ['--noupdatecheck', '--debugconsole', '--startuptimes',
+            '--profilestartup', '--version', '--help']
+
+
 def main(*args):
     noupdatecheck, debug_console, inpath = _parse_args(args)
-    if len(args) > 3 or '--help' in args:
+    if len([a for a in args if a not in _OPTIONS]) > 1 or '--help' in args:
         print(__doc__)
         sys.exit()
     if '--version' in args:
@@ -66,7 +76,9 @@ def main(*args):
         print(version.VERSION)
         sys.exit(0)
     try:
-        _run(inpath, not noupdatecheck, debug_console)
+        _run(inpath, not noupdatecheck, debug_console,
+             startup_times='--startuptimes' in args,
+             profile_startup='--profilestartup' in args)
     except Exception:  # DEBUG
         import traceback
         traceback.print_exception(*sys.exc_info())
@@ -78,19 +90,24 @@ def _parse_args(args):
         return False, False, None
     noupdatecheck = '--noupdatecheck' in args
     debug_console = '--debugconsole' in args
-    inpath = args[-1] if args[-1] not in ['--noupdatecheck',
-                                          '--debugconsole'] else None
+    inpath = args[-1] if args[-1] not in _OPTIONS else None
     return noupdatecheck, debug_console, inpath
 
 
-def _run(inpath=None, updatecheck=True, debug_console=False):
+def _run(inpath=None, updatecheck=True, debug_console=False,
+         startup_times=False, profile_startup=False):
     try:
         from robotide.application import RIDE
         from robotide.application import debugconsole
     except ImportError:
         _show_old_wxpython_warning_if_needed()
         raise
-    ride = RIDE(inpath, updatecheck)
+    startup_times = _temp_path('ride-startup-times.json') \
+        if startup_times else None
+    if profile_startup:
+        ride = _profile_startup(RIDE, inpath, updatecheck, startup_times)
+    else:
+        ride = RIDE(inpath, updatecheck, startup_times)
     if wx.VERSION <= (4, 0, 4, '', ''):
         _show_old_wxpython_warning_if_needed(ride.frame)
     else:
@@ -101,6 +118,23 @@ def _run(inpath=None, updatecheck=True, debug_console=False):
     ride.MainLoop()
 
 
+def _temp_path(name):
+    import tempfile
+    return os.path.join(tempfile.gettempdir(), name)
+
+
+def _profile_startup(ride_class, inpath, updatecheck, startup_times):
+    import cProfile
+    from robotide.publish import RideLogMessage
+    profiler = cProfile.Profile()
+    ride = profiler.runcall(ride_class, inpath, updatecheck, startup_times)
+    path = _temp_path('ride-startup.prof')
+    profiler.dump_stats(path)
+    RideLogMessage("Startup profile written to '%s'. Inspect it with "
+                   "'python -m pstats %s'." % (path, path)).publish()
+    return ride
+
+
 def _show_old_wxpython_warning_if_needed(parent=None):
     if wx.VERSION <=(4, 0, 4, '', ''):
         title = "Please upgrade your wxPython installation"
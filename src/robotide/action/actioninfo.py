@@ -17,7 +17,7 @@ import wx
 import re
 
 from .shortcut import Shortcut
-from robotide.widgets import ImageProvider
+from robotide.widgets import IMAGES
 
 
 def ActionInfoCollection(data, event_handler, container=None):
@@ -239,7 +239,7 @@ class ActionInfo(MenuInfo):
             return None
         if isinstance(self._icon_source, str):
             if self._icon_source.startswith("CUSTOM_"):
-                return ImageProvider().get_image_by_name(self._icon_source[len("CUSTOM_"):])
+                return IMAGES.get_image_by_name(self._icon_source[len("CUSTOM_"):])
             return wx.ArtProvider.GetBitmap(getattr(wx, self._icon_source),
                                             wx.ART_TOOLBAR, (16, 16))
         return self._icon_source
@@ -32,17 +32,20 @@ from robotide.preferences import Preferences, RideSettings
 from robotide.application.pluginloader import PluginLoader
 from robotide.application.editorprovider import EditorProvider
 from robotide.application.releasenotes import ReleaseNotes
+from robotide.application.robotinstallation import RobotInstallationFinder
+from robotide.application.startuptimer import StartupTimer
 from robotide.application.updatenotifier import UpdateNotifierController, UpdateDialog
 from robotide.ui.treeplugin import TreePlugin
 from robotide.ui.fileexplorerplugin import FileExplorerPlugin
-from robotide import utils
 
 
 class RIDE(wx.App):
 
-    def __init__(self, path=None, updatecheck=True):
+    def __init__(self, path=None, updatecheck=True, startup_times=None):
         self._initial_path = path
         self._updatecheck = updatecheck
+        self._startup_times = startup_times
+        self.startup_timer = StartupTimer()
         context.APP = self
         wx.App.__init__(self, redirect=False)
 
@@ -52,39 +55,71 @@ class RIDE(wx.App):
         self._initial_locale = wx.Locale(wx.LANGUAGE_ENGLISH)
         # Needed for SetToolTipString to work
         wx.HelpProvider.Set(wx.SimpleHelpProvider())  # TODO adjust to wx versions 
-        self.settings = RideSettings()
-        librarydatabase.initialize_database()
-        self.preferences = Preferences(self.settings)
-        self.namespace = Namespace(self.settings)
-        self._controller = Project(self.namespace, self.settings)
-        self.frame = RideFrame(self, self._controller)
-        self._editor_provider = EditorProvider()
-        self._plugin_loader = PluginLoader(self, self._get_plugin_dirs(),
-                                           coreplugins.get_core_plugins())
-        self._plugin_loader.enable_plugins()
-        self.treeplugin = TreePlugin(self)
-        self.treeplugin.register_frame(self.frame)
-        self.fileexplorerplugin = FileExplorerPlugin(self, self._controller)
-        self.fileexplorerplugin.register_frame(self.frame)
-        self.frame.Show()
-        if not self.treeplugin.opened:
-            self.treeplugin.close_tree()
-        if not self.fileexplorerplugin.opened:
-            self.fileexplorerplugin.close_tree()
-        self.editor = self._get_editor()
-        self._load_data()
-        self.treeplugin.populate(self.model)
-        self.treeplugin.set_editor(self.editor)
-        self._find_robot_installation()
+        timer = self.startup_timer
+        with timer.phase('Settings'):
+            self.settings = RideSettings()
+        with self.settings.deferred_saving():
+            self._initialize(timer)
+        self._report_startup_times(timer)
+        return True
+
+    def _initialize(self, timer):
+        with timer.phase('Library database'):
+            librarydatabase.initialize_database()
+        with timer.phase('Namespace and project'):
+            self.preferences = Preferences(self.settings)
+            self.namespace = Namespace(self.settings)
+            self._controller = Project(self.namespace, self.settings)
+        with timer.phase('Main frame'):
+            self.frame = RideFrame(self, self._controller)
+            self._editor_provider = EditorProvider()
+        with timer.phase('Plugins'):
+            self._plugin_loader = PluginLoader(
+                self, self._get_plugin_dirs(), coreplugins.get_core_plugins(),
+                manifest_path=self.settings.get_path('plugin_manifest.json'))
+            self._plugin_loader.enable_plugins()
+        for name, wall, cpu in self._plugin_loader.timings:
+            timer.add(name, wall, cpu, parent='Plugins')
+        with timer.phase('Tree and file explorer'):
+            self.treeplugin = TreePlugin(self)
+            self.treeplugin.register_frame(self.frame)
+            self.fileexplorerplugin = FileExplorerPlugin(self, self._controller)
+            self.fileexplorerplugin.register_frame(self.frame)
+            self.frame.Show()
+            if not self.treeplugin.opened:
+                self.treeplugin.close_tree()
+            if not self.fileexplorerplugin.opened:
+                self.fileexplorerplugin.close_tree()
+            self.editor = self._get_editor()
+        with timer.phase('Loading data'):
+            self._load_data()
+        with timer.phase('Tree population'):
+            self.treeplugin.populate(self.model)
+            self.treeplugin.set_editor(self.editor)
+        with timer.phase('Robot Framework probe'):
+            self._find_robot_installation()
         self._publish_system_info()
         perspective = self.settings.get('AUI Perspective', None)
         if perspective:
             self.frame._mgr.LoadPerspective(perspective, True)
         if self._updatecheck:
-            UpdateNotifierController(self.settings).notify_update_if_needed(UpdateDialog)
+            with timer.phase('Update check'):
+                UpdateNotifierController(self.settings).notify_update_if_needed(UpdateDialog)
         wx.CallLater(200, ReleaseNotes(self).bring_to_front)
         wx.CallLater(200, self.fileexplorerplugin._update_tree)
-        return True
+
+    def _report_startup_times(self, timer):
+        timer.log()
+        if self._startup_times:
+            try:
+                timer.write_json(self._startup_times)
+            except IOError as err:
+                publish.RideLogMessage(
+                    "Writing startup times to '%s' failed: %s"
+                    % (self._startup_times, err), level='WARN').publish()
+            else:
+                publish.RideLogMessage("Startup times written to '%s'."
+                                       % self._startup_times).publish()
 
     def _publish_system_info(self):
         publish.RideLogMessage(context.SYSTEM_INFO).publish()
@@ -115,14 +150,13 @@ class RIDE(wx.App):
             self._controller.load_data(path, observer)
 
     def _find_robot_installation(self):
-        output = utils.run_python_command(
-            ['import robot; print(robot.__file__ + \", \" + robot.__version__)'])
-        robot_found = b"ModuleNotFoundError" not in output and output
-        if robot_found:
-            rf_file, rf_version = output.strip().split(b", ")
+        RobotInstallationFinder(self.settings).find(
+            self._robot_installation_found)
+
+    def _robot_installation_found(self, installation):
+        if installation:
             publish.RideLogMessage("Found Robot Framework version %s from %s." % (
-                str(rf_version, 'utf-8'), str(os.path.dirname(rf_file), 'utf-8'))).publish()
-            return rf_version
+                installation.version, installation.path)).publish()
         else:
             publish.RideLogMessage(
                 publish.get_html_message('no_robot'), notify_user=True
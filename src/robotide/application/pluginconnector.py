@@ -63,6 +63,64 @@ class PluginConnector(_PluginConnector):
             self._plugin.disable()
 
 
+class LazyPluginConnector(_PluginConnector):
+    """Connector to a plugin known from the plugin manifest.
+
+    Name, doc and metadata come from the manifest, and the plugin module is
+    imported and the plugin created only when the plugin is enabled.
+    `class_loader` is called without arguments to get the plugin class.
+    """
+
+    def __init__(self, application, entry, class_loader):
+        _PluginConnector.__init__(self, entry['name'], entry['doc'])
+        self.metadata = entry['metadata']
+        self._application = application
+        self._initially_enabled = entry['initially_enabled']
+        self._class_loader = class_loader
+        self._connector = None
+        self._plugin = None
+        self._settings = application.settings['Plugins'].add_section(self.name)
+
+    @property
+    def loaded(self):
+        return self._connector is not None
+
+    def enable_on_startup(self):
+        if self._settings.get('_enabled', self._initially_enabled):
+            try:
+                self.enable()
+            except RuntimeError:
+                pass
+
+    def enable(self):
+        connector = self._load()
+        connector.enable()
+        self.enabled = True
+
+    def disable(self):
+        if self.enabled:
+            self._connector.disable()
+            self.enabled = False
+
+    def _load(self):
+        if self._connector is None:
+            if self.error:
+                raise RuntimeError(self.error)
+            plugin_class = self._class_loader()
+            if plugin_class is None:
+                self.error = "Plugin '%s' could not be loaded." % self.name
+                raise RuntimeError(self.error)
+            connector = PluginFactory(self._application, plugin_class)
+            if connector.error:
+                self.error, self.doc = connector.error, connector.doc
+                raise RuntimeError(self.error)
+            self._connector = connector
+            self._plugin = connector._plugin
+            self.config_panel = connector.config_panel
+            self.metadata = connector.metadata
+        return self._connector
+
+
 class BrokenPlugin(_PluginConnector):
 
     def __init__(self, error_msg, traceback, plugin_class):
@@ -16,32 +16,101 @@
 import importlib
 import importlib.util
 import inspect
+import json
 import os
+import time
+from contextlib import contextmanager
 from robotide.context import LOG
 from robotide.pluginapi import Plugin
-from .pluginconnector import PluginFactory
+from .pluginconnector import PluginFactory, LazyPluginConnector
 
 
 class PluginLoader(object):
 
-    def __init__(self, application, load_dirs, standard_classes):
+    def __init__(self, application, load_dirs, standard_classes,
+                 manifest_path=None):
+        self._application = application
         self._load_errors = []
-        self.plugins = [ PluginFactory(application, cls) for cls in
-                         standard_classes + self._find_classes(load_dirs) ]
+        self._modules = {}
+        self._timings = {}
+        self._manifest = PluginManifest(manifest_path)
+        self.plugins = [self._create_plugin(cls) for cls in standard_classes] \
+            + self._load_plugins(load_dirs)
+        self._manifest.save()
         if self._load_errors:
             LOG.error('\n\n'.join(self._load_errors))
 
     def enable_plugins(self):
         for p in self.plugins:
-            p.enable_on_startup()
+            with self._timed(p.name):
+                p.enable_on_startup()
 
-    def _find_classes(self, load_dirs):
-        classes = []
+    @property
+    def timings(self):
+        """Wall and CPU time spent loading and enabling each plugin.
+
+        Returned as a list of (name, wall, cpu) tuples, slowest first.
+        """
+        return sorted(((name, wall, cpu) for name, (wall, cpu)
+                       in self._timings.items()), key=lambda t: -t[1])
+
+    @contextmanager
+    def _timed(self, name):
+        wall, cpu = time.perf_counter(), time.process_time()
+        yield
+        self._add_timing(name, time.perf_counter() - wall,
+                         time.process_time() - cpu)
+
+    def _add_timing(self, name, wall, cpu):
+        old_wall, old_cpu = self._timings.get(name, (0, 0))
+        self._timings[name] = (old_wall + wall, old_cpu + cpu)
+
+    def _create_plugin(self, cls, import_wall=0, import_cpu=0):
+        wall, cpu = time.perf_counter(), time.process_time()
+        plugin = PluginFactory(self._application, cls)
+        self._add_timing(plugin.name,
+                         time.perf_counter() - wall + import_wall,
+                         time.process_time() - cpu + import_cpu)
+        return plugin
+
+    def _load_plugins(self, load_dirs):
+        plugins = []
         for path in self._find_python_files(load_dirs):
-            for cls in self._import_classes(path):
-                if self._is_plugin_class(path, cls):
-                    classes.append(cls)
-        return classes
+            entries = self._manifest.get(path)
+            if entries is None:
+                plugins.extend(self._load_plugins_from(path))
+            else:
+                plugins.extend(self._lazy_plugin(path, entry)
+                               for entry in entries)
+        return plugins
+
+    def _lazy_plugin(self, path, entry):
+        return LazyPluginConnector(
+            self._application, entry,
+            lambda: self._import_class(path, entry['class']))
+
+    def _load_plugins_from(self, path):
+        wall, cpu = time.perf_counter(), time.process_time()
+        errors = len(self._load_errors)
+        classes = [cls for cls in self._import_classes(path)
+                   if self._is_plugin_class(path, cls)]
+        # Import time is shared evenly by the plugins of the module.
+        count = len(classes) or 1
+        wall = (time.perf_counter() - wall) / count
+        cpu = (time.process_time() - cpu) / count
+        plugins = [self._create_plugin(cls, wall, cpu) for cls in classes]
+        if len(self._load_errors) == errors and \
+                not any(p.error for p in plugins):
+            self._manifest.set(path, [self._manifest_entry(cls, plugin)
+                                      for cls, plugin in zip(classes, plugins)])
+        return plugins
+
+    def _manifest_entry(self, cls, plugin):
+        return {'class': cls.__name__,
+                'name': plugin.name,
+                'doc': plugin.doc,
+                'metadata': plugin.metadata,
+                'initially_enabled': plugin._plugin.initially_enabled}
 
     def _is_plugin_class(self, path, cls):
         try:
@@ -64,18 +133,89 @@ class PluginLoader(object):
                     files.extend(self._find_python_files([full_path]))
         return files
 
+    def _import_class(self, path, name):
+        module = self._import_module(path)
+        if self._load_errors:
+            LOG.error('\n\n'.join(self._load_errors))
+            self._load_errors = []
+        if module is None:
+            return None
+        return getattr(module, name, None)
+
     def _import_classes(self, path):
+        m_module = self._import_module(path)
+        if m_module is None:
+            return []
+        return [cls for _, cls in
+                inspect.getmembers(m_module, predicate=inspect.isclass)]
+
+    def _import_module(self, path):
+        if path in self._modules:
+            return self._modules[path]
         dirpath, filename = os.path.split(path)
         modulename = os.path.splitext(filename)[0]
         spec = importlib.util.spec_from_file_location(modulename, path)
         if spec is None:
-            return []
+            return None
         try:
             m_module = importlib.util.module_from_spec(spec)
             spec.loader.exec_module(m_module)
         except Exception as err:
             self._load_errors.append("Importing plugin module '%s' failed:\n%s"
                                      % (path, err))
-            return []
-        return [cls for _, cls in
-                inspect.getmembers(m_module, predicate=inspect.isclass)]
+            m_module = None
+        self._modules[path] = m_module
+        return m_module
+
+
+class PluginManifest(object):
+    """Plugins found from plugin files, cached between RIDE runs.
+
+    Entries are keyed by file path and are valid as long as the file's
+    modification time and size stay the same. Only entries used during the
+    current run are saved, so removed plugin files drop out of the manifest.
+    Without a path nothing is cached.
+    """
+
+    def __init__(self, path=None):
+        self._path = path
+        self._entries = self._read()
+        self._used = {}
+
+    def _read(self):
+        if not self._path or not os.path.isfile(self._path):
+            return {}
+        try:
+            with open(self._path) as manifest:
+                return json.load(manifest)
+        except (IOError, ValueError):
+            return {}
+
+    def get(self, path):
+        """Returns cached plugin entries of the file or None if not cached."""
+        entry = self._entries.get(path)
+        if not entry or entry['signature'] != self._signature(path):
+            return None
+        self._used[path] = entry
+        return entry['plugins']
+
+    def set(self, path, plugins):
+        self._used[path] = {'signature': self._signature(path),
+                            'plugins': plugins}
+
+    def save(self):
+        if not self._path or self._used == self._entries:
+            return
+        try:
+            content = json.dumps(self._used, indent=1, sort_keys=True)
+        except (TypeError, ValueError) as err:
+            LOG.warn("Saving plugin manifest failed: %s" % err)
+            return
+        with open(self._path, 'w') as manifest:
+            manifest.write(content)
+        self._entries = self._used
+
+    @staticmethod
+    def _signature(path):
+        stat = os.stat(path)
+        return [stat.st_mtime, stat.st_size]
@@ -15,7 +15,6 @@
 #  limitations under the License.
 
 import wx
-from wx.lib.ClickableHtmlWindow import PyClickableHtmlWindow
 from robotide.version import VERSION
 from robotide.pluginapi import ActionInfo
 
@@ -57,6 +56,8 @@ class ReleaseNotes(object):
             self.application.frame.notebook.show_tab(self._view)
 
     def _create_view(self):
+        # Imported here because the release notes are seldom viewed.
+        from wx.lib.ClickableHtmlWindow import PyClickableHtmlWindow
         panel = wx.Panel(self.application.frame.notebook)
         html_win = PyClickableHtmlWindow(panel, -1)
         html_win.SetStandardFonts()
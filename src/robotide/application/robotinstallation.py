@@ -0,0 +1,107 @@
+#  Copyright 2008-2015 Nokia Networks
+#  Copyright 2016-     Robot Framework Foundation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import os
+import sys
+from threading import Thread
+
+import wx
+
+from robotide import utils
+
+_ROBOT_INSTALLATION_SETTING = 'robot installation'
+
+
+class RobotInstallation(object):
+
+    def __init__(self, path, version):
+        self.path = path
+        self.version = version
+
+
+class RobotInstallationFinder(object):
+    """Finds the Robot Framework installed for the Python running RIDE.
+
+    Finding it requires starting a Python subprocess, which is done in a
+    background thread. The result is cached in settings keyed by the
+    interpreter path and modification time and by the modification time
+    of the found `robot/__init__.py`, so later launches only need to stat
+    two files unless the interpreter or Robot Framework changes.
+    """
+
+    def __init__(self, settings, interpreter=None, call_after=None):
+        self._settings = settings
+        self._interpreter = interpreter or sys.executable
+        self._call_after = call_after or wx.CallAfter
+
+    def find(self, callback):
+        """Calls `callback` with a `RobotInstallation` or None.
+
+        The callback is called immediately when a valid cached result exists
+        and otherwise later, through `call_after`, when the probe finishes.
+        """
+        installation = self._get_cached()
+        if installation:
+            callback(installation)
+            return
+        thread = Thread(target=self._probe, args=(callback,))
+        thread.daemon = True
+        thread.start()
+
+    def _probe(self, callback):
+        try:
+            found = self._run_probe()
+        except Exception:
+            found = None
+        self._call_after(self._probe_finished, found, callback)
+
+    def _run_probe(self):
+        output = utils.run_python_command(
+            ['import robot; print(robot.__file__ + \", \" + robot.__version__)'])
+        if not output or b"ModuleNotFoundError" in output:
+            return None
+        rf_file, rf_version = output.strip().split(b", ")
+        return str(rf_file, 'utf-8'), str(rf_version, 'utf-8')
+
+    def _probe_finished(self, found, callback):
+        if not found:
+            callback(None)
+            return
+        rf_file, rf_version = found
+        self._cache(rf_file, rf_version)
+        callback(RobotInstallation(os.path.dirname(rf_file), rf_version))
+
+    def _get_cached(self):
+        cached = self._settings.get(_ROBOT_INSTALLATION_SETTING, None)
+        if not cached or len(cached) != 5:
+            return None
+        interpreter, interpreter_mtime, rf_file, rf_mtime, rf_version = cached
+        if interpreter != self._interpreter or \
+                interpreter_mtime != _mtime(self._interpreter) or \
+                rf_mtime is None or rf_mtime != _mtime(rf_file):
+            return None
+        return RobotInstallation(os.path.dirname(rf_file), rf_version)
+
+    def _cache(self, rf_file, rf_version):
+        self._settings[_ROBOT_INSTALLATION_SETTING] = [
+            self._interpreter, _mtime(self._interpreter),
+            rf_file, _mtime(rf_file), rf_version]
+
+
+def _mtime(path):
+    try:
+        return os.path.getmtime(path)
+    except OSError:
+        return None
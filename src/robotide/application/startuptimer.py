@@ -0,0 +1,80 @@
+#  Copyright 2008-2015 Nokia Networks
+#  Copyright 2016-     Robot Framework Foundation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import json
+import time
+from contextlib import contextmanager
+
+from robotide.publish import RideLogMessage
+
+
+class StartupPhase(object):
+
+    def __init__(self, name, wall, cpu, parent=None):
+        self.name = name
+        self.wall = wall
+        self.cpu = cpu
+        self.parent = parent
+
+    def as_dict(self):
+        return {'name': self.name, 'parent': self.parent,
+                'wall': self.wall, 'cpu': self.cpu}
+
+
+class StartupTimer(object):
+    """Collects wall and CPU time spent in the phases of RIDE startup.
+
+    Phases are timed with the `phase` context manager. Timings measured
+    elsewhere, such as the ones of single plugins, can be added with `add`
+    and given the name of the phase they belong to as `parent`.
+    """
+
+    def __init__(self):
+        self.phases = []
+        self._started = time.perf_counter()
+        self._cpu_started = time.process_time()
+
+    @contextmanager
+    def phase(self, name):
+        wall, cpu = time.perf_counter(), time.process_time()
+        try:
+            yield
+        finally:
+            self.add(name, time.perf_counter() - wall,
+                     time.process_time() - cpu)
+
+    def add(self, name, wall, cpu, parent=None):
+        self.phases.append(StartupPhase(name, wall, cpu, parent))
+
+    @property
+    def total(self):
+        return StartupPhase('Total', time.perf_counter() - self._started,
+                            time.process_time() - self._cpu_started)
+
+    def report(self):
+        lines = ['RIDE startup times (wall / CPU):']
+        for phase in self.phases + [self.total]:
+            indent = '    ' if phase.parent else '  '
+            lines.append('%s%s: %.1f ms / %.1f ms' % (
+                indent, phase.name, phase.wall * 1000, phase.cpu * 1000))
+        return '\n'.join(lines)
+
+    def log(self):
+        RideLogMessage(self.report()).publish()
+
+    def write_json(self, path):
+        with open(path, 'w') as outfile:
+            json.dump({'phases': [p.as_dict() for p in self.phases],
+                       'total': self.total.as_dict()}, outfile, indent=2)
@@ -27,6 +27,8 @@ def get_core_plugins():
     from robotide.searchtests.searchtests import TestSearchPlugin
     from robotide.spec.specimporter import SpecImporterPlugin
     from robotide.postinstall.desktopshortcut import ShortcutPlugin
+    from robotide.performance import PerformancePlugin
 
     return [RunAnything, RecentFilesPlugin, PreviewPlugin, SpecImporterPlugin, EditorPlugin, TextEditorPlugin,
-            KeywordSearch, LogPlugin, TestSearchPlugin, ShortcutPlugin, ParserLogPlugin, TreePlugin, FileExplorerPlugin]
+            KeywordSearch, LogPlugin, TestSearchPlugin, ShortcutPlugin, ParserLogPlugin, TreePlugin, FileExplorerPlugin,
+            PerformancePlugin]
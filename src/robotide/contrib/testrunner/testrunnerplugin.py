@@ -63,7 +63,7 @@ from robotide.contrib.testrunner import runprofiles
 from robotide.publish import RideSettingsChanged, PUBLISHER
 from robotide.publish.messages import RideTestSelectedForRunningChanged
 from robotide.pluginapi import Plugin, ActionInfo
-from robotide.widgets import Label, ImageProvider
+from robotide.widgets import Label, IMAGES
 from robotide.robotapi import LOG_LEVELS
 from robotide.utils import robottime
 from robotide.preferences.editors import ReadFonts
@@ -171,7 +171,7 @@ class TestRunnerPlugin(Plugin):
 
     def _register_actions(self):
         run_action_info = ActionInfo("Tools", "Run Tests", self.OnRun, None,
-                                     "F8", ImageProvider().TOOLBAR_PLAY,
+                                     "F8", IMAGES.TOOLBAR_PLAY,
                                      "Run the selected tests", position=10)
         self._run_action = self.register_action(run_action_info)
         run_action_debug = ActionInfo("Tools", "Run Tests with Debug",
@@ -182,7 +182,7 @@ class TestRunnerPlugin(Plugin):
         self._run_action = self.register_action(run_action_debug)
         stop_action_info = ActionInfo("Tools", "Stop Test Run", self.OnStop,
                                       None, "CtrlCmd-F8",
-                                      ImageProvider().TOOLBAR_STOP,
+                                      IMAGES.TOOLBAR_STOP,
                                       "Stop a running test", position=11)
         self._stop_action = self.register_action(stop_action_info)
 
@@ -580,26 +580,26 @@ class TestRunnerPlugin(Plugin):
     def _build_runner_toolbar(self):
         toolbar = wx.ToolBar(self.panel, wx.ID_ANY,
                              style=wx.TB_HORIZONTAL | wx.TB_HORZ_TEXT)
-        toolbar.AddTool(ID_RUN, "Start", ImageProvider().TOOLBAR_PLAY,wx.NullBitmap,
+        toolbar.AddTool(ID_RUN, "Start", IMAGES.TOOLBAR_PLAY,wx.NullBitmap,
                         wx.ITEM_NORMAL, shortHelp="Start robot", longHelp="Start running the "
                                                                           "robot test suite")
         toolbar.AddTool(ID_RUNDEBUG, "Debug", getBugIconBitmap(), wx.NullBitmap,
                         wx.ITEM_NORMAL, shortHelp="Start robot", longHelp="Start running the "
                                                                           "robot test suite with "
                                                                           "DEBUG loglevel")
-        toolbar.AddTool(ID_STOP, "Stop", ImageProvider().TOOLBAR_STOP, wx.NullBitmap,
+        toolbar.AddTool(ID_STOP, "Stop", IMAGES.TOOLBAR_STOP, wx.NullBitmap,
                         wx.ITEM_NORMAL, shortHelp="Stop a running test", longHelp="Stop a "
                                                                                   "running test")
-        toolbar.AddTool(ID_PAUSE, "Pause", ImageProvider().TOOLBAR_PAUSE, wx.NullBitmap,
+        toolbar.AddTool(ID_PAUSE, "Pause", IMAGES.TOOLBAR_PAUSE, wx.NullBitmap,
                         wx.ITEM_NORMAL, shortHelp="Pause test execution", longHelp="Pause test "
                                                                                    "execution")
-        toolbar.AddTool(ID_CONTINUE, "Continue", ImageProvider().TOOLBAR_CONTINUE, wx.NullBitmap,
+        toolbar.AddTool(ID_CONTINUE, "Continue", IMAGES.TOOLBAR_CONTINUE, wx.NullBitmap,
                         wx.ITEM_NORMAL, shortHelp="Continue test execution", longHelp="Continue "
                                                                                       "test "
                                                                                       "execution")
-        toolbar.AddTool(ID_STEP_NEXT, "Next", ImageProvider().TOOLBAR_NEXT, wx.NullBitmap,
+        toolbar.AddTool(ID_STEP_NEXT, "Next", IMAGES.TOOLBAR_NEXT, wx.NullBitmap,
                         wx.ITEM_NORMAL, shortHelp="Step next", longHelp="Step next")
-        toolbar.AddTool(ID_STEP_OVER, "Step over", ImageProvider().TOOLBAR_NEXT, wx.NullBitmap,
+        toolbar.AddTool(ID_STEP_OVER, "Step over", IMAGES.TOOLBAR_NEXT, wx.NullBitmap,
                         wx.ITEM_NORMAL, shortHelp="Step over", longHelp="Step over")
         toolbar.Realize()
         self._bind_runner_toolbar_events(toolbar)
@@ -13,7 +13,12 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import sys
+import weakref
+from collections import deque
+
 from robotide.publish.messages import RideModificationPrevented
+from robotide.utils.instrumentation import INSTRUMENTATION
 
 
 class _BaseController(object):
@@ -118,40 +123,137 @@ class WithNamespace(object):
         return self._namespace.is_variables_import_ok(self.datafile, imp)
 
 
+class UndoHistory(object):
+    """Undo or redo stack bounded by an entry and a memory budget.
+
+    When either budget is exceeded, the oldest entries are dropped. The
+    latest entry is always kept, however large it is. The memory use of an
+    entry is estimated with `approximate_size`.
+    """
+
+    def __init__(self, max_entries, max_bytes):
+        self._entries = deque()
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self.size_in_bytes = 0
+        _HISTORIES.add(self)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __getitem__(self, index):
+        return self._entries[index][0]
+
+    def push(self, command):
+        size = approximate_size(command)
+        self._entries.append((command, size))
+        self.size_in_bytes += size
+        while len(self._entries) > 1 and self._over_budget():
+            self.size_in_bytes -= self._entries.popleft()[1]
+
+    def _over_budget(self):
+        return len(self._entries) > self._max_entries or \
+            self.size_in_bytes > self._max_bytes
+
+    def pop(self):
+        command, size = self._entries.pop()
+        self.size_in_bytes -= size
+        return command
+
+
+_HISTORIES = weakref.WeakSet()
+INSTRUMENTATION.gauge('Undo history entries',
+                      lambda: sum(len(h) for h in list(_HISTORIES)))
+INSTRUMENTATION.gauge('Undo history bytes',
+                      lambda: sum(h.size_in_bytes for h in list(_HISTORIES)))
+
+
+def approximate_size(command):
+    """Returns the approximate memory use of `command` in bytes.
+
+    Commands, containers and strings are followed, other objects like
+    controllers are shared with the model and only counted shallowly.
+    """
+    seen = set()
+    size = 0
+    pending = [command]
+    while pending:
+        item = pending.pop()
+        if id(item) in seen:
+            continue
+        seen.add(id(item))
+        size += sys.getsizeof(item)
+        if isinstance(item, (list, tuple, set, frozenset, deque)):
+            pending.extend(item)
+        elif isinstance(item, dict):
+            pending.extend(item.keys())
+            pending.extend(item.values())
+        elif hasattr(item, '__dict__') and hasattr(item, 'modifying'):
+            size += sys.getsizeof(item.__dict__)
+            pending.extend(item.__dict__.values())
+    return size
+
+
 class WithUndoRedoStacks(object):
+    undo_history_entries = 100
+    undo_history_bytes = 8 * 1024 * 1024
 
     @property
     def _undo(self):
         if not hasattr(self, '_undo_stack'):
-            self._undo_stack = []
+            self._undo_stack = self._new_history()
         return self._undo_stack
 
     @property
     def _redo(self):
         if not hasattr(self, '_redo_stack'):
-            self._redo_stack = []
+            self._redo_stack = self._new_history()
         return self._redo_stack
 
+    def _new_history(self):
+        budget = self.undo_history_entries, self.undo_history_bytes
+        project = getattr(self.datafile_controller, '_project', None)
+        if hasattr(project, 'undo_history_budget'):
+            budget = project.undo_history_budget(*budget)
+        return UndoHistory(*budget)
+
     def clear_undo(self):
-        self._undo_stack = []
+        self._undo_stack = self._new_history()
 
     def is_undo_empty(self):
-        return self._undo == []
+        return not self._undo
 
     def pop_from_undo(self):
         return self._undo.pop()
 
     def push_to_undo(self, command):
-        self._undo.append(command)
+        self._undo.push(command)
+
+    def compact_undo(self):
+        """Merges the latest undo entry into the previous one if possible.
+
+        Only entries pushed by consecutive commands are merged, never
+        ones restored by undo or redo.
+        """
+        undo = self._undo
+        if len(undo) > 1 and undo[-2] is getattr(self, '_compactable', None) \
+                and undo[-2].absorbs(undo[-1]):
+            undo.pop()
+        self._compactable = undo[-1] if undo else None
 
     def clear_redo(self):
-        self._redo_stack = []
+        self._redo_stack = self._new_history()
 
     def is_redo_empty(self):
-        return self._redo == []
+        return not self._redo
 
     def pop_from_redo(self):
         return self._redo.pop()
 
     def push_to_redo(self, command):
-        self._redo.append(command)
+        self._redo.push(command)
+
+    def undo_history_size(self):
+        """Returns number of entries and approximate bytes of the history."""
+        return {'undo': len(self._undo), 'redo': len(self._redo),
+                'bytes': self._undo.size_in_bytes + self._redo.size_in_bytes}
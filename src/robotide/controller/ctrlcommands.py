@@ -20,9 +20,11 @@ import re
 
 from robotide.namespace.embeddedargs import EmbeddedArgsHandler
 from robotide.publish.messages import (RideSelectResource, RideFileNameChanged, RideSaving,
-                                       RideSaved, RideSaveAll, RideExcludesChanged)
+                                       RideSaved, RideSaveAll, RideExcludesChanged,
+                                       RideModificationPrevented)
 from robotide.namespace.namespace import _VariableStash
 from robotide.utils import overrides, variablematcher
+from robotide.utils.instrumentation import timed
 from robotide.controller.filecontrollers import ResourceFileController
 from robotide.controller.macrocontrollers import (KeywordNameController, ForLoopStepController,
                                                   TestCaseController)
@@ -184,6 +186,7 @@ class _ReversibleCommand(_Command):
 
     def execute(self, context):
         result = self._execute_without_redo_clear(context)
+        context.compact_undo()
         context.clear_redo()
         return result
 
@@ -196,6 +199,10 @@ class _ReversibleCommand(_Command):
     def _get_undo_command(self):
         raise NotImplementedError(self.__class__.__name__)
 
+    def absorbs(self, newer_undo):
+        """Return True if undoing this also undoes `newer_undo`."""
+        return False
+
 
 class Undo(_Command):
 
@@ -652,9 +659,11 @@ class FindOccurrences(_Command):
         item_info = datafile_controller.keyword_info(self._keyword_name)
         return item_info.source if item_info else None
 
+    @timed('FindOccurrences')
     def _find_occurrences_in(self, items):
-        return (Occurrence(item, self._keyword_name) for item in items
-                if self._contains_item(item))
+        for item in items:
+            if self._contains_item(item):
+                yield Occurrence(item, self._keyword_name)
 
     def _contains_item(self, item):
         self._yield_for_other_threads()
@@ -975,6 +984,11 @@ class ChangeCellValue(_StepsChangingCommand):
     def _get_undo_command(self):
         return self._undo_command
 
+    def absorbs(self, newer_undo):
+        # Restoring the older value of a cell covers later edits of it.
+        return isinstance(newer_undo, ChangeCellValue) and \
+            (newer_undo._row, newer_undo._col) == (self._row, self._col)
+
     def __str__(self):
         return '%s(%s, %s, "%s")' % \
             (self.__class__.__name__, self._row, self._col, self._value)
@@ -985,20 +999,40 @@ class SaveFile(_Command):
     def execute(self, context):
         RideSaving(path=context.filename, datafile=context).publish()
         datafile_controller = context.datafile_controller
-        for macro_controller in chain(
-                datafile_controller.tests, datafile_controller.keywords):
-            macro_controller.execute(Purify())
+        self._purify(datafile_controller)
         datafile_controller.save()
         datafile_controller.unmark_dirty()
         RideSaved(path=context.filename).publish()
 
+    def _purify(self, datafile_controller):
+        for macro_controller in chain(
+                datafile_controller.tests, datafile_controller.keywords):
+            macro_controller.execute(Purify())
 
-class SaveAll(_Command):
+
+class SaveAll(SaveFile):
+    """Saves all dirty files at once.
+
+    Either all files are written or, if saving any of them fails, none.
+    """
 
     def execute(self, context):
-        for datafile_controller in context._get_all_dirty_controllers():
-            if datafile_controller.has_format():
-                datafile_controller.execute(SaveFile())
+        controllers = []
+        for controller in context._get_all_dirty_controllers():
+            if not controller.has_format():
+                continue
+            if controller.is_modifiable():
+                controllers.append(controller)
+            else:
+                RideModificationPrevented(controller=controller).publish()
+        for controller in controllers:
+            RideSaving(path=controller.filename, datafile=controller).publish()
+            self._purify(controller)
+        if controllers:
+            context.save_all(controllers)
+        for controller in controllers:
+            controller.unmark_dirty()
+            RideSaved(path=controller.filename).publish()
         RideSaveAll().publish()
 
 
@@ -16,8 +16,11 @@
 import os
 import shutil
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
 
 from robotide.context import LOG
+from robotide.lib.robot.utils import file_writer
 from robotide.controller.ctrlcommands import NullObserver, SaveFile
 from robotide.publish.messages import RideOpenSuite, RideNewProject, RideFileNameChanged
 
@@ -25,10 +28,12 @@ from .basecontroller import WithNamespace, _BaseController
 from .dataloader import DataLoader
 from .filecontrollers import DataController, ResourceFileControllerFactory
 from .robotdata import NewTestCaseFile, NewTestDataDirectory
+from .tagindex import TagIndex
 from robotide.spec.librarydatabase import DATABASE_FILE
 from robotide.spec.librarymanager import LibraryManager
 from robotide.spec.xmlreaders import SpecInitializer
 from robotide.utils import overrides
+from robotide.utils.instrumentation import timed
 
 
 class Project(_BaseController, WithNamespace):
@@ -45,6 +50,7 @@ class Project(_BaseController, WithNamespace):
         self.external_resources = []
         self._resource_file_controller_factory = ResourceFileControllerFactory(namespace, self)
         self._serializer = Serializer(settings, LOG)
+        self._tag_index = None
 
     def _construct_library_manager(self, library_manager, settings):
         return library_manager or \
@@ -58,6 +64,9 @@ class Project(_BaseController, WithNamespace):
     def close(self):
         self._library_manager.stop()
         self._library_manager = None
+        if self._tag_index:
+            self._tag_index.close()
+            self._tag_index = None
 
     @overrides(WithNamespace)
     def _set_namespace(self, namespace):
@@ -136,6 +145,18 @@ class Project(_BaseController, WithNamespace):
     def is_excluded(self, source):
         return self._settings.excludes.contains(source) if self._settings else False
 
+    def undo_history_budget(self, entries, max_bytes):
+        """Returns entry and byte budgets of undo histories from settings.
+
+        The given defaults are used for budgets missing from the settings.
+        """
+        if not self._settings:
+            return entries, max_bytes
+        megabytes = self._settings.get('undo history megabytes',
+                                       max_bytes / 1024.0 / 1024)
+        return (self._settings.get('undo history entries', entries),
+                int(megabytes * 1024 * 1024))
+
     def _load_initfile(self, path, load_observer):
         if not os.path.splitext(os.path.split(path)[1])[0] == '__init__':
             return None
@@ -224,6 +245,12 @@ class Project(_BaseController, WithNamespace):
             for test in df.tests:
                 yield test
 
+    @property
+    def tag_index(self):
+        if self._tag_index is None:
+            self._tag_index = TagIndex(self)
+        return self._tag_index
+
     def get_files_without_format(self, controller=None):
         if controller:
             controller_list = [controller]
@@ -282,6 +309,9 @@ class Project(_BaseController, WithNamespace):
         assert controller is not None
         self._serializer.serialize_file(controller)
 
+    def save_all(self, controllers):
+        self._serializer.serialize_files(controllers)
+
     def _get_all_dirty_controllers(self):
         return [controller for controller in self.datafiles if controller.dirty]
 
@@ -297,25 +327,55 @@ class Project(_BaseController, WithNamespace):
 
 
 class Serializer(object):
+    _max_workers = 8
 
     def __init__(self, settings, logger):
         self._settings = settings
         self._logger = logger
         self._errors = []
 
+    @timed('Serializer.serialize_file')
     def serialize_file(self, controller):
+        self.serialize_files([controller])
+
+    @timed('Serializer.serialize_files')
+    def serialize_files(self, controllers):
+        """Writes `controllers` to disk as one atomic operation.
+
+        Files are serialized concurrently to temporary files next to the
+        originals. Only if all of them succeed, they replace the originals.
+        """
         try:
-            self._serialize_file(controller)
+            with SaveJournal() as journal:
+                self._write_all(controllers, journal)
+                journal.commit()
         finally:
             self._log_errors()
 
-    def _serialize_file(self, controller):
-        with Backup(controller):
-            try:
-                controller.datafile.save(**self._get_options())
-            except Exception as err:
-                self._cache_error(controller, err)
-                raise
+    def _write_all(self, controllers, journal):
+        if len(controllers) == 1:
+            self._write(controllers[0], journal)
+            return
+        workers = min(self._max_workers, len(controllers))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(self._write, controller, journal)
+                       for controller in controllers]
+        for future in futures:
+            future.result()
+
+    def _write(self, controller, journal):
+        datafile = controller.datafile
+        path = getattr(datafile, 'initfile', None) or datafile.source
+        options = self._get_options()
+        try:
+            if not path:
+                return datafile.save(**options)
+            with file_writer(journal.temporary_file(path),
+                             newline=options['line_separator']) as output:
+                datafile.save(output=output, **options)
+        except Exception as err:
+            self._cache_error(controller, err)
+            raise
 
     def _get_options(self):
         return {'line_separator': self._get_line_separator(),
@@ -346,49 +406,82 @@ class Serializer(object):
             self._errors = []
 
 
-class Backup(object):
+class SaveJournal(object):
+    """Replaces saved files with renames that can be rolled back.
 
-    def __init__(self, file_controller):
-        self._path = file_controller.filename
-        self._file_controller = file_controller
-        self._backup = self._get_backup_name(self._path)
+    New content is written to temporary files in the same directories as
+    the saved files. `commit` renames each original aside and the new file
+    in its place. If any rename fails, all files are restored, and the
+    originals are removed only after every file has been replaced.
+    """
 
-    def _get_backup_name(self, path):
-        if path is None or not os.path.isfile(path):
-            return None
-        self._backup_dir = tempfile.mkdtemp(dir=os.path.dirname(path))
-        return os.path.join(self._backup_dir, os.path.basename(path))
+    def __init__(self):
+        self._pending = []
+        self._lock = Lock()
 
     def __enter__(self):
-        self._make_backup()
-
-    def _make_backup(self):
-        if self._backup:
-            try:
-                self._move(self._path, self._backup)
-            except IOError:
-                self._backup = None
-                self._remove_backup_dir()
-
-    def __exit__(self, *args):
-        if any(args):
-            self._restore_backup()
-        else:
-            self._remove_backup()
-
-    def _remove_backup(self):
-        if self._backup:
-            os.remove(self._backup)
-            self._remove_backup_dir()
-
-    def _restore_backup(self):
-        if self._backup:
-            self._move(self._backup, self._path)
-            self._file_controller.refresh_stat()
-            self._remove_backup_dir()
+        return self
+
+    def __exit__(self, *exc_info):
+        for temporary, _ in self._pending:
+            self._remove(temporary)
+        self._pending = []
+
+    def temporary_file(self, path):
+        directory, name = os.path.split(path)
+        handle, temporary = tempfile.mkstemp(prefix='.%s.' % name,
+                                             suffix='.tmp', dir=directory)
+        os.close(handle)
+        with self._lock:
+            self._pending.append((temporary, path))
+        return temporary
+
+    def commit(self):
+        replaced = []
+        try:
+            for temporary, path in self._pending:
+                replaced.append(self._replace(temporary, path))
+        except OSError:
+            self._rollback(replaced)
+            raise
+        self._pending = []
+        for _, backup in replaced:
+            if backup:
+                self._remove(backup)
+
+    def _replace(self, temporary, path):
+        # The backup is the original itself, so no content is copied.
+        if not os.path.exists(path):
+            os.chmod(temporary, 0o666 & ~self._umask())
+            self._move(temporary, path)
+            return path, None
+        shutil.copymode(path, temporary)
+        backup = temporary + '.orig'
+        self._move(path, backup)
+        try:
+            self._move(temporary, path)
+        except OSError:
+            self._move(backup, path)
+            raise
+        return path, backup
+
+    def _rollback(self, replaced):
+        for path, backup in reversed(replaced):
+            if backup:
+                self._move(backup, path)
+            else:
+                self._remove(path)
+
+    def _umask(self):
+        umask = os.umask(0)
+        os.umask(umask)
+        return umask
 
     def _move(self, from_path, to_path):
-        shutil.move(from_path, to_path)
+        os.replace(from_path, to_path)
 
-    def _remove_backup_dir(self):
-        shutil.rmtree(self._backup_dir)
+    def _remove(self, path):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
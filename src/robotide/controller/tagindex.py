@@ -0,0 +1,206 @@
+#  Copyright 2008-2015 Nokia Networks
+#  Copyright 2016-     Robot Framework Foundation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from robotide.lib.robot.model.tags import (AndTagPattern, NotTagPattern,
+                                           OrTagPattern, TagPattern)
+from robotide.lib.robot.utils import normalize
+from robotide.publish import PUBLISHER
+from robotide.publish.messages import (
+    RideOpenSuite, RideNewProject, RideSuiteAdded, RideDataFileRemoved,
+    RideInitFileRemoved, RideDataFileSet, RideTestCaseAdded,
+    RideTestCaseRemoved, RideItemSettingsChanged)
+
+from .macrocontrollers import TestCaseController
+
+
+class TagIndex(object):
+    """Live index from tags to the tests of a project having them.
+
+    Tags of a test include the Force Tags and Default Tags inherited from
+    its suites. The index is built lazily and kept up to date from the
+    messages published when tests or settings change, so that opening
+    View All Tags or searching with tag patterns does not need to walk
+    all the tests of the project.
+
+    Tags are compared case and space insensitively.
+    """
+
+    def __init__(self, project):
+        self._project = project
+        self._tests = {}
+        self._tags = {}
+        self._stale = True
+        self._subscribe()
+
+    def _subscribe(self):
+        for topic in (RideOpenSuite, RideNewProject, RideSuiteAdded,
+                      RideDataFileRemoved, RideInitFileRemoved,
+                      RideDataFileSet):
+            PUBLISHER.subscribe(self._invalidate, topic, key=self)
+        PUBLISHER.subscribe(self._test_added, RideTestCaseAdded, key=self)
+        PUBLISHER.subscribe(self._test_removed, RideTestCaseRemoved, key=self)
+        PUBLISHER.subscribe(self._settings_changed, RideItemSettingsChanged,
+                            key=self)
+
+    def close(self):
+        PUBLISHER.unsubscribe_all(key=self)
+
+    def _invalidate(self, message=None):
+        self.invalidate()
+
+    def _test_added(self, message):
+        self.update_test(message.item)
+
+    def _test_removed(self, message):
+        self.remove_test(message.item)
+
+    def _settings_changed(self, message):
+        item = message.item
+        if isinstance(item, TestCaseController):
+            self.update_test(item)
+        elif hasattr(item, 'iter_datafiles'):
+            # Force and default tags of a suite affect all its tests.
+            self.update_suite(item)
+
+    def invalidate(self):
+        self._stale = True
+
+    def update_test(self, test):
+        if self._stale:
+            return
+        self._remove(test)
+        self._add(test)
+
+    def update_suite(self, suite):
+        for datafile in suite.iter_datafiles():
+            for test in datafile.tests:
+                self.update_test(test)
+
+    def remove_test(self, test):
+        if not self._stale:
+            self._remove(test)
+
+    @property
+    def tests(self):
+        """All tests of the project, tagged or not."""
+        self._ensure_built()
+        return list(self._tests)
+
+    def __len__(self):
+        """Number of unique tags."""
+        self._ensure_built()
+        return len(self._tags)
+
+    def __contains__(self, tag):
+        self._ensure_built()
+        return self._normalize(tag) in self._tags
+
+    def items(self):
+        """Returns (tag name, tests) pairs of all unique tags."""
+        self._ensure_built()
+        return [(self._name_of(tests), list(tests))
+                for tests in self._tags.values()]
+
+    def tests_with(self, tag):
+        self._ensure_built()
+        return list(self._tags.get(self._normalize(tag), ()))
+
+    def count(self, tag):
+        self._ensure_built()
+        return len(self._tags.get(self._normalize(tag), ()))
+
+    def tag_controllers(self, tag):
+        """Returns the `Tag` objects with the given name in all tests."""
+        self._ensure_built()
+        tests = self._tags.get(self._normalize(tag), {})
+        return [t for tags in tests.values() for t in tags]
+
+    def match(self, includes, excludes):
+        """Returns tests matching `includes` but not `excludes` tag patterns.
+
+        Patterns have the same semantics as Robot Framework's `--include`
+        and `--exclude` options, including AND, OR and NOT. Patterns are
+        matched against the unique tag names and combined with set
+        operations, so matching does not depend on the number of tests.
+        An empty `includes` matches all tests.
+        """
+        self._ensure_built()
+        if includes:
+            tests = self._union(self._evaluate(TagPattern(p))
+                                for p in includes)
+        else:
+            tests = set(self._tests)
+        if excludes:
+            tests -= self._union(self._evaluate(TagPattern(p))
+                                 for p in excludes)
+        return tests
+
+    def _evaluate(self, pattern):
+        if isinstance(pattern, AndTagPattern):
+            return set.intersection(*[self._evaluate(p) for p in pattern])
+        if isinstance(pattern, OrTagPattern):
+            return self._union(self._evaluate(p) for p in pattern)
+        if isinstance(pattern, NotTagPattern):
+            first, rest = pattern._first, pattern._rest
+            tests = self._evaluate(first) if first else set(self._tests)
+            return tests - self._evaluate(rest)
+        return self._single(pattern)
+
+    def _single(self, pattern):
+        # Like robot.model.Tags, never match tags removed by Robot Framework.
+        return self._union(tests for key, tests in self._tags.items()
+                           if key != 'none' and
+                           pattern.match([self._name_of(tests)]))
+
+    def _union(self, sets):
+        result = set()
+        for tests in sets:
+            result.update(tests)
+        return result
+
+    def _ensure_built(self):
+        if not self._stale:
+            return
+        self._tests.clear()
+        self._tags.clear()
+        for test in self._project.all_testcases():
+            self._add(test)
+        self._stale = False
+
+    def _add(self, test):
+        tags = self._tests[test] = []
+        for tag in test.tags:
+            if tag.is_empty() or not str(tag).strip():
+                continue
+            tags.append(tag)
+            tests = self._tags.setdefault(self._normalize(str(tag)), {})
+            tests.setdefault(test, []).append(tag)
+
+    def _remove(self, test):
+        for tag in self._tests.pop(test, ()):
+            key = self._normalize(str(tag))
+            tests = self._tags.get(key)
+            if tests is not None:
+                tests.pop(test, None)
+                if not tests:
+                    del self._tags[key]
+
+    def _name_of(self, tests):
+        for tags in tests.values():
+            return str(tags[0])
+
+    @staticmethod
+    def _normalize(tag):
+        return normalize(tag)
@@ -15,6 +15,8 @@
 
 import wx
 import os
+import weakref
+from threading import Lock
 from robotide.action.actioninfo import ActionInfoCollection, ActionInfo
 from robotide.context import IS_WINDOWS, ctrl_or_cmd, bind_keys_to_evt_menu
 from robotide.controller.ctrlcommands import ChangeTag
@@ -40,6 +42,7 @@ class TreeController(object):
         self.settings = settings
         self._history = history or _History()
         self._test_selection = test_selection
+        self._nodes = _NodeMap()
 
     def register_tree_actions(self):
         actions = ActionInfoCollection(tree_actions, self, self._tree)
@@ -82,11 +85,16 @@ class TreeController(object):
         if not text.startswith('*'):
              self._tree.SetItemText(node, '*' + text)
 
+    def register_node(self, node, controller):
+        self._nodes.add(controller, node)
+
+    def unregister_node(self, node):
+        handler = self._tree.GetItemPyData(node)
+        if handler:
+            self._nodes.remove(handler.controller, node)
+
     def find_node_by_controller(self, controller):
-        def match_handler(n):
-            handler = self.get_handler(n)
-            return handler and controller is handler.controller
-        return self._find_node_with_predicate(self._tree._root, match_handler)
+        return self._nodes.get(controller)
 
     def find_node_with_label(self, node, label):
         matcher = lambda n: utils.eq(self._tree.GetItemText(n), label)
@@ -143,6 +151,78 @@ class TreeController(object):
         return handler
 
 
+class _NodeMap(object):
+    """Maps controllers to their tree nodes by identity.
+
+    Controllers are referenced weakly so that the map never keeps removed
+    controllers alive, and many of them are not hashable.
+    """
+
+    def __init__(self):
+        self._nodes = {}
+
+    def add(self, controller, node):
+        key = id(controller)
+        ref = weakref.ref(controller, lambda ref: self._discard(key, ref))
+        self._nodes[key] = (ref, node)
+
+    def get(self, controller):
+        ref, node = self._nodes.get(id(controller), (None, None))
+        if ref is not None and ref() is controller:
+            return node
+        return None
+
+    def remove(self, controller, node):
+        if self.get(controller) is node:
+            del self._nodes[id(controller)]
+
+    def _discard(self, key, ref):
+        if key in self._nodes and self._nodes[key][0] is ref:
+            del self._nodes[key]
+
+    def __len__(self):
+        return len(self._nodes)
+
+
+class TestResultQueue(object):
+    """Queues tests whose execution state has changed.
+
+    State change messages may arrive from other threads and much faster
+    than the tree can be repainted. The tests are collected here and
+    `flush` is called with them at most once per `interval` milliseconds,
+    each test only once and in the order of their latest change.
+    """
+
+    def __init__(self, flush, interval=33, schedule=None):
+        self._flush = flush
+        self._interval = interval
+        self._schedule = schedule or self._call_later_in_ui_thread
+        self._tests = {}
+        self._lock = Lock()
+
+    def _call_later_in_ui_thread(self, delay, callback):
+        wx.CallAfter(wx.CallLater, delay, callback)
+
+    def add(self, test):
+        with self._lock:
+            scheduled = bool(self._tests)
+            self._tests.pop(id(test), None)
+            self._tests[id(test)] = test
+        if not scheduled:
+            self._schedule(self._interval, self._flush_queued)
+
+    def clear(self):
+        with self._lock:
+            self._tests.clear()
+
+    def _flush_queued(self):
+        with self._lock:
+            tests = list(self._tests.values())
+            self._tests.clear()
+        if tests:
+            self._flush(tests)
+
+
 class _History(object):
 
     def __init__(self):
@@ -12,7 +12,10 @@
 #  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
+import time
+
 from robotide.controller.cellinfo import CellType
+from robotide.utils.instrumentation import INSTRUMENTATION
 import wx
 # this import fails in HUDSON
 # from wxPython._gdi import wxFONTWEIGHT_BOLD, wxFONTWEIGHT_NORMAL
@@ -29,6 +32,7 @@ class Colorizer(object):
         self._colors = ColorizationSettings(grid.settings)
         self._current_task_id = 0
         self._timer = None
+        self._pass_started = None
 
     def close(self):
         self._grid = None
@@ -43,8 +47,12 @@ class Colorizer(object):
     def _coloring_task(self, task_index, selection_content, row=0, col=0):
         if task_index != self._current_task_id or self._grid is None:
             return
+        if row == 0 and col == 0:
+            self._pass_started = time.perf_counter()
         if row >= self._grid.NumberRows:
             self._grid.ForceRefresh()
+            INSTRUMENTATION.record('Colorizer pass',
+                                   time.perf_counter() - self._pass_started)
         elif col < self._grid.NumberCols:
             self._colorize_cell(row, col, selection_content)
             wx.CallAfter(self._coloring_task, task_index, selection_content, row, col+1)
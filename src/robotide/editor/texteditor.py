@@ -30,18 +30,10 @@ from robotide.pluginapi import (Plugin, RideSaving, TreeAwarePluginMixin,
                                 RideDataChanged, RideOpenSuite,
                                 RideDataChangedToDirty)
 from robotide.widgets import TextField, Label, HtmlDialog
-from robotide.preferences.editors import ReadFonts
+from robotide.preferences.editors import ReadFonts, load_robotframeworklexer
 from wx.adv import HyperlinkCtrl, EVT_HYPERLINK
 from .contentassist import ContentAssistTextEditor
 
-try:  # import installed version first
-    import robotframeworklexer
-except ImportError:
-    try:  # then import local version
-        from . import robotframeworklexer
-    except ImportError:  # Pygments is not installed
-        robotframeworklexer = None
-
 
 class TextEditorPlugin(Plugin, TreeAwarePluginMixin):
     title = 'Text Edit'
@@ -915,6 +907,7 @@ class RobotStylizer(object):
         self.settings = settings
         self._readonly = readonly
         self._ensure_default_font_is_valid()
+        robotframeworklexer = load_robotframeworklexer()
         if robotframeworklexer:
             self.lexer = robotframeworklexer.RobotFrameworkLexer()
         else:
@@ -956,6 +949,7 @@ class RobotStylizer(object):
                 bkg = (min(255, bkg[0]+180), min(255, bkg[1]+180),
                        min(255, bkg[2]+180))
             background = '#%02X%02X%02X' % bkg
+        robotframeworklexer = load_robotframeworklexer()
         if robotframeworklexer:
             styles = {
                 robotframeworklexer.ARGUMENT: {
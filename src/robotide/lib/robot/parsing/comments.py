@@ -45,6 +45,7 @@ class Comments(object):
 
 
 class Comment(object):
+    __slots__ = ('_comment',)
 
     def __init__(self, comment_data):
         if is_string(comment_data):
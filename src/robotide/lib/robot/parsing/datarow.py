@@ -26,21 +26,17 @@ class DataRow(object):
         self.cells, self.comments = self._parse(cells)
 
     def _parse(self, row):
-        data = []
+        data = [' '.join(cell.split()) for cell in row]
         comments = []
-        for cell in row:
-            cell = self._collapse_whitespace(cell)
-            if cell and cell[0] == '#' or comments:
-                comments.append(cell)
-            else:
-                data.append(cell)
+        for cell in data:
+            if cell[:1] == '#':
+                index = data.index(cell)
+                data, comments = data[:index], data[index:]
+                break
         if self._row_continuation_marker in data and self.source:
             self._deprecate_escaped_cells_before_continuation(data)
         return self._purge_empty_cells(data), self._purge_empty_cells(comments)
 
-    def _collapse_whitespace(self, cell):
-        return ' '.join(cell.split())
-
     def _deprecate_escaped_cells_before_continuation(self, data):
         index = data.index(self._row_continuation_marker)
         if any(cell == '\\' for cell in data[:index]):
@@ -50,6 +46,8 @@ class DataRow(object):
                         "Framework 3.2." % self.source)
 
     def _purge_empty_cells(self, row):
+        if row and row[-1] and '\\' not in row:
+            return row
         while row and not row[-1]:
             row.pop()
         # Cells with only a single backslash are considered empty
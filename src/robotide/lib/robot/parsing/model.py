@@ -27,7 +27,7 @@ from .comments import Comment
 from .populators import FromFilePopulator, FromDirectoryPopulator, NoTestsFound
 from .settings import (Documentation, Fixture, Timeout, Tags, Metadata,
                        Library, Resource, Variables, Arguments, Return,
-                       Template, MetadataList, ImportList)
+                       Template, MetadataList, ImportList, intern_cells)
 
 
 def TestData(parent=None, source=None, include_suites=None,
@@ -329,6 +329,7 @@ class _Table(object):
 
 
 class _WithSettings(object):
+    __slots__ = ()
     _setters = {}
     _aliases = {}
 
@@ -541,6 +542,7 @@ class KeywordTable(_Table):
 
 @py2to3
 class Variable(object):
+    __slots__ = ('parent', 'name', 'value', 'comment')
 
     def __init__(self, parent, name, value, comment=None):
         self.parent = parent
@@ -575,6 +577,7 @@ class Variable(object):
 
 
 class _WithSteps(object):
+    __slots__ = ()
 
     def add_step(self, content, comment=None):
         self.steps.append(Step(content, comment))
@@ -587,17 +590,44 @@ class _WithSteps(object):
         return new
 
 
+class _LazySetting(object):
+    """Creates a setting of a test or keyword on first access.
+
+    Most tests and keywords use only a few of their settings, so empty
+    settings are not allocated until something asks for them.
+    """
+
+    def __init__(self, attribute, setting_class, setting_name):
+        self._attribute = attribute
+        self._setting_class = setting_class
+        self._setting_name = setting_name
+
+    def __get__(self, owner, owner_type=None):
+        if owner is None:
+            return self
+        setting = getattr(owner, self._attribute, None)
+        if setting is None:
+            setting = self._setting_class(self._setting_name, owner)
+            setattr(owner, self._attribute, setting)
+        return setting
+
+    def __set__(self, owner, setting):
+        setattr(owner, self._attribute, setting)
+
+
 class TestCase(_WithSteps, _WithSettings):
+    __slots__ = ('parent', 'name', 'steps', '_doc', '_template', '_tags',
+                 '_setup', '_teardown', '_timeout', '__weakref__')
+    doc = _LazySetting('_doc', Documentation, '[Documentation]')
+    template = _LazySetting('_template', Template, '[Template]')
+    tags = _LazySetting('_tags', Tags, '[Tags]')
+    setup = _LazySetting('_setup', Fixture, '[Setup]')
+    teardown = _LazySetting('_teardown', Fixture, '[Teardown]')
+    timeout = _LazySetting('_timeout', Timeout, '[Timeout]')
 
     def __init__(self, parent, name):
         self.parent = parent
         self.name = name
-        self.doc = Documentation('[Documentation]', self)
-        self.template = Template('[Template]', self)
-        self.tags = Tags('[Tags]', self)
-        self.setup = Fixture('[Setup]', self)
-        self.teardown = Fixture('[Teardown]', self)
-        self.timeout = Timeout('[Timeout]', self)
         self.steps = []
         if name == '...':
             self.report_invalid_syntax(
@@ -665,16 +695,13 @@ class TestCase(_WithSteps, _WithSettings):
 
 
 class UserKeyword(TestCase):
+    __slots__ = ('_args', '_return')
+    args = _LazySetting('_args', Arguments, '[Arguments]')
+    return_ = _LazySetting('_return', Return, '[Return]')
 
     def __init__(self, parent, name):
         self.parent = parent
         self.name = name
-        self.doc = Documentation('[Documentation]', self)
-        self.args = Arguments('[Arguments]', self)
-        self.return_ = Return('[Return]', self)
-        self.timeout = Timeout('[Timeout]', self)
-        self.teardown = Fixture('[Teardown]', self)
-        self.tags = Tags('[Tags]', self)
         self.steps = []
         if name == '...':
             self.report_invalid_syntax(
@@ -716,6 +743,8 @@ class ForLoop(_WithSteps):
     :ivar str comment: A comment, or None.
     :ivar list steps: A list of steps in the loop.
     """
+    __slots__ = ('parent', 'flavor', 'vars', 'items', 'comment', 'steps',
+                 '__weakref__')
     flavors = {'IN', 'IN RANGE', 'IN ZIP', 'IN ENUMERATE'}
     normalized_flavors = NormalizedDict((f, f) for f in flavors)
 
@@ -763,8 +792,10 @@ class ForLoop(_WithSteps):
 
 
 class Step(object):
+    __slots__ = ('assign', 'name', 'args', 'comment', '__weakref__')
 
     def __init__(self, content, comment=None):
+        intern_cells(content)
         self.assign = self._get_assign(content)
         # print("DEBUG RFLib init Step: content %s" % content[:])
         self.name = content.pop(0) if content else None
@@ -27,13 +27,14 @@ class RobotReader(object):
     _pipe_splitter = re.compile(u'[ \t\xa0]+\|(?=[ \t\xa0]+)')
     _pipe_starts = ('|', '| ', '|\t', u'|\xa0')
     _pipe_ends = (' |', '\t|', u'\xa0|')
+    _spaces_splitter = re.compile(u'  +')
+    _unusual_whitespace = re.compile(u'[^\\S \\t]')
 
     def read(self, file, populator, path=None):
         path = path or getattr(file, 'name', '<file-like object>')
         process = False
         for lineno, line in enumerate(Utf8Reader(file).readlines(), start=1):
-            cells = self.split_row(line.rstrip())
-            cells = list(self._check_deprecations(cells, path, lineno))
+            cells = self.tokenize(line.rstrip(), path, lineno)
             if cells and cells[0].strip().startswith('*') and \
                     populator.start_table([c.replace('*', '').strip()
                                            for c in cells]):
@@ -50,6 +51,29 @@ class RobotReader(object):
                     for cell in cls._pipe_splitter.split(row)]
         return cls._space_splitter.split(row)
 
+    def tokenize(self, row, path='<file-like object>', line_number=0):
+        """Splits `row` to cells with whitespace normalized.
+
+        Rows with only spaces and tabs as whitespace are split with a single
+        scan and not normalized cell by cell, because normalizing could not
+        change their cells.
+        """
+        if not (JYTHON or self._unusual_whitespace.search(row)):
+            if row[:2] in self._pipe_starts:
+                cells = self.split_row(row)
+                # Pipe separated cells are stripped but can contain tabs
+                # and consecutive spaces.
+                if '\t' not in row and '  ' not in ''.join(cells):
+                    return cells
+            # Tabs are always part of separators in space separated rows
+            # and only the first cell can start with a space.
+            elif row[:1] != ' ' or row[1:2] == ' ':
+                if '\t' in row:
+                    return self._space_splitter.split(row)
+                return self._spaces_splitter.split(row)
+        cells = self.split_row(row)
+        return list(self._check_deprecations(cells, path, line_number))
+
     def _check_deprecations(self, cells, path, line_number):
         for original in cells:
             normalized = self._normalize_whitespace(original)
@@ -13,13 +13,28 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+from sys import intern
+
 from robotide.lib.robot.utils import is_string, py2to3, unicode
 
 from .comments import Comment
 
 
+def intern_cells(cells):
+    """Interns string cells in place and returns them.
+
+    Keyword names and many arguments are repeated throughout test data,
+    so sharing one string object per distinct value saves memory.
+    """
+    for index, cell in enumerate(cells):
+        if is_string(cell):
+            cells[index] = intern(cell)
+    return cells
+
+
 @py2to3
 class Setting(object):
+    __slots__ = ('setting_name', 'parent', 'value', 'comment', '_populated')
 
     def __init__(self, setting_name, parent=None, comment=None):
         self.setting_name = setting_name
@@ -113,6 +128,7 @@ class StringValueJoiner(object):
 
 
 class Documentation(Setting):
+    __slots__ = ()
 
     def _set_initial_value(self):
         self.value = ''
@@ -128,6 +144,7 @@ class Documentation(Setting):
 
 
 class Template(Setting):
+    __slots__ = ()
 
     def _set_initial_value(self):
         self.value = None
@@ -149,6 +166,7 @@ class Template(Setting):
 
 
 class Fixture(Setting):
+    __slots__ = ('name', 'args', 'assign')
 
     # `keyword`, `is_comment` and `assign` make the API compatible with Step.
 
@@ -166,9 +184,9 @@ class Fixture(Setting):
 
     def _populate(self, value):
         if not self.name:
-            self.name = value[0] if value else ''
+            self.name = intern_cells(value[:1])[0] if value else ''
             value = value[1:]
-        self.args.extend(value)
+        self.args.extend(intern_cells(list(value)))
 
     def is_set(self):
         return self.name is not None
@@ -186,6 +204,7 @@ class Fixture(Setting):
 
 
 class Timeout(Setting):
+    __slots__ = ('message',)
 
     def _set_initial_value(self):
         self.value = None
@@ -216,12 +235,13 @@ class Timeout(Setting):
 
 
 class Tags(Setting):
+    __slots__ = ()
 
     def _set_initial_value(self):
         self.value = None
 
     def _populate(self, value):
-        self.value = (self.value or []) + value
+        self.value = (self.value or []) + intern_cells(list(value))
 
     def is_set(self):
         return self.value is not None
@@ -235,14 +255,15 @@ class Tags(Setting):
 
 
 class Arguments(Setting):
-    pass
+    __slots__ = ()
 
 
 class Return(Setting):
-    pass
+    __slots__ = ()
 
 
 class Metadata(Setting):
+    __slots__ = ('name',)
     setting_name = 'Metadata'
 
     def __init__(self, parent, name, value, comment=None, joined=False):
@@ -263,6 +284,7 @@ class Metadata(Setting):
 
 
 class _Import(Setting):
+    __slots__ = ('name', 'args', 'alias')
 
     def __init__(self, parent, name, args=None, alias=None, comment=None):
         self.parent = parent
@@ -294,6 +316,7 @@ class _Import(Setting):
 
 
 class Library(_Import):
+    __slots__ = ()
 
     def __init__(self, parent, name, args=None, alias=None, comment=None):
         if args and not alias:
@@ -313,6 +336,7 @@ class Library(_Import):
 
 
 class Resource(_Import):
+    __slots__ = ()
 
     def __init__(self, parent, name, invalid_args=None, comment=None):
         if invalid_args:
@@ -321,6 +345,7 @@ class Resource(_Import):
 
 
 class Variables(_Import):
+    __slots__ = ()
 
     def __init__(self, parent, name, args=None, comment=None):
         _Import.__init__(self, parent, name, args, comment=comment)
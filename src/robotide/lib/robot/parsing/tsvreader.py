@@ -26,6 +26,12 @@ class TsvReader(RobotReader):
     def split_row(cls, row):
         return [cls._strip_whitespace(cell) for cell in row.split('\t')]
 
+    def tokenize(self, row, path='<file-like object>', line_number=0):
+        # The single scan of RobotReader splits by spaces, so every TSV row
+        # is split by tabs and checked for deprecated syntax.
+        cells = self.split_row(row)
+        return list(self._check_deprecations(cells, path, line_number))
+
     def _check_deprecations(self, cells, path, line_number):
         cells = RobotReader._check_deprecations(self, cells, path, line_number)
         cells = [self._deprecate_quoting(c, path, line_number) for c in cells]
@@ -40,12 +40,16 @@ class FirstColumnAligner(_Aligner):
 
 class ColumnAligner(_Aligner):
 
-    def __init__(self, first_column_width, table):
-        _Aligner.__init__(self, self._count_widths(first_column_width, table))
+    def __init__(self, first_column_width, table, rows=None):
+        """Widths are counted from `rows` if they are already extracted."""
+        _Aligner.__init__(self, self._count_widths(first_column_width, table,
+                                                   rows))
 
-    def _count_widths(self, first_column_width, table):
+    def _count_widths(self, first_column_width, table, rows=None):
         result = [first_column_width] + [len(h) for h in table.header[1:]]
-        for row in DataExtractor().rows_from_table(table):
+        if rows is None:
+            rows = DataExtractor().rows_from_table(table)
+        for row in rows:
             for index, col in enumerate(row[1:]):
                 index += 1
                 if len(result) <= index:
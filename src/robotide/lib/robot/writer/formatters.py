@@ -28,6 +28,24 @@ class _DataFileFormatter(object):
         self._splitter = RowSplitter(column_count, self._split_multiline_doc)
         self._column_count = column_count
         self._extractor = DataExtractor(self._want_names_on_first_content_row)
+        self._table = None
+        self._table_cache = {}
+
+    def _cached(self, table, factory):
+        """Returns `factory(table)` computed once per table.
+
+        Tables are written one at a time, so values are kept only for the
+        latest table.
+        """
+        if table is not self._table:
+            self._table = table
+            self._table_cache = {}
+        if factory not in self._table_cache:
+            self._table_cache[factory] = factory(table)
+        return self._table_cache[factory]
+
+    def _rows(self, table):
+        return list(self._extractor.rows_from_table(table))
 
     def _want_names_on_first_content_row(self, table, name):
         return True
@@ -40,7 +58,7 @@ class _DataFileFormatter(object):
         return self._format_header(header, table)
 
     def format_table(self, table):
-        rows = self._extractor.rows_from_table(table)
+        rows = self._cached(table, self._rows)
         if self._should_split_rows(table):
             rows = self._split_rows(rows, table)
         return (self._format_row(r, table) for r in rows)
@@ -108,9 +126,14 @@ class TxtFormatter(_DataFileFormatter):
         if table and table.type in ['setting', 'variable']:
             return FirstColumnAligner(self._setting_and_variable_name_width)
         if self._should_align_columns(table):
-            return ColumnAligner(self._test_or_keyword_name_width, table)
+            return self._cached(table, self._column_aligner)
         return NullAligner()
 
+    def _column_aligner(self, table):
+        # Widths are counted from the same rows that are written.
+        return ColumnAligner(self._test_or_keyword_name_width, table,
+                             self._cached(table, self._rows))
+
     def _format_header(self, header, table):
         header = ['*** %s ***' % header[0]] + header[1:]
         aligner = self._aligner_for(table)
@@ -71,7 +71,8 @@ class HtmlFormatter(_DataFileFormatter):
         if table is None or len(table.header) == 1 \
                 or not self._is_indented_table(table):
             return self._column_count
-        return max(self._max_column_count(table), len(table.header))
+        return max(self._cached(table, self._max_column_count),
+                   len(table.header))
 
     def _max_column_count(self, table):
         count = 0
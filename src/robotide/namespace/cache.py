@@ -14,9 +14,11 @@
 #  limitations under the License.
 
 import os
+import sys
 import time
-from robotide.robotapi import normpath
+from robotide.robotapi import DataError, normpath, VariableFileSetter
 from robotide.spec.iteminfo import BlockKeywordInfo
+from robotide.utils.instrumentation import INSTRUMENTATION
 
 
 class LibraryCache(object):
@@ -73,9 +75,15 @@ class LibraryCache(object):
     def get_library_keywords(self, name, args=None, alias=None):
         args_with_alias = self._alias_to_args(alias, args)
         key = self._key(name, args_with_alias)
-        if not key in self._library_keywords:
-            self._library_keywords[key] = [k.with_alias(alias) for k in
-                                           self._get_library(name, args)]
+        if key in self._library_keywords:
+            INSTRUMENTATION.hit('LibraryCache')
+        else:
+            INSTRUMENTATION.miss('LibraryCache')
+            # Imports using WITH NAME share the keywords of the plain import.
+            keywords = self.get_library_keywords(name, args) if alias \
+                else self._get_library(name, args)
+            self._library_keywords[key] = [k.with_alias(alias)
+                                           for k in keywords]
 
         return self._library_keywords[key]
 
@@ -117,6 +125,63 @@ class LibraryCache(object):
         return parts[0], parts[1:]
 
 
+class VariableFileCache(object):
+    """Caches imported variable files by path, arguments and fingerprint.
+
+    The fingerprint is the modification time and size of the file, so
+    a changed file is imported again. Failed imports are cached too, so
+    a broken variable file is not executed on every namespace walk.
+    """
+
+    def __init__(self, importer=None):
+        self._importer = importer or VariableFileSetter(None)._import_if_needed
+        self._cache = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, path, args=None):
+        key = (normpath(path), tuple(args or ()))
+        fingerprint = self._fingerprint(path)
+        cached = self._cache.get(key)
+        if cached and fingerprint and cached[0] == fingerprint:
+            self.hits += 1
+            INSTRUMENTATION.hit('VariableFileCache')
+        else:
+            self.misses += 1
+            INSTRUMENTATION.miss('VariableFileCache')
+            if cached:
+                self._forget_module(key[0])
+            cached = self._cache[key] = (fingerprint,
+                                         self._import(path, args))
+        variables, error = cached[1]
+        if error:
+            # A new exception every time, so that tracebacks of earlier
+            # lookups are not chained to the cached one.
+            raise DataError(error)
+        return variables
+
+    def _fingerprint(self, path):
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return stat.st_mtime, stat.st_size
+
+    def _import(self, path, args):
+        try:
+            return self._importer(path, list(args or ())), None
+        except Exception as error:
+            return None, str(error)
+
+    def _forget_module(self, path):
+        # Python variable files are imported as modules, and a changed file
+        # would otherwise be served from sys.modules.
+        for name, module in list(sys.modules.items()):
+            source = getattr(module, '__file__', None)
+            if source and normpath(source) == path:
+                del sys.modules[name]
+
+
 class ExpiringCache(object):
 
     def __init__(self, timeout=0.5):
@@ -30,10 +30,11 @@ elif sys.version_info[0] == 3:
 from robotide import robotapi, utils
 from robotide.publish import PUBLISHER, RideSettingsChanged, RideLogMessage
 from robotide.robotapi import VariableFileSetter
+from robotide.utils.instrumentation import timed
 from robotide.spec.iteminfo import TestCaseUserKeywordInfo,\
     ResourceUserKeywordInfo, VariableInfo, _UserKeywordInfo, ArgumentInfo
 
-from .cache import LibraryCache, ExpiringCache
+from .cache import LibraryCache, ExpiringCache, VariableFileCache
 from .resourcefactory import ResourceFactory
 from .embeddedargs import EmbeddedArgsHandler
 
@@ -115,6 +116,7 @@ class Namespace(object):
     def _get_default_keywords(self):
         return self._lib_cache.get_default_keywords()
 
+    @timed('Namespace.get_suggestions_for')
     def get_suggestions_for(self, controller, start):
         datafile = controller.datafile
         ctx = self._context_factory.ctx_for_controller(controller)
@@ -205,6 +207,7 @@ class Namespace(object):
         return self._retriever.is_variables_import_ok(
             datafile, imp, self._context_factory.ctx_for_datafile(datafile))
 
+    @timed('Namespace.find_keyword')
     def find_keyword(self, datafile, kw_name):
         if not kw_name:
             return None
@@ -355,11 +358,14 @@ class _VariableStash(object):
             return []
         return {}
 
-    def set_from_file(self, varfile_path, args):
+    def set_from_file(self, varfile_path, args, cache=None):
         #  print("DEBUG: enter set_from_file %s\n" % (varfile_path))
         try:
-            vars_from_file = VariableFileSetter(None)._import_if_needed(
-                varfile_path, args)
+            if cache:
+                vars_from_file = cache.get(varfile_path, args)
+            else:
+                vars_from_file = VariableFileSetter(None)._import_if_needed(
+                    varfile_path, args)
         except Exception as e: # robotapi.DataError
             #  print("DEBUG: leave with error set_from_file %s\n" % str(e))
             raise  # return # vars_from_file = {}   # DEBUG
@@ -390,6 +396,7 @@ class DatafileRetriever(object):
         self._lib_cache = lib_cache
         self._resource_factory = resource_factory
         self.keyword_cache = ExpiringCache()
+        self.variable_file_cache = VariableFileCache()
         self._default_kws = None
 
     def get_all_cached_library_names(self):
@@ -412,6 +419,7 @@ class DatafileRetriever(object):
             kws.update(self.get_keywords_from(df, RetrieverContext()))
         return kws
 
+    @timed('DatafileRetriever.get_keywords_from')
     def get_keywords_from(self, datafile, ctx):
         self._get_vars_recursive(datafile, ctx)
         ctx.allow_going_through_resources_again()
@@ -494,14 +502,14 @@ class DatafileRetriever(object):
         for imp in self._collect_import_of_type(datafile, robotapi.Variables):
             self._import_vars(ctx, datafile, imp)
 
-    @staticmethod
-    def _import_vars(ctx, datafile, imp):
+    def _import_vars(self, ctx, datafile, imp):
         varfile_path = os.path.join(datafile.directory,
                                     ctx.replace_variables(imp.name))
         args = [ctx.replace_variables(a) for a in imp.args]
         # print("DEBUG: Namespace _import_vars: %s args %s\n" % (varfile_path, args))
         try:
-            ctx.vars.set_from_file(varfile_path, args)
+            ctx.vars.set_from_file(varfile_path, args,
+                                   self.variable_file_cache)
             return True
         except Exception as e:  # robotapi.DataError as e:
             # print("DEBUG: Namespace Error at import_vars: %s\n" % str(e))
@@ -570,6 +578,7 @@ class _Keywords(object):
     def __init__(self, keywords):
         self.keywords = robotapi.NormalizedDict(ignore=['_'])
         self.embedded_keywords = {}
+        self._embedded_matcher = None
         self._add_keywords(keywords)
 
     def _add_keywords(self, keywords):
@@ -591,6 +600,7 @@ class _Keywords(object):
         try:
             handler = EmbeddedArgsHandler(kw)
             self.embedded_keywords[handler.name_regexp] = kw
+            self._embedded_matcher = None
         except Exception:
             pass
 
@@ -600,11 +610,73 @@ class _Keywords(object):
         bdd_name = self._get_bdd_name(kw_name)
         if bdd_name and bdd_name in self.keywords:
             return self.keywords[bdd_name]
-        for regexp in self.embedded_keywords:
-            if regexp.match(kw_name) or (bdd_name and regexp.match(bdd_name)):
-                return self.embedded_keywords[regexp]
-        return None
+        if not self.embedded_keywords:
+            return None
+        if self._embedded_matcher is None:
+            self._embedded_matcher = _EmbeddedKeywordMatcher(
+                self.embedded_keywords)
+        return self._embedded_matcher.match(kw_name, bdd_name)
 
     def _get_bdd_name(self, kw_name):
         match = self.regexp.match(kw_name)
         return match.group(2) if match else None
+
+
+class _EmbeddedKeywordMatcher(object):
+    """Finds the first embedded argument keyword whose regexp matches a name.
+
+    Keywords are indexed by the words of their name preceding the first
+    embedded argument, so a lookup tries only the regexps of keywords whose
+    leading words the name starts with and of those starting with an
+    argument.
+    """
+
+    def __init__(self, embedded_keywords):
+        self._all = []
+        self._by_leading_words = {}
+        self._any_leading_words = []
+        for index, (regexp, kw) in enumerate(embedded_keywords.items()):
+            entry = (index, regexp, kw)
+            self._all.append(entry)
+            words = self._leading_words(kw.name)
+            if words is None:
+                self._any_leading_words.append(entry)
+            else:
+                self._by_leading_words.setdefault(words, []).append(entry)
+
+    def _leading_words(self, name):
+        prefix = name.split('${', 1)[0]
+        end = prefix.rfind(' ')
+        if end == -1 or '\\' in prefix or not self._is_ascii(prefix):
+            return None
+        return prefix[:end].lower()
+
+    def _is_ascii(self, string):
+        # Case-insensitive regexps match some non-ASCII characters to ASCII
+        # ones that str.lower does not map them to.
+        return all(ord(char) < 128 for char in string)
+
+    def match(self, kw_name, bdd_name=None):
+        names = [name for name in (kw_name, bdd_name) if name]
+        for _, regexp, kw in self._candidates(names):
+            if any(regexp.match(name) for name in names):
+                return kw
+        return None
+
+    def _candidates(self, names):
+        groups = [self._any_leading_words]
+        for name in names:
+            if not self._is_ascii(name):
+                return self._all
+            lower = name.lower()
+            end = lower.find(' ')
+            while end != -1:
+                group = self._by_leading_words.get(lower[:end])
+                if group:
+                    groups.append(group)
+                end = lower.find(' ', end + 1)
+        groups = [group for group in groups if group]
+        if len(groups) == 1:
+            return groups[0]
+        return sorted((entry for group in groups for entry in group),
+                      key=operator.itemgetter(0))
@@ -0,0 +1,138 @@
+#  Copyright 2008-2015 Nokia Networks
+#  Copyright 2016-     Robot Framework Foundation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import wx
+
+from robotide.pluginapi import Plugin, ActionInfo
+from robotide.utils.instrumentation import INSTRUMENTATION
+from robotide import widgets
+
+
+def format_probe(probe):
+    """Returns the columns of the performance tab for `probe`."""
+    def ms(seconds):
+        return '%.2f' % (seconds * 1000) if seconds is not None else ''
+    hit_rate = probe.hit_rate
+    return [probe.name, str(probe.calls) if probe.calls else '',
+            ms(probe.percentile(50)), ms(probe.percentile(95)),
+            '%.0f %%' % (hit_rate * 100) if hit_rate is not None else '', '']
+
+
+def format_gauge(name, value):
+    """Returns the columns of the performance tab for a gauge."""
+    return [name, '', '', '', '', str(value)]
+
+
+class PerformancePlugin(Plugin):
+    """Shows call counts, latencies and cache hit rates of RIDE internals.
+
+    Hot paths of RIDE are instrumented only while this plugin is enabled.
+    """
+
+    def __init__(self, application):
+        Plugin.__init__(self, application, initially_enabled=False)
+        self._panel = None
+
+    def enable(self):
+        INSTRUMENTATION.enable()
+        self.register_action(ActionInfo(
+            'Tools', 'View Performance', self.OnViewPerformance, position=85))
+
+    def disable(self):
+        INSTRUMENTATION.disable()
+        self.unregister_actions()
+        if self._panel:
+            self._panel.close(self.notebook)
+        self._panel = None
+
+    def OnViewPerformance(self, event):
+        if not self._panel:
+            self._panel = _PerformancePanel(self.notebook,
+                                            self._panel_destroyed)
+        self.notebook.show_tab(self._panel)
+
+    def _panel_destroyed(self):
+        self._panel = None
+
+
+class _PerformancePanel(wx.Panel):
+    _columns = ['Operation', 'Calls', 'p50 (ms)', 'p95 (ms)', 'Hit rate',
+                'Value']
+    _refresh_interval = 1000
+
+    def __init__(self, notebook, destroyed_listener):
+        wx.Panel.__init__(self, notebook)
+        self._destroyed_listener = destroyed_listener
+        self._create_ui()
+        notebook.add_tab(self, 'Performance', allow_closing=True)
+        self._timer = wx.Timer(self)
+        self.Bind(wx.EVT_TIMER, self.OnTimer, self._timer)
+        # The tab can be closed by the user, which destroys the panel.
+        self.Bind(wx.EVT_WINDOW_DESTROY, self.OnDestroy)
+        self._timer.Start(self._refresh_interval)
+        self.update()
+
+    def _create_ui(self):
+        self.SetSizer(widgets.VerticalSizer())
+        buttons = widgets.HorizontalSizer()
+        for label in ('Refresh', 'Reset', 'Export JSON'):
+            buttons.add_with_padding(widgets.ButtonWithHandler(self, label))
+        self.Sizer.add(buttons)
+        self._list = wx.ListCtrl(self, style=wx.LC_REPORT | wx.LC_SINGLE_SEL)
+        for index, title in enumerate(self._columns):
+            self._list.InsertColumn(index, title,
+                                    width=300 if index == 0 else 100)
+        self.Sizer.add_expanding(self._list)
+
+    def close(self, notebook):
+        notebook.delete_tab(self)
+
+    def OnDestroy(self, event):
+        if event.GetEventObject() is self:
+            self._timer.Stop()
+            self._destroyed_listener()
+        event.Skip()
+
+    def update(self):
+        self._list.DeleteAllItems()
+        rows = [format_probe(probe) for probe in INSTRUMENTATION.probes] + \
+            [format_gauge(name, value)
+             for name, value in INSTRUMENTATION.gauges]
+        for row, columns in enumerate(rows):
+            for col, value in enumerate(columns):
+                if col == 0:
+                    self._list.InsertItem(row, value)
+                else:
+                    self._list.SetItem(row, col, value)
+
+    def OnTimer(self, event):
+        if self.IsShownOnScreen():
+            self.update()
+
+    def OnRefresh(self, event):
+        self.update()
+
+    def OnReset(self, event):
+        INSTRUMENTATION.reset()
+        self.update()
+
+    def OnExportJSON(self, event):
+        dialog = wx.FileDialog(self, message='Export performance snapshot',
+                               defaultFile='ride-performance.json',
+                               wildcard='JSON files (*.json)|*.json',
+                               style=wx.FD_SAVE | wx.FD_OVERWRITE_PROMPT)
+        if dialog.ShowModal() == wx.ID_OK:
+            INSTRUMENTATION.write_json(dialog.GetPath())
+        dialog.Destroy()
@@ -20,16 +20,25 @@ from os.path import abspath, dirname, join
 from robotide.preferences import widgets
 from robotide.widgets import Label
 
-try:  # import installed version first
-    import robotframeworklexer
-except ImportError:
-    try:  # then import local version
-        from . import robotframeworklexer
-    except ImportError:  # Pygments is not installed
-        robotframeworklexer = None
-
 from functools import lru_cache
 
+
+@lru_cache(maxsize=1)
+def load_robotframeworklexer():
+    """Returns the Pygments based lexer module, or None without Pygments.
+
+    The lexer is imported on first use, not when RIDE starts.
+    """
+    try:  # import installed version first
+        import robotframeworklexer
+    except ImportError:
+        try:  # then import local version
+            from robotide.editor import robotframeworklexer
+        except ImportError:  # Pygments is not installed
+            robotframeworklexer = None
+    return robotframeworklexer
+
+
 @lru_cache(maxsize=2)
 def ReadFonts(fixed=False):
     """Returns list with fixed width fonts"""
@@ -122,7 +131,7 @@ class TextEditorPreferences(EditorPreferences):
         container = wx.GridBagSizer()
         column = 0
         row = 0
-        if robotframeworklexer:
+        if load_robotframeworklexer():
             settings = (
                         ('argument', 'Argument foreground'),
                         ('comment', 'Comment foreground'),
@@ -13,9 +13,11 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+from bisect import bisect_right
 from datetime import datetime
-from fnmatch import fnmatch
+from fnmatch import translate
 import os
+import re
 import wx
 
 from wx.adv import HyperlinkCtrl, EVT_HYPERLINK
@@ -28,16 +30,40 @@ class Excludes():
     def __init__(self, directory):
         self._settings_directory = directory
         self._exclude_file_path = os.path.join(self._settings_directory, 'excludes')
+        self._matcher = None
+        self._file_signature = None
 
     def get_excludes(self, separator='\n'):
         return separator.join(self._get_excludes())
 
     def _get_excludes(self):
+        return set(self._get_matcher().excludes)
+
+    def _get_matcher(self):
+        signature = self._get_file_signature()
+        if self._matcher is None or signature != self._file_signature:
+            self._matcher = _ExcludeMatcher(self._read_excludes(),
+                                            self._normalize)
+            self._file_signature = self._get_file_signature()
+        return self._matcher
+
+    def _read_excludes(self):
         with self._get_exclude_file('r') as exclude_file:
             if not exclude_file:
                 return set()
             return set(exclude_file.read().split())
 
+    def _get_file_signature(self):
+        try:
+            stat = os.stat(self._exclude_file_path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def _invalidate(self):
+        self._matcher = None
+        self._file_signature = None
+
     def remove_path(self, path):
         path = self._normalize(path)
         excludes = self._get_excludes()
@@ -50,12 +76,11 @@ class Excludes():
                 if not exclude:
                     continue
                 exclude_file.write("%s\n" % exclude)
-        # print("DEBUG:real excluded self._get_excludes()=%s\n" % self._get_excludes())
+        self._invalidate()
 
     def update_excludes(self, new_excludes):
         excludes = self._get_excludes()
         self.write_excludes(excludes.union(new_excludes))
-        # print("DEBUG: Excludes, excluded, union %s, %s, %s\n" % (excludes, new_excludes, excludes.union(new_excludes)))
 
     def _get_exclude_file(self, read_write):
         if not os.path.exists(self._exclude_file_path) and read_write.startswith('r'):
@@ -72,17 +97,11 @@ class Excludes():
     def contains(self, path, excludes=None):
         if not path:
             return False
-        excludes = excludes or self._get_excludes()
-        if len(excludes) < 1:
-            return False
-        path = self._normalize(path)
-        excludes = [self._normalize(e) for e in excludes]
-        # print("DEBUG: excludes contains %s path %s\n"
-        #      "any: %s\n" % (excludes[0], path, any(self._match(path, e) for e in excludes)) )
-        return any(self._match(path, e) for e in excludes)
-
-    def _match(self, path, e):
-        return fnmatch(path, e) or path.startswith(e)
+        if excludes:
+            matcher = _ExcludeMatcher(excludes, self._normalize)
+        else:
+            matcher = self._get_matcher()
+        return matcher.match(self._normalize(path))
 
     def _normalize(self, path):
         if not (path or path.strip()):
@@ -96,6 +115,55 @@ class Excludes():
         return path
 
 
+class _ExcludeMatcher(object):
+    """Excludes compiled to one regular expression and a sorted prefix list.
+
+    A path is excluded when it matches any of the patterns as a shell-style
+    wildcard or when it starts with any of them. Results are memoized per
+    normalized path for the lifetime of the matcher.
+    """
+
+    def __init__(self, excludes, normalize):
+        self.excludes = frozenset(excludes)
+        patterns = sorted(set(p for p in (normalize(e) for e in self.excludes)
+                              if p))
+        self._regex = self._compile(patterns)
+        self._prefixes = self._shortest_prefixes(patterns)
+        self._cache = {}
+
+    def _compile(self, patterns):
+        if not patterns:
+            return None
+        return re.compile('|'.join('(?:%s)' % translate(p) for p in patterns))
+
+    def _shortest_prefixes(self, patterns):
+        # Sorted input places every prefix before the strings starting with
+        # it, so keeping only the shortest ones leaves at most one candidate
+        # prefix for any path: the greatest entry not greater than the path.
+        prefixes = []
+        for pattern in patterns:
+            if not prefixes or not pattern.startswith(prefixes[-1]):
+                prefixes.append(pattern)
+        return prefixes
+
+    def match(self, path):
+        if not path:
+            return False
+        try:
+            return self._cache[path]
+        except KeyError:
+            result = self._cache[path] = self._match(path)
+            return result
+
+    def _match(self, path):
+        if self._regex is None:
+            return False
+        index = bisect_right(self._prefixes, path)
+        if index and path.startswith(self._prefixes[index - 1]):
+            return True
+        return self._regex.match(path) is not None
+
+
 class ExcludePreferences(PreferencesPanel):
     location = ('Excludes')
     title = 'Excludes'
@@ -13,9 +13,14 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import atexit
 import os
 import shutil
 import sys
+import tempfile
+import weakref
+from contextlib import contextmanager
+from threading import RLock, Timer
 
 if sys.version_info[0] == 2:
     PYTHON2 = True
@@ -305,6 +310,96 @@ class ConfigurationError(Exception):
     """Used when settings file is invalid"""
 
 
+def _flush_writers():
+    for writer in list(_SettingsWriter.instances):
+        writer.flush()
+
+
+atexit.register(_flush_writers)
+
+
+class _SettingsWriter(object):
+    """Write-behind persistence of a ConfigObj to its file.
+
+    Saves requested within `delay` seconds of each other are coalesced to a
+    single write, done in a background timer. The file is replaced
+    atomically by writing a temporary file next to it and renaming it over
+    the original. Pending changes are written on `flush` and at exit.
+    """
+    instances = weakref.WeakSet()
+
+    def __init__(self, config_obj, delay=0):
+        self._config_obj = config_obj
+        self._delay = delay
+        self._timer = None
+        self._dirty = False
+        self._holds = 0
+        self.lock = RLock()
+        self.writes = 0
+        _SettingsWriter.instances.add(self)
+
+    def schedule(self):
+        with self.lock:
+            self._dirty = True
+            if self._holds:
+                return
+            if self._delay <= 0:
+                self.flush()
+            elif self._timer is None:
+                self._timer = Timer(self._delay, self._flush_when_due)
+                self._timer.daemon = True
+                self._timer.start()
+
+    @contextmanager
+    def hold(self):
+        with self.lock:
+            self._holds += 1
+        try:
+            yield
+        finally:
+            with self.lock:
+                self._holds -= 1
+                release = not self._holds
+            if release:
+                self.flush()
+
+    def _flush_when_due(self):
+        with self.lock:
+            self._timer = None
+            if not self._holds:
+                self.flush()
+
+    def flush(self):
+        with self.lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if not self._dirty:
+                return
+            self._dirty = False
+            self._write()
+            self.writes += 1
+
+    def _write(self):
+        path = self._config_obj.filename
+        if path is None:
+            self._config_obj.write()
+            return
+        directory, name = os.path.split(os.path.abspath(path))
+        fd, temp_path = tempfile.mkstemp(prefix='.%s.' % name, suffix='.tmp',
+                                         dir=directory)
+        try:
+            with os.fdopen(fd, 'wb') as outfile:
+                self._config_obj.write(outfile)
+            if os.path.exists(path):
+                shutil.copymode(path, temp_path)
+            os.replace(temp_path, path)
+        except Exception:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+
 class _Section(object):
 
     def __init__(self, section, parent=None, name=''):
@@ -315,6 +410,13 @@ class _Section(object):
     def save(self):
         self._parent.save()
 
+    def flush(self):
+        self._parent.flush()
+
+    @property
+    def _lock(self):
+        return self._parent._lock
+
     def __setitem__(self, name, value):
         self.set(name, value)
 
@@ -367,12 +469,14 @@ class _Section(object):
             raise SectionError("Cannot override section with value.")
         if isinstance(value, _Section):
             if override:
-                self._config_obj[name] = {}
+                with self._lock:
+                    self._config_obj[name] = {}
             for key, _value in value._config_obj.items():
                 self[name].set(key, _value, autosave, override)
         elif name not in self._config_obj or override:
             old = self._config_obj[name] if name in self._config_obj else None
-            self._config_obj[name] = value
+            with self._lock:
+                self._config_obj[name] = value
             if autosave:
                 self.save()
             RideSettingsChanged(
@@ -402,7 +506,8 @@ class _Section(object):
            not isinstance(self._config_obj[name], Section):
             raise SectionError('Cannot override value with section.')
         if name not in self._config_obj:
-            self._config_obj[name] = {}
+            with self._lock:
+                self._config_obj[name] = {}
         return self[name].set_defaults(**defaults)
 
     def _is_section(self, name):
@@ -412,24 +517,47 @@ class _Section(object):
 
 class Settings(_Section):
 
-    def __init__(self, user_path):
+    def __init__(self, user_path, save_delay=0):
         try:
             _Section.__init__(self, ConfigObj(user_path, unrepr=True))
         except UnreprError as error:
             raise ConfigurationError(error)
+        self._writer = _SettingsWriter(self._config_obj, save_delay)
         self.excludes = excludes.Excludes(SETTINGS_DIRECTORY)
 
+    @property
+    def _lock(self):
+        return self._writer.lock
+
     def save(self):
-        self._config_obj.write()
+        """Schedules writing the settings to disk.
+
+        Writes are delayed by the `save_delay` given in the constructor and
+        saves happening within that time are written together.
+        """
+        self._writer.schedule()
+
+    def flush(self):
+        """Writes pending changes to disk immediately."""
+        self._writer.flush()
+
+    def deferred_saving(self):
+        """Context manager postponing all writes until it exits.
+
+        Settings changed inside the block are written at most once, when the
+        outermost block exits.
+        """
+        return self._writer.hold()
 
 
 class RideSettings(Settings):
+    SAVE_DELAY = 1.0
 
     def __init__(self):
         self._default_path = os.path.join(os.path.dirname(__file__), 'settings.cfg')
         # print("DEBUG: RideSettings, default_path %s\n" % self._default_path)
         user_path = initialize_settings(self._default_path)
-        Settings.__init__(self, user_path)
+        Settings.__init__(self, user_path, save_delay=self.SAVE_DELAY)
         self._settings_dir = os.path.dirname(user_path)
         # print("DEBUG: RideSettings, self._settings_dir %s\n" % self._settings_dir)
         self.set('install root', os.path.dirname(os.path.dirname(__file__)))
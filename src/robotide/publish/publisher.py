@@ -13,6 +13,8 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+from robotide.utils.instrumentation import timed
+
 try:
     from pubsub import Publisher
     WxPublisher = Publisher()
@@ -26,6 +28,7 @@ class Publisher(object):
     def __init__(self):
         self._listeners = {}
 
+    @timed('Publisher.publish')
     def publish(self, topic, data):
         self._sendMessage(topic, data)
 
@@ -18,7 +18,7 @@ import wx
 from functools import (total_ordering, cmp_to_key)
 from robotide.utils import overrides
 from robotide.widgets import (Dialog, VerticalSizer, VirtualList, Label,
-                              HelpLabel, ImageProvider, ButtonWithHandler)
+                              HelpLabel, IMAGES, ButtonWithHandler)
 from robotide.widgets.list import ListModel
 
 
@@ -91,7 +91,7 @@ class TestsDialog(Dialog):
 
     def _create_switch_button(self, panel):
         sizer = self._vertical_sizer()
-        img = ImageProvider().SWITCH_FIELDS_ICON
+        img = IMAGES.SWITCH_FIELDS_ICON
         button = wx.BitmapButton(panel, -1, img, pos=(10, 20))
         self.Bind(wx.EVT_BUTTON, self.OnSwitchFields, button)
         sizer.Add(button)
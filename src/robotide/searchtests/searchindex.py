@@ -0,0 +1,138 @@
+#  Copyright 2008-2015 Nokia Networks
+#  Copyright 2016-     Robot Framework Foundation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+
+class IndexedTest(object):
+    """Lower cased searchable texts of a test."""
+
+    def __init__(self, test):
+        self.test = test
+        self.name = test.name.lower()
+        self.tags = [str(tag).lower() for tag in test.tags]
+        self.doc = test.documentation.value.lower()
+
+    def terms(self):
+        """Yields (field, term) pairs of all whitespace separated terms."""
+        for term in self.name.split():
+            yield 'name', term
+        for tag in self.tags:
+            for term in tag.split():
+                yield 'tag', term
+        for term in self.doc.split():
+            yield 'doc', term
+
+
+class TestSearchIndex(object):
+    """Inverted index from name, tag and documentation terms to tests.
+
+    Search words never contain whitespace, so a word is a substring of a
+    test's text exactly when it is a substring of one of its whitespace
+    separated terms. Candidates are thus found by scanning the distinct
+    terms instead of the texts of all tests.
+
+    The index is built lazily from `root` on the first search after
+    `invalidate`, and single tests can be updated or removed in between.
+    """
+    _FIELDS = ('name', 'tag', 'doc')
+
+    def __init__(self, root=None):
+        self._root = root
+        self._entries = {}
+        self._postings = dict((field, {}) for field in self._FIELDS)
+        self._matching_terms = {}
+        self._stale = True
+
+    def invalidate(self, root=None):
+        if root is not None:
+            self._root = root
+        self._stale = True
+
+    def update_test(self, test):
+        if self._stale:
+            return
+        self._remove(test)
+        self._add(test)
+        self._matching_terms.clear()
+
+    def update_suite(self, suite):
+        for test in self._walk(suite):
+            self.update_test(test)
+
+    def remove_test(self, test):
+        if self._stale:
+            return
+        self._remove(test)
+        self._matching_terms.clear()
+
+    def __len__(self):
+        self._ensure_built()
+        return len(self._entries)
+
+    def candidates(self, words):
+        """Returns indexed tests matching at least one of lower cased words."""
+        self._ensure_built()
+        tests = set()
+        for word in words:
+            for field in self._FIELDS:
+                postings = self._postings[field]
+                for term in self._terms_matching(field, word):
+                    tests.update(postings[term])
+        return [self._entries[test] for test in tests]
+
+    def _terms_matching(self, field, word):
+        key = (field, word)
+        if key not in self._matching_terms:
+            # While typing, the previous word is usually a substring of this
+            # one, and the terms matching it are a superset of the result.
+            narrower = self._matching_terms.get((field, word[:-1]))
+            terms = narrower if narrower is not None else self._postings[field]
+            self._matching_terms[key] = [t for t in terms if word in t]
+        return self._matching_terms[key]
+
+    def _ensure_built(self):
+        if not self._stale:
+            return
+        self._entries.clear()
+        for postings in self._postings.values():
+            postings.clear()
+        self._matching_terms.clear()
+        if self._root is not None:
+            for test in self._walk(self._root):
+                self._add(test)
+        self._stale = False
+
+    def _walk(self, suite):
+        for test in suite.tests:
+            yield test
+        for child in suite.suites:
+            for test in self._walk(child):
+                yield test
+
+    def _add(self, test):
+        entry = self._entries[test] = IndexedTest(test)
+        for field, term in entry.terms():
+            self._postings[field].setdefault(term, set()).add(test)
+
+    def _remove(self, test):
+        entry = self._entries.pop(test, None)
+        if entry is None:
+            return
+        for field, term in entry.terms():
+            postings = self._postings[field]
+            tests = postings.get(term)
+            if tests is not None:
+                tests.discard(test)
+                if not tests:
+                    del postings[term]
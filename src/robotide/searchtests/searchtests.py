@@ -15,13 +15,18 @@
 
 import wx
 
-from functools import (total_ordering, cmp_to_key)
-from robotide import robotapi
+from functools import total_ordering
 from robotide.action import ActionInfo
+from robotide.controller.macrocontrollers import TestCaseController
 from robotide.pluginapi import Plugin
-from robotide.publish import RideOpenTagSearch
+from robotide.publish import RideOpenTagSearch, RideOpenSuite, \
+    RideNewProject, RideSuiteAdded, RideDataFileRemoved, \
+    RideInitFileRemoved, RideFileNameChanged, RideDataFileSet, \
+    RideTestCaseAdded, \
+    RideTestCaseRemoved, RideItemNameChanged, RideItemSettingsChanged
 from robotide.searchtests.dialogsearchtests import TestsDialog
-from robotide.widgets import ImageProvider
+from robotide.searchtests.searchindex import IndexedTest, TestSearchIndex
+from robotide.widgets import IMAGES
 
 
 @total_ordering
@@ -29,29 +34,66 @@ class TestSearchPlugin(Plugin):
     """A plugin for searching tests based on name, tags and documentation"""
     HEADER = 'Search Tests'
     _selection = None
+    _index_root = None
 
     def enable(self):
         self.register_action(ActionInfo(
             'Tools', self.HEADER, self.show_empty_search,
             shortcut='F3', doc=self.__doc__,
-            icon=ImageProvider().TEST_SEARCH_ICON, position=50))
+            icon=IMAGES.TEST_SEARCH_ICON, position=50))
         self.register_search_action(
             self.HEADER, self.show_search_for,
-            ImageProvider().TEST_SEARCH_ICON, default=True)
+            IMAGES.TEST_SEARCH_ICON, default=True)
         self.subscribe(self.show_tag_search, RideOpenTagSearch)
+        self._index = TestSearchIndex()
+        self.subscribe(self._invalidate_index, RideOpenSuite, RideNewProject,
+                       RideSuiteAdded, RideDataFileRemoved,
+                       RideInitFileRemoved, RideFileNameChanged,
+                       RideDataFileSet)
+        self.subscribe(self._test_added, RideTestCaseAdded)
+        self.subscribe(self._test_removed, RideTestCaseRemoved)
+        self.subscribe(self._item_changed, RideItemNameChanged,
+                       RideItemSettingsChanged)
         self._dialog = None
 
+    def _invalidate_index(self, message=None):
+        self._index.invalidate()
+
+    def _test_added(self, message):
+        self._index.update_test(message.item)
+
+    def _test_removed(self, message):
+        self._index.remove_test(message.item)
+
+    def _item_changed(self, message):
+        item = message.item
+        if isinstance(item, TestCaseController):
+            self._index.update_test(item)
+        elif hasattr(item, 'suites'):
+            # Force and default tags of a suite affect all its tests.
+            self._index.update_suite(item)
+
     def show_search_for(self, text):
         if self._dialog is None:
             self._create_tests_dialog()
-        self._dialog.set_search_model(
-            text, self._search_results(TestSearchMatcher(text)))
+        self._dialog.set_search_model(text, self._text_search_results(text))
         self._dialog.set_focus_to_default_location()
 
+    def _text_search_results(self, text):
+        current_suite = self.frame._controller.data
+        if not current_suite:
+            return []
+        if current_suite is not self._index_root:
+            self._index_root = current_suite
+            self._index.invalidate(current_suite)
+        matcher = TestSearchMatcher(text)
+        results = [(entry.test, matcher.matches_indexed(entry))
+                   for entry in self._index.candidates(matcher.words)]
+        return sorted(results, key=lambda result: result[1].sort_key)
+
     def show_search_for_tag_patterns(self, includes, excludes):
-        matcher = TagSearchMatcher(includes, excludes)
         self._dialog.set_tag_search_model(
-            includes, excludes, self._search_results(matcher))
+            includes, excludes, self._tag_search_results(includes, excludes))
         self._dialog.set_focus_to_default_location()
 
     def show_tag_search(self, data):
@@ -90,30 +132,18 @@ class TestSearchPlugin(Plugin):
         self._selection = selection
         self._selected_timer.Start(400, True)
 
-    def _search_results(self, matcher):
-        current_suite = self.frame._controller.data
-        if not current_suite:
+    def _tag_search_results(self, includes, excludes):
+        if not self.frame._controller.data:
             return []
-        result = self._search(matcher, current_suite)
-        return sorted(result, key=cmp_to_key(lambda x, y:
-                                             self.m_cmp(x[1], y[1])))
-
-    def _search(self, matcher, data):
-        for test in data.tests:
-            match = matcher.matches(test)
-            if match:
-                yield test, match
-        for s in data.suites:
-            for test, match in self._search(matcher, s):
-                yield test, match
+        tests = self.frame._controller.tag_index.match(includes.split(),
+                                                      excludes.split())
+        return sorted(((test, test.longname) for test in tests),
+                      key=lambda result: result[1])
 
     def disable(self):
+        self.unsubscribe_all()
         self.unregister_actions()
 
-    @staticmethod
-    def m_cmp(a, b):
-        return (a > b) - (a < b)
-
     def __eq__(self, other):
         return self.name.lower() == other.name.lower()
 
@@ -124,119 +154,58 @@ class TestSearchPlugin(Plugin):
         return self.name.lower() < other.name.lower()
 
 
-class TagSearchMatcher(object):
-
-    def __init__(self, includes, excludes):
-        self._tag_pattern_includes = robotapi.TagPatterns(
-            includes.split()) if includes.split() else None
-        self._tag_pattern_excludes = robotapi.TagPatterns(excludes.split())
-
-    def matches(self, test):
-        tags = [str(tag) for tag in test.tags]
-        if self._matches(tags):
-            return test.longname
-        return False
-
-    def _matches(self, tags):
-        return (self._tag_pattern_includes is None or
-                self._tag_pattern_includes.match(tags)) and \
-            not self._tag_pattern_excludes.match(tags)
-
-
 class TestSearchMatcher(object):
 
     def __init__(self, text):
         self._texts = text.split()
         self._texts_lower = [t.lower() for t in self._texts]
 
+    @property
+    def words(self):
+        return self._texts_lower
+
     def matches(self, test):
-        if self._matches(test):
-            return SearchResult(self._texts, self._texts_lower, test)
-        return False
-
-    def _matches(self, test):
-        name = test.name.lower()
-        if self._match_in(name):
-            return True
-        if any(self._match_in(str(tag).lower()) for tag in test.tags):
-            return True
-        doc = test.documentation.value.lower()
-        if self._match_in(doc):
-            return True
-        return False
+        return self.matches_indexed(IndexedTest(test))
 
-    def _match_in(self, text):
-        return any(word in text for word in self._texts_lower)
+    def matches_indexed(self, indexed):
+        result = SearchResult(self._texts, self._texts_lower, indexed.test,
+                              indexed)
+        return result if result.total_matches else False
 
 
 class SearchResult(object):
+    """Test matching search terms, ordered by how well it matches.
 
-    def __init__(self, original_search_terms, search_terms_lower, test):
+    Results with more matching terms come first. Then come results with
+    matches in name, ordered by name, and results with matches in tags,
+    ordered by tags. Remaining ties are ordered by name. The order is
+    computed once to `sort_key`.
+    """
+
+    def __init__(self, original_search_terms, search_terms_lower, test,
+                 indexed=None):
         self._original_search_terms = original_search_terms
         self._search_terms_lower = search_terms_lower
         self._test = test
-        self.__total_matches = None
-        self.__tags = None
-
-    # This is ignored on Python 3
-    """
-    def __cmp__(self, other):
-    """
-    def _helper_cmp_(self, other):
-        totals, other_totals = self._total_matches(), other._total_matches()
-        if totals != other_totals:
-            return self.m_cmp(other_totals, totals)
-        names = self._compare(
-            self._is_name_match(), other._is_name_match(),
-            self._test.name, other._test.name)
-        if names:
-            return names
-        tags = self._compare(
-            self._is_tag_match(), other._is_tag_match(),
-            self._tags(), other._tags())
-        if tags:
-            return tags
-        return self.m_cmp(self._test.name, other._test.name)
-
-    def _compare(self, my_result, other_result, my_cmp, other_cmp):
-        if my_result and not other_result:
-            return -1
-        if not my_result and other_result:
-            return 1
-        if my_result and other_result:
-            return self.m_cmp(my_cmp, other_cmp)
-        return 0
-
-    def _total_matches(self):
-        if not self.__total_matches:
-            self.__total_matches = sum(
-                1 for word in self._search_terms_lower
-                if word in self._test.name.lower()
-                or any(word in t for t in self._tags())
-                or word in self._test.documentation.value.lower())
-        return self.__total_matches
+        indexed = indexed or IndexedTest(test)
+        name_match = self._match_in(indexed.name)
+        tags = indexed.tags
+        tag_match = any(self._match_in(t) for t in tags)
+        self.total_matches = sum(
+            1 for word in search_terms_lower
+            if word in indexed.name or any(word in t for t in tags)
+            or word in indexed.doc)
+        self.sort_key = (-self.total_matches,
+                         not name_match, test.name if name_match else '',
+                         not tag_match, tags if tag_match else [],
+                         test.name)
 
     def _match_in(self, text):
         return any(word in text for word in self._search_terms_lower)
 
-    def _is_name_match(self):
-        return self._match_in(self._test.name.lower())
-
-    def _is_tag_match(self):
-        return any(self._match_in(t) for t in self._tags())
-
-    def _tags(self):
-        if self.__tags is None:
-            self.__tags = [str(tag).lower() for tag in self._test.tags]
-        return self.__tags
-
     def __repr__(self):
         return self._test.name
 
-    @staticmethod
-    def m_cmp(a, b):
-        return (a > b) - (a < b)
-
     def __eq__(self, other):
         return self.__hash__() == other.__hash__()
 
@@ -247,13 +216,7 @@ class SearchResult(object):
         return hash(repr(self))
 
     def __lt__(self, other):
-        return self._helper_cmp_(other) == -1
-
-    def __le__(self, other):
-        return self._helper_cmp_(other) <= 0
+        return self.sort_key < other.sort_key
 
     def __gt__(self, other):
-        return self._helper_cmp_(other) == 1
-
-    def __ge__(self, other):
-        return self._helper_cmp_(other) >= 0
+        return self.sort_key > other.sort_key
@@ -13,15 +13,36 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import copy
 import os
+import re
 
-from functools import total_ordering
+from functools import lru_cache, total_ordering
 from robotide.lib.robot.libdocpkg.htmlwriter import DocToHtml
 from robotide import utils
 
 
+# The same line boundaries as str.splitlines, without splitting whole doc.
+_FIRST_LINE = re.compile('[^\n\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029]*')
+
+
+@lru_cache(maxsize=256)
+def _details_html(name, source, source_type, arguments, doc, doc_format):
+    return ('<table>'
+            '<tr><td><i>Name:</i></td><td>%s</td></tr>'
+            '<tr><td><i>Source:</i></td><td>%s &lt;%s&gt;</td></tr>'
+            '<tr><td><i>Arguments:</i></td><td>%s</td></tr>'
+            '</table>'
+            '<table>'
+            '<tr><td>%s</td></tr>'
+            '</table>') % \
+            (name, source, source_type, arguments,
+             DocToHtml(doc_format)(doc))
+
+
 class ItemInfo(object):
     """Represents an object that can be displayed by content assistant."""
+    __slots__ = ('name', 'source', '_details', '_priority')
 
     def __init__(self, name, source, details):
         """Creates an item info.
@@ -39,9 +60,13 @@ class ItemInfo(object):
         self.name = name
         self.source = source
         if details is not None:
-            self.details = details
+            self._details = details
         self._priority = PRIORITIES.get(self.__class__, PRIORITIES[ItemInfo])
 
+    @property
+    def details(self):
+        return self._details
+
     @property
     def longname(self):
         return '%s.%s' % (self.source, self.name)
@@ -156,33 +181,30 @@ class LocalVariableInfo(VariableInfo):
 
 @total_ordering
 class _KeywordInfo(ItemInfo):
+    __slots__ = ('doc', 'doc_format', 'item')
 
     def __init__(self, item):
         self.doc = self._doc(item).strip()
         self.doc_format = "ROBOT"
         ItemInfo.__init__(self, self._name(item), self._source(item),
                           None)
-        self.shortdoc = self.doc.splitlines()[0] if self.doc else ''
         self.item = item
 
+    @property
+    def shortdoc(self):
+        return _FIRST_LINE.match(self.doc).group()
+
     @property
     def arguments(self):
         return self._parse_args(self.item)
 
     @property
     def details(self):
-        formatter = DocToHtml(self.doc_format)
-        return ('<table>'
-                '<tr><td><i>Name:</i></td><td>%s</td></tr>'
-                '<tr><td><i>Source:</i></td><td>%s &lt;%s&gt;</td></tr>'
-                '<tr><td><i>Arguments:</i></td><td>%s</td></tr>'
-                '</table>'
-                '<table>'
-                '<tr><td>%s</td></tr>'
-                '</table>') % \
-                (self._name(self.item), self._source(self.item), self._type,
-                 self._format_args(self.arguments),
-                 formatter(self.doc))
+        # Rendering documentation is slow, and details are asked for again
+        # whenever a tooltip or the content assistant shows the keyword.
+        return _details_html(self._name(self.item), self._source(self.item),
+                             self._type, self._format_args(self.arguments),
+                             self.doc, self.doc_format)
 
     def _format_args(self, args):
         return '[ %s ]' % ' | '.join(args)
@@ -238,17 +260,23 @@ class _XMLKeywordContent(_KeywordInfo):
 
 @total_ordering
 class LibraryKeywordInfo(_KeywordInfo):
+    """Keyword of a library.
+
+    The same instances are shared by all imports of a library, and
+    `with_alias` returns a shallow copy for imports using `WITH NAME`.
+    """
+    __slots__ = ('_item_name', '_item_library_name', '_args',
+                 '_library_alias')
     _type = 'test library'
-    _library_alias = None
-    item = None
 
     def __init__(self, name, doc, doc_format, library_name, args):
         self._item_name = name
         self.doc = doc.strip()
         self._item_library_name = library_name
         self._args = args
+        self._library_alias = None
+        self.item = None
         ItemInfo.__init__(self, self._item_name, library_name, None)
-        self.shortdoc = self.doc.splitlines()[0] if self.doc else ''
 
         if doc_format in ("TEXT", "ROBOT", "REST", "HTML"):
             self.doc_format = doc_format
@@ -256,9 +284,13 @@ class LibraryKeywordInfo(_KeywordInfo):
             self.doc_format = "ROBOT"
 
     def with_alias(self, alias):
-        self._library_alias = alias
-        self.source = self._source(self.item)
-        return self
+        alias = alias or None
+        if alias == self._library_alias:
+            return self
+        aliased = copy.copy(self)
+        aliased._library_alias = alias
+        aliased.source = aliased._source(aliased.item)
+        return aliased
 
     def _source(self, item):
         if self._library_alias:
@@ -301,7 +333,6 @@ class BlockKeywordInfo(_KeywordInfo):
         self.doc_format = doc_format
         self._args = args
         ItemInfo.__init__(self, self._item_name, library_name, None)
-        self.shortdoc = self.doc.splitlines()[0] if self.doc else ''
 
     def with_alias(self, alias):
         self._library_alias = alias
@@ -335,6 +366,17 @@ class BlockKeywordInfo(_KeywordInfo):
 
 
 class _UserKeywordInfo(_KeywordInfo):
+    _parsed_spec = None
+    _parsed_args = None
+
+    @property
+    def arguments(self):
+        # Parsed again only after the argument spec of the keyword changes.
+        spec = tuple(self.item.args.value or ())
+        if spec != self._parsed_spec:
+            self._parsed_args = self._parse_args(self.item)
+            self._parsed_spec = spec
+        return self._parsed_args
 
     def _source(self, item):
         return os.path.basename(item.source) if item.source else ''
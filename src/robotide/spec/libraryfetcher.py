@@ -13,8 +13,15 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import ast
+import os
+import sys
+
 from robotide import robotapi
+from robotide.lib.robot.libraries import STDLIBS
+from robotide.lib.robot.utils import split_tags_from_doc
 from robotide.spec.iteminfo import LibraryKeywordInfo
+from robotide.utils import normalize, printable_name
 
 
 def get_import_result(path, args):
@@ -43,3 +50,328 @@ def _parse_args(args):
     if args.kwargs:
         parsed.append('**%s' % args.kwargs)
     return parsed
+
+
+def get_static_import_result(path):
+    """Returns keywords of a static Python library without importing it.
+
+    Keywords are read from the library source with `ast`. Returns None if
+    the source cannot be found or the keywords cannot be resolved without
+    running the code, e.g. with dynamic and hybrid libraries.
+    """
+    if path in STDLIBS:
+        return None
+    source, class_name, class_required = _find_library_source(path)
+    if not source:
+        return None
+    try:
+        with open(source, 'rb') as library:
+            tree = ast.parse(library.read(), source)
+        return _StaticLibrary(tree, class_name, class_required).get_keywords(
+            _get_library_name(path))
+    except (_NotStatic, SyntaxError, ValueError, IOError, OSError):
+        return None
+
+
+def _get_library_name(name):
+    # Same as the name TestLibrary gives to libraries imported by path.
+    if os.path.exists(name):
+        return os.path.splitext(os.path.basename(os.path.abspath(name)))[0]
+    return name
+
+
+def _find_library_source(name):
+    if os.path.isabs(name):
+        if os.path.isdir(name):
+            return _existing(os.path.join(name, '__init__.py')), \
+                os.path.basename(os.path.normpath(name)), False
+        if name.endswith('.py') and os.path.isfile(name):
+            return name, os.path.basename(name)[:-3], False
+        return None, None, False
+    if name in sys.builtin_module_names:
+        return None, None, False
+    module = _find_module(name)
+    if module or '.' not in name:
+        return module, name.split('.')[-1], False
+    parent, class_name = name.rsplit('.', 1)
+    return _find_module(parent), class_name, True
+
+
+def _find_module(name):
+    parts = name.split('.')
+    for base in sys.path:
+        base = os.path.join(base or os.getcwd(), *parts)
+        for path in (os.path.join(base, '__init__.py'), base + '.py'):
+            if os.path.isfile(path):
+                return path
+    return None
+
+
+def _existing(path):
+    return path if os.path.isfile(path) else None
+
+
+class _NotStatic(Exception):
+    pass
+
+
+class _StaticLibrary(object):
+    _dynamic_methods = ('get_keyword_names', 'getKeywordNames',
+                        'run_keyword', 'runKeyword',
+                        '__getattr__', '__getattribute__')
+
+    def __init__(self, tree, class_name, class_required=False):
+        self._module = tree
+        self._classes = dict((node.name, node) for node in tree.body
+                             if isinstance(node, ast.ClassDef))
+        self._class_name = class_name
+        self._class_required = class_required
+
+    def get_keywords(self, library_name):
+        bindings = self._bindings(self._class_name)
+        if self._class_name in self._classes:
+            if bindings != 1:
+                raise _NotStatic
+            bodies = self._class_bodies(self._classes[self._class_name])
+            functions = self._class_functions(bodies)
+        else:
+            if bindings or self._class_required:
+                raise _NotStatic
+            bodies = [self._module_statements()]
+            functions = self._module_functions(bodies[0])
+        doc_format = self._doc_format(bodies)
+        keywords = dict()
+        for name, function, is_method in functions:
+            keyword = self._keyword(name, function, is_method, doc_format,
+                                    library_name, bodies)
+            if keyword.name in keywords:
+                raise _NotStatic
+            keywords[keyword.name] = keyword
+        return [keywords[name] for name in sorted(keywords)]
+
+    def _bindings(self, name):
+        return len([statement for statement in self._module_statements()
+                    if name in self._bound_names(statement)])
+
+    def _module_statements(self, statements=None):
+        """Returns module level statements, also from compound statements.
+
+        Functions and classes defined conditionally cannot be resolved.
+        """
+        result = []
+        for statement in (self._module.body if statements is None
+                          else statements):
+            nested = [getattr(statement, attr, []) for attr in
+                      ('body', 'orelse', 'finalbody', 'handlers')]
+            if isinstance(statement, (ast.FunctionDef, ast.AsyncFunctionDef,
+                                      ast.ClassDef)):
+                if statements is not None:
+                    raise _NotStatic
+                result.append(statement)
+            elif any(nested):
+                for block in nested:
+                    result.extend(self._module_statements(block))
+            else:
+                result.append(statement)
+        return result
+
+    def _class_bodies(self, node, seen=()):
+        """Returns bodies of the class and its bases in resolution order."""
+        if node.decorator_list or node.keywords or node in seen:
+            raise _NotStatic
+        bodies = [node.body]
+        for base in node.bases:
+            if isinstance(base, ast.Name) and base.id == 'object':
+                continue
+            if not (isinstance(base, ast.Name) and base.id in self._classes):
+                raise _NotStatic
+            for body in self._class_bodies(self._classes[base.id],
+                                           seen + (node,)):
+                if body not in bodies:
+                    bodies.append(body)
+        return bodies
+
+    def _class_functions(self, bodies):
+        functions = {}
+        for body in reversed(bodies):
+            for statement in body:
+                names = self._bound_names(statement)
+                for name in names:
+                    functions.pop(name, None)
+                if isinstance(statement, (ast.FunctionDef,
+                                          ast.AsyncFunctionDef)):
+                    if statement.name in self._dynamic_methods:
+                        raise _NotStatic
+                    if not self._is_property(statement):
+                        functions[statement.name] = statement
+                elif any(getattr(statement, attr, None) for attr in
+                         ('body', 'orelse', 'handlers', 'finalbody')) \
+                        and not isinstance(statement, ast.ClassDef):
+                    raise _NotStatic
+                elif self._public(names) and not self._is_value(
+                        statement, self._class_names(body)):
+                    raise _NotStatic
+        return [(name, function, True)
+                for name, function in functions.items()
+                if self._is_keyword(name, function)]
+
+    def _module_functions(self, statements):
+        exposed = self._all(statements)
+        functions = {}
+        for statement in statements:
+            names = [name for name in self._bound_names(statement)
+                     if exposed is None or name in exposed]
+            for name in names:
+                functions.pop(name, None)
+            if isinstance(statement, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                functions[statement.name] = statement
+            elif self._public(names) and not self._is_value(
+                    statement, self._class_names(statements)):
+                raise _NotStatic
+        return [(name, function, False)
+                for name, function in functions.items()
+                if (exposed is None or name in exposed)
+                and self._is_keyword(name, function)]
+
+    def _all(self, statements):
+        exposed = None
+        for statement in statements:
+            if '__all__' in self._bound_names(statement):
+                if not isinstance(statement, ast.Assign):
+                    raise _NotStatic
+                exposed = ast.literal_eval(statement.value)
+        return exposed
+
+    def _bound_names(self, statement):
+        if isinstance(statement, (ast.FunctionDef, ast.AsyncFunctionDef,
+                                  ast.ClassDef)):
+            return [statement.name]
+        if isinstance(statement, (ast.Import, ast.ImportFrom)):
+            if any(alias.name == '*' for alias in statement.names):
+                raise _NotStatic
+            return [(alias.asname or alias.name).split('.')[0]
+                    for alias in statement.names]
+        if isinstance(statement, ast.Assign):
+            targets = statement.targets
+        elif isinstance(statement, (ast.AugAssign, ast.AnnAssign)):
+            targets = [statement.target]
+        else:
+            return []
+        return [node.id for target in targets for node in ast.walk(target)
+                if isinstance(node, ast.Name)]
+
+    def _public(self, names):
+        return [name for name in names if not name.startswith('_')
+                and not name.startswith('ROBOT_LIBRARY_')]
+
+    def _class_names(self, statements):
+        return set(statement.name for statement in statements
+                   if isinstance(statement, ast.ClassDef))
+
+    def _is_value(self, statement, class_names):
+        """Tells can `statement` bind something else than functions."""
+        if isinstance(statement, ast.ClassDef) or \
+                isinstance(statement, ast.Import):
+            return True
+        if isinstance(statement, ast.ImportFrom):
+            return False
+        value = getattr(statement, 'value', None)
+        if value is None:
+            return True
+        if isinstance(value, ast.Name):
+            return value.id in class_names
+        # Calls and other expressions can return functions.
+        try:
+            ast.literal_eval(value)
+        except (ValueError, TypeError):
+            return False
+        return True
+
+    def _is_property(self, function):
+        for decorator in function.decorator_list:
+            if isinstance(decorator, ast.Name) and decorator.id == 'property':
+                return True
+            if isinstance(decorator, ast.Attribute) and \
+                    decorator.attr in ('getter', 'setter', 'deleter'):
+                return True
+        return False
+
+    def _is_keyword(self, name, function):
+        return not name.startswith('_') or \
+            any(self._is_keyword_decorator(d) for d in function.decorator_list)
+
+    def _is_keyword_decorator(self, decorator):
+        if isinstance(decorator, ast.Call):
+            decorator = decorator.func
+        if isinstance(decorator, ast.Attribute):
+            return decorator.attr == 'keyword'
+        return isinstance(decorator, ast.Name) and decorator.id == 'keyword'
+
+    def _doc_format(self, bodies):
+        for body in bodies:
+            for statement in body:
+                if 'ROBOT_LIBRARY_DOC_FORMAT' in self._bound_names(statement):
+                    value = ast.literal_eval(statement.value)
+                    return normalize(value, ignore='_').upper()
+        return ''
+
+    def _keyword(self, name, function, is_method, doc_format, library_name,
+                 bodies):
+        robot_name = None
+        drop_first = is_method
+        for decorator in function.decorator_list:
+            if self._is_keyword_decorator(decorator):
+                robot_name = self._robot_name(decorator)
+            elif isinstance(decorator, ast.Name) and \
+                    decorator.id == 'staticmethod':
+                drop_first = False
+            elif not (isinstance(decorator, ast.Name) and
+                      decorator.id == 'classmethod'):
+                raise _NotStatic
+        name = robot_name or printable_name(name, code_style=True)
+        if '${' in name:
+            raise _NotStatic
+        doc, _ = split_tags_from_doc(self._doc(function, bodies))
+        return LibraryKeywordInfo(name, doc, doc_format, library_name,
+                                  self._arguments(function.args, drop_first))
+
+    def _robot_name(self, decorator):
+        if not isinstance(decorator, ast.Call):
+            return None
+        if decorator.args:
+            return ast.literal_eval(decorator.args[0])
+        for keyword in decorator.keywords:
+            if keyword.arg == 'name':
+                return ast.literal_eval(keyword.value)
+        return None
+
+    def _doc(self, function, bodies):
+        # Like inspect.getdoc, methods inherit documentation from bases.
+        doc = ast.get_docstring(function)
+        if doc is None and bodies:
+            for body in bodies:
+                for statement in body:
+                    if isinstance(statement, (ast.FunctionDef,
+                                              ast.AsyncFunctionDef)) \
+                            and statement.name == function.name:
+                        doc = doc or ast.get_docstring(statement)
+        return doc or ''
+
+    def _arguments(self, args, drop_first):
+        if args.kwonlyargs or getattr(args, 'posonlyargs', None):
+            raise _NotStatic
+        positional = [arg.arg for arg in args.args]
+        defaults = [ast.literal_eval(default) for default in args.defaults]
+        parsed = positional[:]
+        for index, value in enumerate(defaults):
+            index = len(positional) - len(defaults) + index
+            parsed[index] = '%s=%s' % (parsed[index], value)
+        if drop_first:
+            if not parsed:
+                raise _NotStatic
+            parsed = parsed[1:]
+        if args.vararg:
+            parsed.append('*%s' % args.vararg.arg)
+        if args.kwarg:
+            parsed.append('**%s' % args.kwarg.arg)
+        return parsed
@@ -20,7 +20,8 @@ from threading import Thread
 
 from robotide.publish import RideLogException, RideLogMessage
 from robotide.spec.librarydatabase import LibraryDatabase
-from robotide.spec.libraryfetcher import get_import_result
+from robotide.spec.libraryfetcher import (get_import_result,
+                                          get_static_import_result)
 from robotide.spec.xmlreaders import get_path, SpecInitializer
 
 
@@ -79,6 +80,10 @@ class LibraryManager(Thread):
         try:
             path = get_path(
                 library_name.replace('/', os.sep), os.path.abspath('.'))
+            # Importing is needed only if the source does not tell keywords.
+            keywords = get_static_import_result(path)
+            if keywords is not None:
+                return keywords
             return get_import_result(path, library_args)
         except Exception as err:
             try:
@@ -13,6 +13,7 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import json
 import os
 import sys
 
@@ -21,11 +22,102 @@ from robotide.utils.versioncomparator import cmp_versions
 from iteminfo import _XMLKeywordContent
 from robotide import context
 
+INDEX_FILE = os.path.join(context.SETTINGS_DIRECTORY, 'library_xml_index.json')
+INDEX_VERSION = 1
+
+
+class SpecIndex(object):
+    """Persistent index of library spec XML files.
+
+    Maps paths of spec files to library names and versions read from them.
+    Entries are refreshed only when the modification time or size of the
+    file changes, so looking up a library does not parse every spec file.
+    """
+
+    def __init__(self, path=None):
+        self._path = path
+        self._entries = self._load()
+        self._dirty = False
+
+    def _load(self):
+        try:
+            with open(self._path) as index:
+                data = json.load(index)
+        except (TypeError, IOError, OSError, ValueError):
+            return {}
+        if data.get('version') != INDEX_VERSION:
+            return {}
+        return data.get('files', {})
+
+    def find(self, directory, name):
+        """Returns the path of the newest spec of library `name`."""
+        newest = None
+        newest_version = None
+        for path, entry in self._refresh(directory):
+            if entry['name'] == name and (
+                    newest is None or
+                    cmp_versions(entry['version'], newest_version) == 1):
+                newest, newest_version = path, entry['version']
+        self.save()
+        return newest
+
+    def _refresh(self, directory):
+        try:
+            filenames = os.listdir(directory)
+        except OSError:
+            return []
+        entries = []
+        for filename in filenames:
+            path = os.path.join(directory, filename)
+            if not path.endswith('.xml'):
+                continue
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            if os.path.isfile(path):
+                entries.append((path, self._entry(path, stat)))
+        self._prune(directory, set(path for path, _ in entries))
+        return entries
+
+    def _entry(self, path, stat):
+        entry = self._entries.get(path)
+        if entry and entry['mtime'] == stat.st_mtime \
+                and entry['size'] == stat.st_size:
+            return entry
+        name, version = _read_name_and_version(path)
+        entry = {'mtime': stat.st_mtime, 'size': stat.st_size,
+                 'name': name, 'version': version}
+        self._entries[path] = entry
+        self._dirty = True
+        return entry
+
+    def _prune(self, directory, existing):
+        for path in list(self._entries):
+            if os.path.dirname(path) == directory and path not in existing:
+                del self._entries[path]
+                self._dirty = True
+
+    def save(self):
+        if not (self._dirty and self._path):
+            return
+        temp = self._path + '.tmp'
+        try:
+            with open(temp, 'w') as index:
+                json.dump({'version': INDEX_VERSION, 'files': self._entries},
+                          index)
+            os.replace(temp, self._path)
+        except (IOError, OSError):
+            return
+        self._dirty = False
+
+
 class SpecInitializer(object):
 
-    def __init__(self, directories=None):
+    def __init__(self, directories=None, index=None):
         self._directories = directories or []
         self._directories.append(context.LIBRARY_XML_DIRECTORY)
+        self._index = index or SpecIndex(INDEX_FILE)
 
     def init_from_spec(self, name):
         specfile = self._find_from_pythonpath(name) or \
@@ -40,32 +132,7 @@ class SpecInitializer(object):
         return None
 
     def _find_from_library_xml_directory(self, directory, name):
-        current_xml_file = None
-        for xml_file in self._list_xml_files_in(directory):
-            name_from_xml = get_name_from_xml(xml_file)
-            if name_from_xml == name:
-                current_xml_file = self._get_newest_xml_file(
-                    xml_file, current_xml_file)
-        return current_xml_file
-
-    def _get_newest_xml_file(self, xml_file, current_xml_file):
-        version1 = self._get_version(xml_file)
-        version2 = self._get_version(current_xml_file)
-        if cmp_versions(version1, version2) == 1:
-            return xml_file
-        return current_xml_file
-
-    def _get_version(self, xml_file):
-        try:
-            return utils.ET.parse(xml_file).getroot().find('version').text
-        except:
-            return None
-
-    def _list_xml_files_in(self, directory):
-        for filename in os.listdir(directory):
-            path = os.path.join(directory, filename)
-            if path.endswith('.xml') and os.path.isfile(path):
-                yield path
+        return self._index.find(directory, name)
 
     def _find_from_pythonpath(self, name):
         return utils.find_from_pythonpath(name + '.xml')
@@ -123,9 +190,26 @@ def _get_library_name(name):
 
 
 def get_name_from_xml(path):
+    return _read_name_and_version(path)[0]
+
+
+def _read_name_and_version(path):
+    """Reads library name and version without parsing the whole spec."""
+    name = version = None
+    depth = 0
     try:
-        root = utils.ET.parse(path).getroot()
-        name = root.get('name')
-        return name
-    except:
-        return None
+        for event, elem in utils.ET.iterparse(path, events=('start', 'end')):
+            if event == 'start':
+                if depth == 0:
+                    name = elem.get('name')
+                depth += 1
+                continue
+            depth -= 1
+            if depth == 1 and elem.tag == 'version':
+                version = elem.text
+                break
+            if depth == 1 and elem.tag in ('kw', 'keywords'):
+                break
+    except Exception:
+        return None, None
+    return name, version
@@ -13,15 +13,14 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
-import os
 import wx
 from robotide.controller.settingcontrollers import VariableController
 from robotide.controller.macrocontrollers import TestCaseController, UserKeywordController
 from robotide.controller.filecontrollers import TestDataDirectoryController, TestCaseFileController, ResourceFileController, ExcludedDirectoryController
+from robotide.widgets import IMAGES
 
 
 _SIZE = (16, 16)
-_BASE = os.path.join(os.path.dirname(__file__), '..', 'widgets')
 
 ROBOT_IMAGE_INDEX = 3
 RUNNING_IMAGE_INDEX = 7
@@ -81,12 +80,4 @@ class _TreeImage(object):
         self.expanded = self._get_image(image_list, expanded) if expanded else self.normal
 
     def _get_image(self, image_list, source):
-        if source.startswith('wx'):
-            img = wx.ArtProvider_GetBitmap(source, wx.ART_OTHER, _SIZE)
-        else:
-            path = os.path.join(_BASE, source)
-            if source.endswith('gif'):
-                img = wx.Image(path, wx.BITMAP_TYPE_GIF).ConvertToBitmap()
-            else:
-                img = wx.Image(path, wx.BITMAP_TYPE_PNG).ConvertToBitmap()
-        return image_list.Add(img)
+        return image_list.Add(IMAGES.load(source))
@@ -15,9 +15,9 @@
 
 import wx
 import os.path
+from bisect import bisect_right
 
 from wx.lib.mixins.listctrl import ListCtrlAutoWidthMixin
-from functools import (total_ordering, cmp_to_key)
 from robotide.controller.filecontrollers import (ResourceFileController,
                                                  TestCaseFileController)
 from robotide.pluginapi import (Plugin, ActionInfo, RideOpenSuite,
@@ -25,7 +25,7 @@ from robotide.pluginapi import (Plugin, ActionInfo, RideOpenSuite,
 from robotide.usages.UsageRunner import Usages
 from robotide import utils
 from robotide.widgets import (PopupMenuItem, ButtonWithHandler, Label, Font,
-        HtmlWindow, ImageProvider)
+        HtmlWindow, IMAGES)
 
 ALL_KEYWORDS = '<all keywords>'
 ALL_USER_KEYWORDS = '<all user keywords>'
@@ -38,17 +38,17 @@ class KeywordSearch(Plugin):
     def __init__(self, app):
         Plugin.__init__(self, app)
         self.all_keywords = []
-        self._criteria = _SearchCriteria()
+        self.keyword_table = _KeywordTable([])
         self.dirty = False
 
     def enable(self):
         action = ActionInfo('Tools', 'Search Keywords', self.OnSearch,
                             shortcut='F5',
                             doc='Search keywords from libraries and resources',
-                            icon=ImageProvider().KW_SEARCH_ICON,
+                            icon=IMAGES.KW_SEARCH_ICON,
                             position=51)
         self.register_action(action)
-        self.register_search_action('Search Keywords', self.show_search_for, ImageProvider().KW_SEARCH_ICON)
+        self.register_search_action('Search Keywords', self.show_search_for, IMAGES.KW_SEARCH_ICON)
         self.subscribe(self.mark_dirty, RideOpenSuite, RideOpenResource,
                        RideImportSetting, RideUserKeyword, RideNewProject)
         self._dialog = KeywordSearchDialog(self.frame, self)
@@ -69,13 +69,11 @@ class KeywordSearch(Plugin):
     def _update(self):
         self.dirty = False
         self.all_keywords = self.model.get_all_keywords()
+        self.keyword_table = _KeywordTable(self.all_keywords)
 
     def search(self, pattern, search_docs, source_filter):
-        self._criteria = _SearchCriteria(pattern, search_docs, source_filter)
-        return self._search()
-
-    def _search(self):
-        return [ kw for kw in self.all_keywords if self._criteria.matches(kw) ]
+        return self.keyword_table.search(
+            _SearchCriteria(pattern, search_docs, source_filter))
 
     def _search_resource(self, item):
         if isinstance(item, (TestCaseFileController, ResourceFileController)):
@@ -99,26 +97,104 @@ class _SearchCriteria(object):
         self._search_docs = search_docs
         self._source_filter = source_filter
 
+    @property
+    def pattern(self):
+        return utils.normalize(self._pattern)
+
+    @property
+    def search_docs(self):
+        return self._search_docs
+
     def matches(self, kw):
-        if not self._matches_source_filter(kw):
+        if not self.matches_source(kw.source, kw.is_user_keyword(),
+                                   kw.is_library_keyword()):
             return False
         if self._contains(kw.name, self._pattern):
             return True
         return self._search_docs and self._contains(kw.doc, self._pattern)
 
-    def _matches_source_filter(self, kw):
+    def matches_source(self, source, is_user_keyword, is_library_keyword):
         if self._source_filter == ALL_KEYWORDS:
             return True
-        if self._source_filter == ALL_USER_KEYWORDS and kw.is_user_keyword():
+        if self._source_filter == ALL_USER_KEYWORDS and is_user_keyword:
             return True
-        if self._source_filter == ALL_LIBRARY_KEYWORDS and kw.is_library_keyword():
+        if self._source_filter == ALL_LIBRARY_KEYWORDS and is_library_keyword:
             return True
-        return self._source_filter == kw.source
+        return self._source_filter == source
 
     def _contains(self, string, pattern):
         return utils.normalize(pattern) in utils.normalize(string)
 
 
+class _KeywordTable(object):
+    """Keywords prepared for searching and sorting.
+
+    Normalized names and documentations of all keywords are concatenated,
+    separated by a newline that normalized texts never contain, so that a
+    search is a few `str.find` calls over one string. Matches are mapped
+    back to keywords with the start offsets of the rows.
+    """
+    _separator = '\n'
+
+    def __init__(self, keywords):
+        self.keywords = list(keywords)
+        self._rows = dict((id(kw), row) for row, kw in enumerate(self.keywords))
+        self._kinds = [(kw.source, kw.is_user_keyword(), kw.is_library_keyword())
+                       for kw in self.keywords]
+        self._names, self._name_offsets = self._concatenate(
+            utils.normalize(kw.name) for kw in self.keywords)
+        self._docs, self._doc_offsets = self._concatenate(
+            utils.normalize(kw.doc) for kw in self.keywords)
+        self._lowered = dict(((row, 'name'), kw.name.lower())
+                             for row, kw in enumerate(self.keywords))
+        self._lowered.update(((row, 'source'), kw.source.lower())
+                             for row, kw in enumerate(self.keywords))
+
+    def _concatenate(self, texts):
+        offsets = []
+        length = 0
+        parts = []
+        for text in texts:
+            offsets.append(length)
+            parts.append(text)
+            length += len(text) + len(self._separator)
+        return self._separator.join(parts), offsets
+
+    def search(self, criteria):
+        pattern = criteria.pattern
+        if pattern:
+            rows = self._rows_containing(self._names, self._name_offsets,
+                                         pattern)
+            if criteria.search_docs:
+                rows.update(self._rows_containing(self._docs,
+                                                  self._doc_offsets, pattern))
+        else:
+            rows = range(len(self.keywords))
+        return [self.keywords[row] for row in sorted(rows)
+                if criteria.matches_source(*self._kinds[row])]
+
+    def _rows_containing(self, text, offsets, pattern):
+        rows = set()
+        start = text.find(pattern)
+        while start != -1:
+            row = bisect_right(offsets, start) - 1
+            rows.add(row)
+            if row + 1 == len(offsets):
+                break
+            start = text.find(pattern, offsets[row + 1])
+        return rows
+
+    def lower(self, kw, attr_name):
+        """Returns the lower cased attribute of a keyword, cached per row."""
+        row = self._rows.get(id(kw))
+        if row is None:
+            return getattr(kw, attr_name).lower()
+        key = (row, attr_name)
+        if key not in self._lowered:
+            self._lowered[key] = getattr(kw, attr_name).lower()
+        return self._lowered[key]
+
+
 class KeywordSearchDialog(wx.Frame):
 
     def __init__(self, parent, searcher):
@@ -249,7 +325,8 @@ class KeywordSearchDialog(wx.Frame):
 
     def _populate_search(self):
         self._keywords = _KeywordData(self._plugin.search(*self._get_search_criteria()),
-                                      self._sort_order, self._get_search_text())
+                                      self._sort_order, self._get_search_text(),
+                                      self._plugin.keyword_table)
         self._update_keyword_selection()
         self._list.show_keywords(self._keywords, self._last_selected_kw)
         self.Refresh()
@@ -323,7 +400,8 @@ class _SortOrder(object):
 class _KeywordData(list):
     headers = ['Name', 'Source', 'Description']
 
-    def __init__(self, keywords, sort_order, search_criteria=None):
+    def __init__(self, keywords, sort_order, search_criteria=None, table=None):
+        self._table = table
         self.extend(self._sort(keywords, sort_order, search_criteria))
 
     def _sort(self, keywords, sort_order, search_criteria=None):
@@ -333,31 +411,29 @@ class _KeywordData(list):
 
     def _sort_by_search(self, keywords, sort_order, search_criteria):
         search_criteria = search_criteria.lower()
-        starts_with = [kw for kw in keywords if kw.name.lower().startswith(search_criteria)]
-        name_contains = [kw for kw in keywords if (search_criteria in kw.name.lower()
-                                                   and kw not in starts_with)]
-        doc_contains = [kw for kw in keywords if (search_criteria in kw.details.lower()
-                                                  and kw not in starts_with
-                                                  and kw not in name_contains)]
+        starts_with, name_contains, doc_contains = [], [], []
+        for kw in keywords:
+            name = self._value_lowerer(kw, 'name')
+            if name.startswith(search_criteria):
+                starts_with.append(kw)
+            elif search_criteria in name:
+                name_contains.append(kw)
+            elif search_criteria in self._value_lowerer(kw, 'details'):
+                doc_contains.append(kw)
         result = []
         for to_sort in (starts_with, name_contains, doc_contains):
             result.extend(self._sort_by_attr(to_sort, sort_order))
         return result
 
     def _sort_by_attr(self, keywords, sort_order):
-        return sorted(keywords, key=cmp_to_key(self._get_comparator_for(
-            self.headers[sort_order.column].lower())),
+        attr_name = self.headers[sort_order.column].lower()
+        return sorted(keywords,
+                      key=lambda kw: self._value_lowerer(kw, attr_name),
                       reverse=not sort_order.sort_up)
 
-    @staticmethod
-    def m_cmp(a, b):
-        return (a > b) - (a < b)
-
-    def _get_comparator_for(self, atrr_name):
-        return lambda kw, kw2: self.m_cmp(self._value_lowerer(kw, atrr_name),
-                                          self._value_lowerer(kw2, atrr_name))
-
     def _value_lowerer(self, kw, attr_name):
+        if self._table is not None:
+            return self._table.lower(kw, attr_name)
         return getattr(kw, attr_name).lower()
 
 
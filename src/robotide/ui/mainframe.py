@@ -26,7 +26,7 @@ from robotide.publish import RideSaveAll, RideClosing, RideSaved, PUBLISHER,\
 from robotide.ui.tagdialogs import ViewAllTagsDialog
 from robotide.ui.filedialogs import RobotFilePathDialog
 from robotide.utils import RideEventHandler
-from robotide.widgets import Dialog, ImageProvider, HtmlWindow
+from robotide.widgets import Dialog, IMAGES, HtmlWindow
 from robotide.preferences import PreferenceEditor
 
 from .actiontriggers import (MenuBar, ToolBarButton, ShortcutRegistry, _RideSearchMenuItem)
@@ -278,7 +278,7 @@ class RideFrame(with_metaclass(classmaker(), wx.Frame, RideEventHandler)):
 
         mb.take_menu_bar_into_use()
         self.CreateStatusBar()
-        self.SetIcons(ImageProvider().PROGICONS)
+        self.SetIcons(IMAGES.PROGICONS)
         # tell the manager to "commit" all the changes just made
         self._mgr.Update()
 
@@ -339,6 +339,7 @@ class RideFrame(with_metaclass(classmaker(), wx.Frame, RideEventHandler)):
         if self._allowed_to_exit():
             perspective = self._mgr.SavePerspective()
             self._application.settings.set('AUI Perspective', perspective)
+            self._application.settings.flush()
             PUBLISHER.unsubscribe(self._set_label, RideTreeSelection)
             RideClosing().publish()
             # deinitialize the frame manager
@@ -14,6 +14,8 @@
 #  limitations under the License.
 
 
+from collections import OrderedDict
+
 import wx.html
 try:
     from StringIO import StringIO
@@ -22,10 +24,12 @@ except ImportError:  # py3 <=3.6
 
 from robotide.pluginapi import Plugin, ActionInfo, TreeAwarePluginMixin
 from robotide.publish import (RideTreeSelection, RideNotebookTabChanged,
-                              RideTestCaseAdded, RideUserKeywordAdded)
+                              RideTestCaseAdded, RideUserKeywordAdded,
+                              RideDataChanged, RideSettingsChanged)
 from robotide.robotapi import TestCase, UserKeyword
 from robotide.widgets import ButtonWithHandler, Font
 from robotide.utils import Printing
+from robotide.utils.instrumentation import INSTRUMENTATION
 
 
 class PreviewPlugin(Plugin, TreeAwarePluginMixin):
@@ -43,8 +47,8 @@ class PreviewPlugin(Plugin, TreeAwarePluginMixin):
                                         position=71))
         self.subscribe(self.OnTreeSelection, RideTreeSelection)
         self.subscribe(self.OnTabChanged, RideNotebookTabChanged)
-        self.subscribe(self._update_preview, RideTestCaseAdded)
-        self.subscribe(self._update_preview, RideUserKeywordAdded)
+        self.subscribe(self.OnDataChanged, *_data_changed_topics())
+        self.subscribe(self.OnSettingsChanged, RideSettingsChanged)
         self.add_self_as_tree_aware_plugin()
 
     def disable(self):
@@ -70,11 +74,83 @@ class PreviewPlugin(Plugin, TreeAwarePluginMixin):
     def OnTabChanged(self, event):
         self._update_preview()
 
+    def OnDataChanged(self, message):
+        if self._panel:
+            self._panel.invalidate(_changed_datafile(message))
+            if isinstance(message, (RideTestCaseAdded, RideUserKeywordAdded)):
+                self._update_preview()
+
+    def OnSettingsChanged(self, message):
+        if self._panel and 'txt number of spaces' in message.keys:
+            self._panel.invalidate()
+
     def _update_preview(self, event=None):
         if self.is_focused() and self.datafile:
             self._panel.update_preview()
 
 
+def _data_changed_topics():
+    """Returns the topics of `RideDataChanged` and its subclasses.
+
+    Listeners get messages whose topic starts with the subscribed topic,
+    and topics come from class names, so subclasses like `RideItem` need
+    their own subscriptions. Topics starting with another one are left
+    out to get each message once.
+    """
+    classes = [RideDataChanged]
+    for cls in classes:
+        classes.extend(sub for sub in cls.__subclasses__()
+                       if sub not in classes)
+    topics = set(cls.topic for cls in classes)
+    return sorted(topic for topic in topics
+                  if not any(topic.startswith(other + '.')
+                             for other in topics))
+
+
+def _changed_datafile(message):
+    """Returns the datafile changed according to `message`, or None."""
+    datafile = getattr(message, 'datafile', None)
+    if datafile is None:
+        datafile = getattr(getattr(message, 'item', None),
+                           'datafile_controller', None)
+    return datafile
+
+
+class PreviewCache(object):
+    """Rendered previews by datafile and format.
+
+    Only the `max_size` most recently used previews are kept.
+    """
+    max_size = 20
+
+    def __init__(self):
+        self._previews = OrderedDict()
+
+    def get(self, datafile, file_format, render):
+        key = (datafile, file_format)
+        if key in self._previews:
+            INSTRUMENTATION.hit('PreviewCache')
+            self._previews.move_to_end(key)
+            return self._previews[key]
+        INSTRUMENTATION.miss('PreviewCache')
+        content = self._previews[key] = render()
+        if len(self._previews) > self.max_size:
+            self._previews.popitem(last=False)
+        return content
+
+    def invalidate(self, datafile=None):
+        """Forgets previews of `datafile`, or all previews if not given.
+
+        `datafile` can be a datafile controller or the model it controls.
+        """
+        if datafile is None:
+            self._previews.clear()
+            return
+        for key in list(self._previews):
+            if key[0] is datafile or key[0].data is datafile:
+                del self._previews[key]
+
+
 class PreviewPanel(wx.Panel):
     _formats = ['HTML', 'Text (Spaces)', 'Text (Pipes)']
 
@@ -85,6 +161,8 @@ class PreviewPanel(wx.Panel):
         self.SetSizer(main_sizer)
         self._format = parent.format
         self.__view = None
+        self._cache = PreviewCache()
+        self._shown = None
         self._printing = Printing(self)
         box = wx.BoxSizer(wx.HORIZONTAL)
         box.Add(self._chooser())
@@ -130,6 +208,7 @@ class PreviewPanel(wx.Panel):
         if self.__view:
             self.Sizer.Remove(self.__view)
             self.__view.Destroy()
+            self._shown = None
 
     def _create_view(self, view_class):
         view = view_class(self)
@@ -142,12 +221,24 @@ class PreviewPanel(wx.Panel):
         self._view.scroll_to_subitem(item)
 
     def update_preview(self):
-        self._view.set_content(self._get_content())
+        view = self._view
+        content = self._get_content()
+        # Selecting items of the shown file only scrolls the view.
+        if content is not self._shown:
+            view.set_content(content)
+            self._shown = content
+
+    def invalidate(self, datafile=None):
+        self._cache.invalidate(datafile)
 
     def _get_content(self):
         datafile = self._parent.datafile
         if not datafile:
             return ''
+        return self._cache.get(datafile, self._format,
+                               lambda: self._render(datafile))
+
+    def _render(self, datafile):
         output = StringIO()
         try:
             datafile.save(
@@ -146,27 +146,10 @@ class ViewAllTagsDialog(wx.Frame, listmix.ColumnSorterMixin):
         pass
 
     def _search_for_tags(self):
-        unique_tags = utils.NormalizedDict()
-        self._tags = utils.NormalizedDict()
-        self._test_cases = []
-        for test in self.frame._controller.all_testcases():
-            self._test_cases.append(test)
-            for tag in test.tags:
-                if tag.is_empty() or len(str(tag).strip()) == 0:
-                    continue
-                else:
-                    tag_name = str(tag)
-                if tag_name in unique_tags:
-                    unique_tags[tag_name].append(test)
-                    self._tags[tag_name].append(tag)
-                else:
-                    unique_tags[tag_name] = [test]
-                    self._tags[tag_name] = [tag]
-
+        self._tag_index = self.frame._controller.tag_index
         isreversed = (self.sort_state[1] != 1)
-        self.total_test_cases = len(self._test_cases)
-
-        self._results = sorted(unique_tags.items(),
+        self.total_test_cases = len(self._tag_index.tests)
+        self._results = sorted(self._tag_index.items(),
                                key=lambda item: item[0].lower(),
                                reverse=isreversed)
 
@@ -230,7 +213,7 @@ class ViewAllTagsDialog(wx.Frame, listmix.ColumnSorterMixin):
         if self._index == -1:
             return
         tests, tag_name = self._tags_list.get_tag(self._index)
-        tags_to_rename = self._tags[tag_name.lower()]
+        tags_to_rename = self._tag_index.tag_controllers(tag_name)
         name = wx.GetTextFromUser(
             message="Renaming tag '%s'." % tag_name, default_value=tag_name,
             caption='Rename').strip()
@@ -245,7 +228,7 @@ class ViewAllTagsDialog(wx.Frame, listmix.ColumnSorterMixin):
         if self._index == -1:
             return
         tests, tag_name = self._tags_list.get_tag(self._index)
-        tags_to_delete = self._tags[tag_name.lower()]
+        tags_to_delete = self._tag_index.tag_controllers(tag_name)
         if wx.MessageBox(
             "Delete a tag '%s' ?" % tag_name, caption='Confirm',
                 style=wx.YES_NO | wx.ICON_QUESTION) == wx.YES:
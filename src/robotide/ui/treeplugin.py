@@ -24,7 +24,7 @@ TREETEXTCOLOUR = Colour(0xA9, 0xA9, 0xA9)
 
 from robotide.lib.robot.utils.compat import with_metaclass
 from robotide.controller.ui.treecontroller import TreeController, \
-    TestSelectionController
+    TestSelectionController, TestResultQueue
 from robotide.context import IS_WINDOWS
 from robotide.action.actioninfo import ActionInfo
 from robotide.controller.filecontrollers import ResourceFileController
@@ -160,6 +160,7 @@ class Tree(with_metaclass(classmaker(), treemixin.DragAndDrop,
                           customtreectrl.CustomTreeCtrl,
                           utils.RideEventHandler)):
     _RESOURCES_NODE_LABEL = 'External Resources'
+    _STYLING_BATCH_SIZE = 100
 
     def __init__(self, parent, action_registerer, settings=None):
         self._checkboxes_for_tests = False
@@ -183,6 +184,8 @@ class Tree(with_metaclass(classmaker(), treemixin.DragAndDrop,
         self._clear_tree_data()
         self._editor = None
         self._execution_results = None
+        self._result_queue = TestResultQueue(
+            self._set_icons_from_execution_results)
         self._resources = []
         self.SetBackgroundColour('white')  # TODO get background color from def
         if not hasattr(self, 'OnCancelEdit'):
@@ -211,6 +214,7 @@ class Tree(with_metaclass(classmaker(), treemixin.DragAndDrop,
         self.Bind(wx.EVT_TREE_ITEM_ACTIVATED, self.OnItemActivated)
         self.Bind(customtreectrl.EVT_TREE_ITEM_CHECKED, self.OnTreeItemChecked)
         self.Bind(wx.EVT_TREE_ITEM_COLLAPSING, self.OnTreeItemCollapsing)
+        self.Bind(wx.EVT_TREE_DELETE_ITEM, self.OnDeleteItem)
         self.Bind(wx.EVT_CLOSE, self.OnClose)
 
     def OnDoubleClick(self, event):
@@ -270,7 +274,7 @@ class Tree(with_metaclass(classmaker(), treemixin.DragAndDrop,
             PUBLISHER.subscribe(listener, topic)
 
     def _mark_excludes(self, message):
-        tree = self._controller.find_node_by_controller(message.old_controller)
+        tree = self._find_datafile_node(message.old_controller)
         self._render_datafile(self.GetItemParent(tree), message.new_controller)
         self._remove_datafile_node(tree)
 
@@ -301,13 +305,26 @@ class Tree(with_metaclass(classmaker(), treemixin.DragAndDrop,
             return wx.LIGHT_GREY
 
     def _testing_started(self, message):
+        self._result_queue.clear()
         self._for_all_drawn_tests(
             self._root, lambda t: self.SetItemImage(t, ROBOT_IMAGE_INDEX))
         self._execution_results = message.results
         self._images.set_execution_results(message.results)
 
     def _test_result(self, message):
-        wx.CallAfter(self._set_icon_from_execution_results, message.item)
+        self._result_queue.add(message.item)
+
+    def _set_icons_from_execution_results(self, controllers):
+        self.Freeze()
+        try:
+            for controller in controllers[:-1]:
+                node = self._controller.find_node_by_controller(controller)
+                if node:
+                    self.SetItemImage(node, self._get_icon_index_for(controller))
+            # Only the latest change moves the animation and the view.
+            self._set_icon_from_execution_results(controllers[-1])
+        finally:
+            self.Thaw()
 
     def _set_icon_from_execution_results(self, controller):
         node = self._controller.find_node_by_controller(controller)
@@ -364,6 +381,9 @@ class Tree(with_metaclass(classmaker(), treemixin.DragAndDrop,
         self._root = self.AddRoot('')
         self._resource_root = self._create_resource_root()
         self._datafile_nodes = []
+        self._lazy_nodes = set()
+        self._pending_styling = []
+        self._virtual = False
         self._resources = []
 
     def _create_resource_root(self):
@@ -374,15 +394,23 @@ class Tree(with_metaclass(classmaker(), treemixin.DragAndDrop,
         handler = ResourceRootHandler(model, self, self._resource_root,
                                       self._controller.settings)
         self.SetPyData(self._resource_root, handler)
+        self._controller.register_node(self._resource_root, model)
+        self._virtual = self._use_virtual_tree(model)
         if model.data:
             self._render_datafile(self._root, model.data, 0)
         for res in model.external_resources:
             if not res.parent:
                 self._render_datafile(self._resource_root, res)
 
+    def _use_virtual_tree(self, model):
+        settings = self._controller.settings
+        threshold = settings.get('virtual tree threshold', 0) if settings \
+            else 0
+        return 0 < threshold < len(model.datafiles)
+
     def _resource_added(self, message):
         ctrl = message.datafile
-        if self._controller.find_node_by_controller(ctrl):
+        if self._find_datafile_node(ctrl):
             return
 
         parent = None
@@ -406,7 +434,7 @@ class Tree(with_metaclass(classmaker(), treemixin.DragAndDrop,
         self.select_controller_node(message.item)
 
     def select_controller_node(self, controller):
-        self.SelectItem(self._controller.find_node_by_controller(controller))
+        self.SelectItem(self._find_datafile_node(controller))
 
     def _suite_added(self, message):
         self.add_datafile(message.parent, message.suite)
@@ -420,6 +448,12 @@ class Tree(with_metaclass(classmaker(), treemixin.DragAndDrop,
             self._expand_and_render_children(self._datafile_nodes[0])
 
     def _render_datafile(self, parent_node, controller, index=None):
+        if parent_node in self._lazy_nodes:
+            # The new child is already among the children rendered now.
+            self._render_lazy_datafiles(parent_node)
+            node = self._controller.find_node_by_controller(controller)
+            if node:
+                return node
         node = self._create_node_with_handler(parent_node, controller, index)
         if not node:
             return None
@@ -428,8 +462,57 @@ class Tree(with_metaclass(classmaker(), treemixin.DragAndDrop,
         self._datafile_nodes.append(node)
         self.SetItemHasChildren(node, True)
 
-        for child in controller.children:
+        if self._virtual and controller.children:
+            # In a virtual tree, child datafiles are rendered only when the
+            # node is expanded or one of them is looked up.
+            self._lazy_nodes.add(node)
+        else:
+            for child in controller.children:
+                self._render_datafile(node, child)
+        return node
+
+    def _render_lazy_datafiles(self, node):
+        if node not in self._lazy_nodes:
+            return
+        self._lazy_nodes.discard(node)
+        for child in self._controller.get_handler(node).controller.children:
             self._render_datafile(node, child)
+
+    def _find_lazy_datafile(self, predicate):
+        """Returns a not yet rendered datafile matching `predicate`, or None.
+        """
+        for node in list(self._lazy_nodes):
+            controller = self._controller.get_handler(node).controller
+            for datafile in controller.iter_datafiles():
+                if datafile is not controller and predicate(datafile):
+                    return datafile
+        return None
+
+    def _render_path_to(self, controller):
+        """Renders the lazily rendered ancestors of `controller`.
+
+        The ancestors are rendered outermost first, so each level of the
+        path is rendered once. Returns True if anything was rendered.
+        """
+        if controller is None or not self._lazy_nodes:
+            return False
+        ancestors = []
+        parent = getattr(controller, 'parent', None)
+        while parent is not None:
+            ancestors.append(parent)
+            parent = getattr(parent, 'parent', None)
+        rendered = False
+        for ancestor in reversed(ancestors):
+            node = self._controller.find_node_by_controller(ancestor)
+            if node is not None and node in self._lazy_nodes:
+                self._render_lazy_datafiles(node)
+                rendered = True
+        return rendered
+
+    def _find_datafile_node(self, controller):
+        node = self._controller.find_node_by_controller(controller)
+        if node is None and self._render_path_to(controller):
+            node = self._controller.find_node_by_controller(controller)
         return node
 
     def _normalize(self, path):
@@ -451,20 +534,43 @@ class Tree(with_metaclass(classmaker(), treemixin.DragAndDrop,
         with_checkbox = (handler_class == TestCaseHandler and self._checkboxes_for_tests)
         node = self._create_node(parent_node, controller.display_name, self._images[controller],
                                  index, with_checkbox=with_checkbox)
-        if isinstance(controller, ResourceFileController) and not controller.is_used():
-                self.SetItemTextColour(node, TREETEXTCOLOUR)  # wxPython3 hack
         action_handler = handler_class(controller, self, node, self._controller.settings)
         self.SetPyData(node, action_handler)
+        self._controller.register_node(node, controller)
 
         # if we have a TestCase node we have to make sure that
         # we retain the checked state
         if (handler_class == TestCaseHandler and self._checkboxes_for_tests) \
                 and self._test_selection_controller.is_test_selected(controller):
             self.CheckItem(node, True)
-        if controller.is_excluded():
-            self._set_item_excluded(node)
+        self._style_later(node, controller)
         return node
 
+    def _style_later(self, node, controller):
+        """Schedules resource usage and exclusion styling of a node.
+
+        Finding out whether a resource is used may need resolving imports of
+        the whole project, so styling is done in batches after the nodes are
+        shown instead of while they are created.
+        """
+        if not self._pending_styling:
+            wx.CallAfter(self._style_pending_nodes)
+        self._pending_styling.append((node, controller))
+
+    def _style_pending_nodes(self):
+        batch = self._pending_styling[:self._STYLING_BATCH_SIZE]
+        del self._pending_styling[:self._STYLING_BATCH_SIZE]
+        if self._pending_styling:
+            wx.CallAfter(self._style_pending_nodes)
+        for node, controller in batch:
+            if self._controller.find_node_by_controller(controller) is not node:
+                continue  # Node has been removed meanwhile
+            if isinstance(controller, ResourceFileController) and \
+                    not controller.is_used():
+                self.SetItemTextColour(node, TREETEXTCOLOUR)  # wxPython3 hack
+            if controller.is_excluded():
+                self._set_item_excluded(node)
+
     def set_checkboxes_for_tests(self):
         self._checkboxes_for_tests = True
 
@@ -474,6 +580,7 @@ class Tree(with_metaclass(classmaker(), treemixin.DragAndDrop,
         self.Expand(node)
 
     def _render_children(self, node):
+        self._render_lazy_datafiles(node)
         handler = self._controller.get_handler(node)
         if not handler or not handler.can_be_rendered:
             return
@@ -584,7 +691,7 @@ class Tree(with_metaclass(classmaker(), treemixin.DragAndDrop,
 
     def _filename_changed(self, message):
         df = message.datafile
-        node = self._controller.find_node_by_controller(df)
+        node = self._find_datafile_node(df)
         if not node:
             raise AssertionError('No node found with controller "%s"' % df)
         wx.CallAfter(self.SetItemText, node, df.display_name)
@@ -598,6 +705,7 @@ class Tree(with_metaclass(classmaker(), treemixin.DragAndDrop,
             return
         parent = self.GetItemParent(node)
         self._controller.mark_node_dirty(parent)
+        self._controller.unregister_node(node)
         if self.IsSelected(node):
             wx.CallAfter(self.SelectItem, parent)
         wx.CallAfter(self.Delete, node)
@@ -645,6 +753,9 @@ class Tree(with_metaclass(classmaker(), treemixin.DragAndDrop,
         for node in self._datafile_nodes:
             if self._controller.get_handler(node).item == datafile:
                 return node
+        if datafile is not None and self._render_path_to(
+                self._find_lazy_datafile(lambda df: df.data == datafile)):
+            return self._get_datafile_node(datafile)
         return None
 
     def get_selected_datafile(self):
@@ -769,6 +880,8 @@ class Tree(with_metaclass(classmaker(), treemixin.DragAndDrop,
         for node in self._datafile_nodes:
             if self.GetItemPyData(node).controller == controller:
                 return node
+        if self._render_path_to(controller):
+            return self._get_data_controller_node(controller)
         return None
 
     def _click_on_item(self, item, flags):
@@ -820,6 +933,12 @@ class Tree(with_metaclass(classmaker(), treemixin.DragAndDrop,
         self._hide_item(item)
         event.Skip()
 
+    def OnDeleteItem(self, event):
+        # Sent for every removed node, also for children of removed nodes.
+        self._controller.unregister_node(event.GetItem())
+        self._lazy_nodes.discard(event.GetItem())
+        event.Skip()
+
     def _hide_item(self, item):
         for item in item.GetChildren():
             itemwindow = item.GetWindow()
@@ -16,7 +16,7 @@
 from robotide.ui.searchdots import DottedSearch
 
 from robotide.widgets import (Dialog, VirtualList, VerticalSizer, ImageList,
-                              ImageProvider, ButtonWithHandler)
+                              IMAGES, ButtonWithHandler)
 import wx
 from robotide.widgets.list import ListModel
 
@@ -86,11 +86,10 @@ class _UsagesListModel(ListModel):
 
     def _create_image_list(self):
         images = ImageList(16, 16)
-        provider = ImageProvider()
-        images.add(provider.TESTCASEIMG)
-        images.add(provider.KEYWORDIMG)
-        images.add(provider.DATAFILEIMG)
-        images.add(provider.DATADIRIMG)
+        images.add(IMAGES.TESTCASEIMG)
+        images.add(IMAGES.KEYWORDIMG)
+        images.add(IMAGES.DATAFILEIMG)
+        images.add(IMAGES.DATADIRIMG)
         self._images = images
 
     @property
@@ -0,0 +1,169 @@
+#  Copyright 2008-2015 Nokia Networks
+#  Copyright 2016-     Robot Framework Foundation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import inspect
+import json
+import math
+import time
+from functools import wraps
+from threading import Lock
+
+
+class Probe(object):
+    """Call count, latencies and cache hits of one instrumented operation.
+
+    Only the latest `samples` latencies are kept for percentiles.
+    """
+
+    def __init__(self, name, samples=1000):
+        self.name = name
+        self.calls = 0
+        self.total = 0.0
+        self.hits = 0
+        self.misses = 0
+        self._samples = []
+        self._max_samples = samples
+
+    def record(self, seconds):
+        if len(self._samples) < self._max_samples:
+            self._samples.append(seconds)
+        else:
+            self._samples[self.calls % self._max_samples] = seconds
+        self.calls += 1
+        self.total += seconds
+
+    def percentile(self, percent):
+        """Returns the latency below which `percent` of the samples are."""
+        if not self._samples:
+            return None
+        samples = sorted(self._samples)
+        index = int(math.ceil(percent / 100.0 * len(samples))) - 1
+        return samples[max(index, 0)]
+
+    @property
+    def hit_rate(self):
+        lookups = self.hits + self.misses
+        return float(self.hits) / lookups if lookups else None
+
+    def as_dict(self):
+        return {'name': self.name, 'calls': self.calls, 'total': self.total,
+                'p50': self.percentile(50), 'p95': self.percentile(95),
+                'hits': self.hits, 'misses': self.misses,
+                'hit_rate': self.hit_rate}
+
+
+class Instrumentation(object):
+    """Opt-in timers and counters around hot paths of RIDE.
+
+    Functions are decorated with `timed` and caches report their lookups
+    with `hit` and `miss`. Nothing is recorded until `enable` is called,
+    and when disabled the only cost is checking the `enabled` flag.
+    Timings of generator functions cover the whole iteration, including
+    the time the caller spends between items. Gauges report current values,
+    like memory use, and are read only when they are shown or exported.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self._probes = {}
+        self._gauges = {}
+        self._lock = Lock()
+
+    def enable(self):
+        self.enabled = True
+
+    def disable(self):
+        self.enabled = False
+
+    def reset(self):
+        with self._lock:
+            self._probes = {}
+
+    def probe(self, name):
+        probe = self._probes.get(name)
+        if probe is None:
+            with self._lock:
+                probe = self._probes.setdefault(name, Probe(name))
+        return probe
+
+    @property
+    def probes(self):
+        return sorted(self._probes.values(), key=lambda probe: probe.name)
+
+    def gauge(self, name, function):
+        """Registers `function` returning the current value of `name`."""
+        self._gauges[name] = function
+
+    @property
+    def gauges(self):
+        return [(name, self._gauges[name]()) for name in sorted(self._gauges)]
+
+    def record(self, name, seconds):
+        if self.enabled:
+            probe = self.probe(name)
+            with self._lock:
+                probe.record(seconds)
+
+    def hit(self, name):
+        if self.enabled:
+            self.probe(name).hits += 1
+
+    def miss(self, name):
+        if self.enabled:
+            self.probe(name).misses += 1
+
+    def timed(self, name):
+        """Decorator recording the latency of each call under `name`."""
+        def decorator(function):
+            if inspect.isgeneratorfunction(function):
+                return self._timed_generator(name, function)
+
+            @wraps(function)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return function(*args, **kwargs)
+                start = time.perf_counter()
+                try:
+                    return function(*args, **kwargs)
+                finally:
+                    self.record(name, time.perf_counter() - start)
+            return wrapper
+        return decorator
+
+    def _timed_generator(self, name, function):
+        @wraps(function)
+        def wrapper(*args, **kwargs):
+            if not self.enabled:
+                return (yield from function(*args, **kwargs))
+            start = time.perf_counter()
+            try:
+                return (yield from function(*args, **kwargs))
+            finally:
+                self.record(name, time.perf_counter() - start)
+        return wrapper
+
+    def snapshot(self):
+        return {'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+                'enabled': self.enabled,
+                'probes': [probe.as_dict() for probe in self.probes],
+                'gauges': dict(self.gauges)}
+
+    def write_json(self, path):
+        with open(path, 'w') as outfile:
+            json.dump(self.snapshot(), outfile, indent=2)
+
+
+INSTRUMENTATION = Instrumentation()
+timed = INSTRUMENTATION.timed
@@ -17,7 +17,7 @@ from .button import ButtonWithHandler
 from .dialog import Dialog, HtmlDialog
 from .font import Font
 from .htmlwindow import HtmlWindow
-from .images import ImageList, ImageProvider
+from .images import IMAGES, ImageList, ImageProvider
 from .popupmenu import PopupCreator, PopupMenu, PopupMenuItem, PopupMenuItems
 from .label import Label, HeaderLabel, HelpLabel
 from .list import VirtualList
@@ -27,43 +27,69 @@ class ImageList(wx.ImageList):
 
 
 class ImageProvider(object):
+    """Icons of RIDE, decoded lazily on first use.
+
+    Decoded bitmaps are cached on the class, so all providers share them
+    and each image is decoded at most once. Use the shared `IMAGES`
+    provider instead of creating new ones.
+    """
     _BASE = os.path.dirname(__file__)
+    _SOURCES = {
+        'TESTCASEIMG': 'robot.png',
+        'KEYWORDIMG': 'process.png',
+        'DATADIRIMG': wx.ART_FOLDER,
+        'DATAFILEIMG': wx.ART_NORMAL_FILE,
+        'REPORTIMG': 'report.png',
+        'REFRESH_ALL': 'database_refresh.png',
+        'KW_SEARCH_ICON': 'kw_search_button.png',
+        'TEST_SEARCH_ICON': 'test_search_button.png',
+        'TOOLBAR_PLAY': 'control_play.png',
+        'TOOLBAR_STOP': 'control_stop.png',
+        'TOOLBAR_PAUSE': 'control_pause.png',
+        'TOOLBAR_CONTINUE': 'control_play.png',
+        'TOOLBAR_NEXT': 'control_fastforward.png',
+        'SWITCH_FIELDS_ICON': 'switch.png'
+    }
+    _cache = {}
 
     def __init__(self, size=(16, 16)):
         self._size = size
-        self.TESTCASEIMG = self._load_image('robot.png')
-        self.KEYWORDIMG = self._load_image('process.png')
-        self.DATADIRIMG = self._img_from_art_provider(wx.ART_FOLDER)
-        self.DATAFILEIMG = self._img_from_art_provider(wx.ART_NORMAL_FILE)
-        self.PROGICONS = self._load_prog_icons()
-        self.REPORTIMG = self._load_image('report.png')
-        self.REFRESH_ALL = self._load_image('database_refresh.png')
-        self.KW_SEARCH_ICON = self._load_image('kw_search_button.png')
-        self.TEST_SEARCH_ICON = self._load_image('test_search_button.png')
-        self.TOOLBAR_PLAY = self._load_image('control_play.png')
-        self.TOOLBAR_STOP = self._load_image('control_stop.png')
-        self.TOOLBAR_PAUSE = self._load_image('control_pause.png')
-        self.TOOLBAR_CONTINUE = self._load_image('control_play.png')
-        self.TOOLBAR_NEXT = self._load_image('control_fastforward.png')
-        self.SWITCH_FIELDS_ICON = self._load_image('switch.png')
-        self._build_icons()
-
-    def _build_icons(self):
-        self._icons = {}
-        for name in dir(self):
-            value = getattr(self, name)
-            if isinstance(value, wx.Bitmap):
-                self._icons[name] = getattr(self, name)
+
+    def __getattr__(self, name):
+        if name not in self._SOURCES:
+            raise AttributeError(name)
+        return self.load(self._SOURCES[name])
+
+    @property
+    def PROGICONS(self):
+        key = ('robot.ico', None)
+        if key not in self._cache:
+            self._cache[key] = self._load_prog_icons()
+        return self._cache[key]
 
     def get_image_by_name(self, name):
-        return self._icons.get(name, None)
+        if name not in self._SOURCES:
+            return None
+        return self.load(self._SOURCES[name])
+
+    def load(self, source):
+        """Returns bitmap of an image file or a wx art provider id."""
+        key = (source, self._size)
+        if key not in self._cache:
+            if source.startswith('wx'):
+                self._cache[key] = self._img_from_art_provider(source)
+            else:
+                self._cache[key] = self._load_image(source)
+        return self._cache[key]
 
     def _load_image(self, name):
         path = self._get_img_path(name)
+        image_type = wx.BITMAP_TYPE_GIF if name.endswith('.gif') \
+            else wx.BITMAP_TYPE_PNG
         noLog = wx.LogNull()
         # Suppress warnings generated by recent libpng versions.
         # The png files themselves are most likely ok.
-        img = wx.Image(path, wx.BITMAP_TYPE_PNG).ConvertToBitmap()
+        img = wx.Image(path, image_type).ConvertToBitmap()
         del noLog
         return img
 
@@ -77,3 +103,6 @@ class ImageProvider(object):
         icons = wx.IconBundle()
         icons.AddIcon(self._get_img_path('robot.ico'), wx.BITMAP_TYPE_ANY)
         return icons
+
+
+IMAGES = ImageProvider()
@@ -0,0 +1,79 @@
+#  Copyright 2008-2015 Nokia Networks
+#  Copyright 2016-     Robot Framework Foundation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import os
+import subprocess
+import sys
+import unittest
+
+# Modules that RIDE must not import when it starts, only on first use.
+LAZY_MODULES = ['pygments', 'robotide.editor.robotframeworklexer',
+                'wx.lib.ClickableHtmlWindow']
+# Environment variable that enables checking the time spent in RIDE's own
+# modules, including the bundled Robot Framework, when importing the
+# application. Its value is the limit in seconds, for example 1.5 on a
+# machine where the import measured 0.57-0.75 s with Python 3.8. Time spent
+# in wx and other dependencies is excluded, as it depends on their versions.
+# An absolute limit depends on the machine, so the check is opt-in.
+IMPORT_TIME_BUDGET = 'RIDE_IMPORT_TIME_BUDGET'
+
+
+def import_times(module):
+    """Returns import times in seconds of modules imported by importing
+    `module` in a new interpreter, or None if it cannot be imported.
+
+    The time of a module excludes the time of modules it imports."""
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+    process = subprocess.run([sys.executable, '-X', 'importtime', '-c',
+                              'import %s' % module], env=env,
+                             stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                             universal_newlines=True)
+    if process.returncode != 0:
+        return None
+    times = {}
+    for line in process.stderr.splitlines():
+        if line.startswith('import time:') and '|' in line:
+            own, _, name = line[len('import time:'):].split('|')
+            if own.strip().isdigit():
+                times[name.strip()] = int(own) / 1e6
+    return times
+
+
+class TestImportTime(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.times = import_times('robotide.application')
+
+    def setUp(self):
+        if self.times is None:
+            self.skipTest('Importing RIDE failed in this environment.')
+
+    def test_heavy_modules_are_imported_on_first_use(self):
+        imported = [name for name in LAZY_MODULES if name in self.times]
+        self.assertEqual(imported, [])
+
+    def test_import_time_is_within_budget(self):
+        budget = os.environ.get(IMPORT_TIME_BUDGET)
+        if not budget:
+            self.skipTest('Set %s to check the import time.'
+                          % IMPORT_TIME_BUDGET)
+        own_time = sum(time for name, time in self.times.items()
+                       if name.split('.')[0] == 'robotide')
+        self.assertLess(own_time, float(budget))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -14,6 +14,8 @@
 #  limitations under the License.
 
 import os
+import shutil
+import tempfile
 import unittest
 from nose.tools import assert_true, assert_false
 
@@ -33,6 +35,7 @@ robotide.context.LOG = LOGGER
 
 
 from robotide.application.pluginloader import PluginLoader
+from robotide.application.pluginconnector import LazyPluginConnector
 from robotide.log import LogPlugin
 from utest.resources import FakeApplication, FakeSettings
 
@@ -89,6 +92,65 @@ class TestPluginLoader(unittest.TestCase):
         return None
 
 
+class TestPluginManifest(unittest.TestCase):
+
+    def setUp(self):
+        self.plugins_dir = tempfile.mkdtemp()
+        self.module_path = os.path.join(self.plugins_dir, 'plugin_module.py')
+        shutil.copy(os.path.join(os.path.dirname(__file__),
+                                 'plugins_for_loader', 'plugin_module.py'),
+                    self.module_path)
+        self.manifest_path = os.path.join(tempfile.mkdtemp(), 'manifest.json')
+        self.app = FakeApplication()
+        self.app.settings = FakeSettings()
+
+    def tearDown(self):
+        shutil.rmtree(self.plugins_dir)
+        shutil.rmtree(os.path.dirname(self.manifest_path))
+
+    def _load(self):
+        loader = PluginLoader(self.app, [self.plugins_dir], [],
+                              manifest_path=self.manifest_path)
+        self.app.get_plugins = lambda: loader.plugins
+        return loader
+
+    def test_first_load_imports_plugins_and_writes_manifest(self):
+        loader = self._load()
+        self.assertEqual(sorted(p.name for p in loader.plugins),
+                         ['Example Plugin 1', 'Example Plugin 2'])
+        self.assertFalse(any(isinstance(p, LazyPluginConnector)
+                             for p in loader.plugins))
+        self.assertTrue(os.path.isfile(self.manifest_path))
+
+    def test_plugins_from_manifest_are_imported_when_enabled(self):
+        self._load()
+        loader = self._load()
+        self.assertTrue(all(isinstance(p, LazyPluginConnector)
+                            for p in loader.plugins))
+        self.assertEqual(loader._modules, {})
+        loader.enable_plugins()
+        self.assertTrue(all(p.loaded and p.enabled for p in loader.plugins))
+        self.assertEqual(list(loader._modules), [self.module_path])
+
+    def test_disabled_plugins_are_not_imported(self):
+        self._load()
+        for name in ['Example Plugin 1', 'Example Plugin 2']:
+            self.app.settings['Plugins'].add_section(name).set(
+                '_enabled', False)
+        loader = self._load()
+        loader.enable_plugins()
+        self.assertFalse(any(p.enabled for p in loader.plugins))
+        self.assertEqual(loader._modules, {})
+
+    def test_changed_plugin_file_is_imported_again(self):
+        self._load()
+        with open(self.module_path, 'a') as module:
+            module.write('\n# changed\n')
+        loader = self._load()
+        self.assertFalse(any(isinstance(p, LazyPluginConnector)
+                             for p in loader.plugins))
+
+
 if __name__ == '__main__':
     unittest.main()
 
@@ -0,0 +1,86 @@
+#  Copyright 2008-2015 Nokia Networks
+#  Copyright 2016-     Robot Framework Foundation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import os
+import sys
+import unittest
+
+from robotide.application.robotinstallation import RobotInstallationFinder
+
+
+class _ImmediateFinder(RobotInstallationFinder):
+
+    def __init__(self, settings, result):
+        RobotInstallationFinder.__init__(
+            self, settings, call_after=lambda f, *args: f(*args))
+        self._result = result
+        self.probes = 0
+
+    def find(self, callback):
+        # Probe synchronously to keep the test deterministic.
+        installation = self._get_cached()
+        if installation:
+            callback(installation)
+        else:
+            self._probe(callback)
+
+    def _run_probe(self):
+        self.probes += 1
+        return self._result
+
+
+class RobotInstallationFinderTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.settings = {}
+        self.found = []
+        self.robot_file = os.path.abspath(__file__)
+
+    def _find(self, result=None):
+        finder = _ImmediateFinder(self.settings, result)
+        finder.find(self.found.append)
+        return finder
+
+    def test_found_installation_is_cached(self):
+        finder = self._find((self.robot_file, '3.2'))
+        self.assertEqual(finder.probes, 1)
+        self.assertEqual(self.found[0].version, '3.2')
+        self.assertEqual(self.found[0].path, os.path.dirname(self.robot_file))
+        finder = self._find()
+        self.assertEqual(finder.probes, 0)
+        self.assertEqual(self.found[1].version, '3.2')
+
+    def test_missing_installation_is_not_cached(self):
+        self._find(None)
+        self.assertEqual(self.found, [None])
+        finder = self._find(None)
+        self.assertEqual(finder.probes, 1)
+
+    def test_cache_is_invalid_when_interpreter_changes(self):
+        self._find((self.robot_file, '3.2'))
+        self.settings['robot installation'][0] = sys.executable + 'x'
+        finder = self._find((self.robot_file, '3.2'))
+        self.assertEqual(finder.probes, 1)
+
+    def test_cache_is_invalid_when_robot_changes(self):
+        self._find((self.robot_file, '3.2'))
+        self.settings['robot installation'][3] -= 1
+        finder = self._find((self.robot_file, '4.0'))
+        self.assertEqual(finder.probes, 1)
+        self.assertEqual(self.found[1].version, '4.0')
+
+
+if __name__ == '__main__':
+    unittest.main()
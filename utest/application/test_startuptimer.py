@@ -0,0 +1,62 @@
+#  Copyright 2008-2015 Nokia Networks
+#  Copyright 2016-     Robot Framework Foundation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import json
+import os
+import tempfile
+import unittest
+
+from robotide.application.startuptimer import StartupTimer
+
+
+class StartupTimerTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.timer = StartupTimer()
+        with self.timer.phase('Plugins'):
+            sum(range(10000))
+        self.timer.add('Log', 0.002, 0.001, parent='Plugins')
+
+    def test_phases_are_recorded_in_order(self):
+        self.assertEqual([p.name for p in self.timer.phases],
+                         ['Plugins', 'Log'])
+        self.assertTrue(self.timer.phases[0].wall >= 0)
+        self.assertEqual(self.timer.phases[1].parent, 'Plugins')
+
+    def test_failing_phase_is_recorded(self):
+        with self.assertRaises(ZeroDivisionError):
+            with self.timer.phase('Broken'):
+                1 / 0
+        self.assertEqual(self.timer.phases[-1].name, 'Broken')
+
+    def test_report(self):
+        lines = self.timer.report().splitlines()
+        self.assertTrue(lines[1].startswith('  Plugins: '))
+        self.assertEqual(lines[2], '    Log: 2.0 ms / 1.0 ms')
+        self.assertTrue(lines[3].startswith('  Total: '))
+
+    def test_write_json(self):
+        path = os.path.join(tempfile.mkdtemp(), 'times.json')
+        self.timer.write_json(path)
+        with open(path) as infile:
+            data = json.load(infile)
+        self.assertEqual([p['name'] for p in data['phases']],
+                         ['Plugins', 'Log'])
+        self.assertTrue(data['total']['wall'] >= data['phases'][0]['wall'])
+        os.remove(path)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,308 @@
+#!/usr/bin/env python
+#  Copyright 2008-2015 Nokia Networks
+#  Copyright 2016-     Robot Framework Foundation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""Headless benchmarks of RIDE hot paths.
+
+The benchmarks run against a project generated with rfgen.py. Generated
+projects are cached in the temporary directory by size and seed, so
+repeated runs measure the same data.
+
+Usage:  python benchmarks.py [options]
+
+Options:
+  --size 100|1000|10000  Approximate number of files in the project.
+  --seed N               Seed given to rfgen.py. Default is 1.
+  --repeat N             Times each benchmark is run. Default is 3.
+  --only NAME            Run only the named benchmark. Can be repeated.
+  --output PATH          Write results as JSON to PATH.
+  --baseline PATH        Compare results with earlier JSON results. Default
+                         is benchmark_baseline.json next to this script,
+                         measured with the default size and seed. Use
+                         NONE to skip the comparison.
+  --tolerance RATIO      Allowed slowdown compared to the baseline.
+                         Default is 0.2, i.e. 20%.
+
+Exits with status 1 if any benchmark is slower than the baseline allows.
+Timings depend on the machine, so regenerate the baseline with --output
+when benchmarking on a different one.
+"""
+
+import json
+import optparse
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+
+from robotide.controller import Project
+from robotide.controller.ctrlcommands import FindOccurrences, NullObserver
+from robotide.controller.project import Serializer
+from robotide.lib.robot.parsing.datarow import DataRow
+from robotide.lib.robot.parsing.robotreader import RobotReader
+from robotide.namespace import Namespace
+from robotide.spec.librarymanager import LibraryManager
+from robotide.usages.commands import FindUsages
+
+from resources import FakeSettings
+
+RFGEN = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..',
+                     'rfgen.py')
+BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                        'benchmark_baseline.json')
+SIZES = (100, 1000, 10000)
+SAMPLE_SIZE = 500
+
+
+def generate_project(files, seed):
+    """Returns the test directory of a generated project of about `files`."""
+    root = os.path.join(tempfile.gettempdir(),
+                        'ride-benchmark-%d-%d' % (files, seed))
+    testdir = os.path.join(root, 'testdir')
+    if not os.path.isfile(os.path.join(root, 'seed.txt')):
+        libs = max(2, files // 50)
+        resources = max(1, files // 10)
+        suites = files - libs - resources
+        subprocess.check_call(
+            [sys.executable, RFGEN, '--dir', root, '--seed', str(seed),
+             '--libs', str(libs), '--resourcefiles', str(resources),
+             '--suites', str(suites), '--tests', '10', '--testdepth', '5'],
+            stdout=subprocess.DEVNULL)
+    return testdir
+
+
+def sample(items, size=SAMPLE_SIZE):
+    """Returns at most `size` items evenly spread over `items`."""
+    items = list(items)
+    if len(items) <= size:
+        return items
+    step = len(items) / float(size)
+    return [items[int(index * step)] for index in range(size)]
+
+
+class _Logger(object):
+
+    def error(self, message):
+        sys.stderr.write(message + '\n')
+
+
+class BenchmarkContext(object):
+
+    def __init__(self, path):
+        self.path = path
+        self.namespace = Namespace(FakeSettings())
+        self.project = self.load(self.namespace)
+
+    def load(self, namespace=None):
+        library_manager = LibraryManager(':memory:')
+        library_manager.create_database()
+        namespace = namespace or Namespace(FakeSettings())
+        project = Project(namespace, settings=namespace._settings,
+                          library_manager=library_manager)
+        project.load_data(self.path, NullObserver())
+        return project
+
+    def close(self):
+        self.project.close()
+
+    @property
+    def datafiles(self):
+        return [df for df in self.project.datafiles
+                if df.data.source and os.path.isfile(df.data.source)]
+
+    @property
+    def tests(self):
+        return [test for df in self.datafiles for test in df.tests]
+
+    @property
+    def user_keywords(self):
+        return [kw for df in self.datafiles for kw in df.keywords]
+
+    def steps(self):
+        for test in self.tests:
+            for step in test.steps:
+                yield test, step
+
+
+def bench_project_load(context):
+    context.load().close()
+
+
+def bench_keyword_resolution(context):
+    for test, step in sample(context.steps(), 5 * SAMPLE_SIZE):
+        if step.keyword:
+            context.namespace.find_keyword(test.datafile, step.keyword)
+
+
+def bench_suggestions(context):
+    for test in sample(context.tests, SAMPLE_SIZE // 10):
+        for start in ('', 'Lo', 'Res', '${'):
+            context.namespace.get_suggestions_for(test, start)
+
+
+def bench_find_occurrences(context):
+    for keyword in sample(context.user_keywords, 10):
+        for _ in keyword.execute(FindOccurrences(keyword.name)):
+            pass
+
+
+def bench_unused_keywords(context):
+    # Same check as ReviewRunner._is_unused of the review dialog.
+    for keyword in sample(context.user_keywords, 20):
+        next(keyword.execute(
+            FindUsages(keyword.name, keyword_info=keyword.info)), None)
+
+
+def bench_serialization(context):
+    serializer = Serializer(FakeSettings(), _Logger())
+    for datafile in sample(context.datafiles, 50):
+        serializer.serialize_file(datafile)
+
+
+def bench_tokenizing(context):
+    reader = RobotReader()
+    for datafile in context.datafiles:
+        with open(datafile.data.source) as source:
+            for line in source:
+                DataRow(reader.tokenize(line.rstrip()))
+
+
+def bench_lexing(context):
+    try:
+        # Like in RIDE itself, the UI must be imported before the editor
+        # to avoid a circular import.
+        import robotide.ui
+        from robotide.editor.robotframeworklexer import RobotFrameworkLexer
+    except ImportError as error:
+        raise _Skipped('Importing the lexer failed: %s' % error)
+    lexer = RobotFrameworkLexer()
+    for datafile in sample(context.datafiles, 50):
+        with open(datafile.data.source) as source:
+            for _ in lexer.get_tokens_unprocessed(source.read()):
+                pass
+
+
+def bench_cell_info(context):
+    for _, step in sample(context.steps(), 5 * SAMPLE_SIZE):
+        for col in range(len(step.as_list()) + 1):
+            step.get_cell_info(col)
+
+
+BENCHMARKS = [('project load', bench_project_load),
+              ('keyword resolution', bench_keyword_resolution),
+              ('suggestions', bench_suggestions),
+              ('find occurrences', bench_find_occurrences),
+              ('unused keywords', bench_unused_keywords),
+              ('serialization', bench_serialization),
+              ('tokenizing', bench_tokenizing),
+              ('lexing', bench_lexing),
+              ('cell info', bench_cell_info)]
+
+
+class _Skipped(Exception):
+    pass
+
+
+def run_benchmark(function, context, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function(context)
+        times.append(time.perf_counter() - start)
+    times.sort()
+    return {'min': times[0], 'median': times[len(times) // 2],
+            'runs': len(times)}
+
+
+def run(size, seed, repeat, only=None):
+    path = generate_project(size, seed)
+    context = BenchmarkContext(path)
+    results = {}
+    try:
+        for name, function in BENCHMARKS:
+            if only and name not in only:
+                continue
+            try:
+                results[name] = run_benchmark(function, context, repeat)
+            except _Skipped as skipped:
+                results[name] = {'skipped': str(skipped)}
+            _report(name, results[name])
+    finally:
+        context.close()
+    return {'size': size, 'seed': seed, 'python': platform.python_version(),
+            'platform': platform.platform(), 'results': results}
+
+
+def _report(name, result):
+    if 'skipped' in result:
+        sys.stdout.write('%-20s skipped: %s\n' % (name, result['skipped']))
+    else:
+        sys.stdout.write('%-20s %9.1f ms (median %.1f ms)\n'
+                         % (name, result['min'] * 1000,
+                            result['median'] * 1000))
+
+
+def compare(results, baseline, tolerance):
+    """Returns names of benchmarks slower than `baseline` allows."""
+    regressions = []
+    if (baseline['size'], baseline['seed']) != \
+            (results['size'], results['seed']):
+        sys.stdout.write('Warning: baseline was run with size %d and seed %d.'
+                         '\n' % (baseline['size'], baseline['seed']))
+    for name, result in sorted(results['results'].items()):
+        old = baseline['results'].get(name, {})
+        if 'min' not in result or 'min' not in old:
+            continue
+        ratio = result['min'] / old['min'] if old['min'] else 1.0
+        regressed = ratio > 1 + tolerance
+        if regressed:
+            regressions.append(name)
+        sys.stdout.write('%-20s %+7.1f %%%s\n' % (
+            name, (ratio - 1) * 100, '  REGRESSION' if regressed else ''))
+    return regressions
+
+
+def create_options_parser():
+    parser = optparse.OptionParser(usage=__doc__.split('Usage:')[1])
+    parser.add_option('--size', type='choice', default='100',
+                      choices=[str(size) for size in SIZES])
+    parser.add_option('--seed', type='int', default=1)
+    parser.add_option('--repeat', type='int', default=3)
+    parser.add_option('--only', action='append', default=[])
+    parser.add_option('--output')
+    parser.add_option('--baseline', default=BASELINE)
+    parser.add_option('--tolerance', type='float', default=0.2)
+    return parser
+
+
+def main(args):
+    options, _ = create_options_parser().parse_args(args)
+    results = run(int(options.size), options.seed, max(1, options.repeat),
+                  options.only)
+    if options.output:
+        with open(options.output, 'w') as output:
+            json.dump(results, output, indent=2, sort_keys=True)
+    if options.baseline and options.baseline.upper() != 'NONE':
+        with open(options.baseline) as baseline:
+            regressions = compare(results, json.load(baseline),
+                                  options.tolerance)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
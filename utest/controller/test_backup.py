@@ -13,62 +13,146 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import os
+import shutil
+import stat
+import tempfile
 import unittest
 
-from robotide.controller.project import Backup
+from robotide.controller.project import SaveJournal, Serializer
 
+from resources import FakeSettings
 
-class BackupTestCase(unittest.TestCase):
 
-    def setUp(self):
-        file_controller = lambda: None
-        file_controller.filename = 'some_filename.txt'
-        file_controller.refresh_stat = lambda: None
-        self._backupper = _MyBackup(file_controller)
+class _FakeDatafile(object):
 
-    def test_backup_is_restored_when_save_raises_exception(self):
-        try:
-            with self._backupper:
-                raise _SaveFailed('expected')
-            self.fail('should not get here')
-        except _SaveFailed:
-            self.assertTrue(self._backupper.restored)
+    def __init__(self, source, content):
+        self.source = source
+        self._content = content
 
-    def test_backup_is_not_restored_when_save_passes(self):
-        with self._backupper:
-            self.assertNotEqual(None, self._backupper._backup)
-        self.assertFalse(self._backupper.restored)
-        self.assertEqual(None, self._backupper._backup)
+    def save(self, output=None, **options):
+        if isinstance(self._content, Exception):
+            raise self._content
+        output.write(self._content)
 
-    def test_save_can_be_done_if_backup_move_fails(self):
-        def move_fails(*args):
-            raise IOError('failed')
-        self._backupper._move = move_fails
-        save_done = False
-        with self._backupper:
-            save_done = True
-        self.assertTrue(save_done)
 
+class _FakeController(object):
 
-class _SaveFailed(Exception):
-    pass
+    def __init__(self, source, content):
+        self.datafile = self.data = _FakeDatafile(source, content)
 
 
-class _MyBackup(Backup):
+class _Logger(object):
 
-    def __init__(self, file_controller):
-        Backup.__init__(self, file_controller)
-        self._backup = object()
-        self.restored = False
+    def __init__(self):
+        self.errors = []
 
-    def _move(self, from_path, to_path):
-        self.restored = (self._backup == from_path)
+    def error(self, message):
+        self.errors.append(message)
 
-    def _remove_backup(self):
-        self._backup = None
 
-    def _remove_backup_dir(self):
-        pass
+class _JournalTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def _path(self, name, content=None):
+        path = os.path.join(self.directory, name)
+        if content is not None:
+            with open(path, 'w') as output:
+                output.write(content)
+        return path
+
+    def _read(self, path):
+        with open(path) as source:
+            return source.read()
+
+    def _assert_only_files(self, *names):
+        self.assertEqual(sorted(os.listdir(self.directory)), sorted(names))
+
+
+class TestSaveJournal(_JournalTestCase):
+
+    def _write(self, journal, path, content):
+        with open(journal.temporary_file(path), 'w') as output:
+            output.write(content)
+
+    def test_files_are_replaced_on_commit(self):
+        existing = self._path('existing.robot', 'old')
+        os.chmod(existing, 0o640)
+        new = self._path('new.robot')
+        with SaveJournal() as journal:
+            self._write(journal, existing, 'new content')
+            self._write(journal, new, 'created')
+            self.assertEqual(self._read(existing), 'old')
+            journal.commit()
+        self.assertEqual(self._read(existing), 'new content')
+        self.assertEqual(self._read(new), 'created')
+        self.assertEqual(stat.S_IMODE(os.stat(existing).st_mode), 0o640)
+        self._assert_only_files('existing.robot', 'new.robot')
+
+    def test_nothing_is_replaced_without_commit(self):
+        existing = self._path('existing.robot', 'old')
+        try:
+            with SaveJournal() as journal:
+                self._write(journal, existing, 'new content')
+                raise RuntimeError('expected')
+        except RuntimeError:
+            pass
+        self.assertEqual(self._read(existing), 'old')
+        self._assert_only_files('existing.robot')
+
+    def test_all_files_are_rolled_back_if_replacing_fails(self):
+        first = self._path('first.robot', 'first')
+        second = self._path('second.robot', 'second')
+        journal = SaveJournal()
+        moves = []
+        original_move = journal._move
+
+        def move(from_path, to_path):
+            moves.append(to_path)
+            if len(moves) == 4:
+                raise OSError('expected')
+            original_move(from_path, to_path)
+        journal._move = move
+        with journal:
+            self._write(journal, first, 'new first')
+            self._write(journal, second, 'new second')
+            self.assertRaises(OSError, journal.commit)
+        self.assertEqual(self._read(first), 'first')
+        self.assertEqual(self._read(second), 'second')
+        self._assert_only_files('first.robot', 'second.robot')
+
+
+class TestSerializer(_JournalTestCase):
+
+    def setUp(self):
+        _JournalTestCase.setUp(self)
+        self.logger = _Logger()
+        self.serializer = Serializer(FakeSettings(), self.logger)
+
+    def test_all_files_are_saved(self):
+        controllers = [_FakeController(self._path('%d.robot' % i, 'old'),
+                                       'new %d' % i) for i in range(20)]
+        self.serializer.serialize_files(controllers)
+        for i, controller in enumerate(controllers):
+            self.assertEqual(self._read(controller.datafile.source),
+                             'new %d' % i)
+        self.assertEqual(self.logger.errors, [])
+
+    def test_no_file_is_saved_if_one_fails(self):
+        ok = _FakeController(self._path('ok.robot', 'old'), 'new')
+        failing = _FakeController(self._path('failing.robot', 'old'),
+                                  ValueError('expected'))
+        self.assertRaises(ValueError, self.serializer.serialize_files,
+                          [ok, failing])
+        self.assertEqual(self._read(ok.datafile.source), 'old')
+        self.assertEqual(self._read(failing.datafile.source), 'old')
+        self._assert_only_files('ok.robot', 'failing.robot')
+        self.assertEqual(len(self.logger.errors), 1)
 
 
 if __name__ == '__main__':
@@ -146,16 +146,25 @@ class TestCaseEditingTest(TestCaseCommandTest):
         changed_cell_value_2 = 'Again changed Step'
         self._exec(ChangeCellValue(0, 0, changed_cell_value_1))
         assert_equal(self._steps[0].keyword, changed_cell_value_1)
-        self._exec(ChangeCellValue(0, 0, changed_cell_value_2))
-        assert_equal(self._steps[0].keyword, changed_cell_value_2)
+        self._exec(ChangeCellValue(1, 0, changed_cell_value_2))
+        assert_equal(self._steps[1].keyword, changed_cell_value_2)
         self._exec(Undo())
-        assert_equal(self._steps[0].keyword, changed_cell_value_1)
+        assert_equal(self._steps[1].keyword, self._data_step_as_list(STEP2)[0])
         self._exec(Undo())
         assert_equal(self._steps[0].keyword, original_cell_value)
         self._exec(Redo())
         assert_equal(self._steps[0].keyword, changed_cell_value_1)
         self._exec(Redo())
-        assert_equal(self._steps[0].keyword, changed_cell_value_2)
+        assert_equal(self._steps[1].keyword, changed_cell_value_2)
+
+    def test_consecutive_changes_of_a_cell_are_undone_at_once(self):
+        original_cell_value = self._data_step_as_list(STEP1)[0]
+        self._exec(ChangeCellValue(0, 0, 'Changed Step'))
+        self._exec(ChangeCellValue(0, 0, 'Again changed Step'))
+        self._exec(Undo())
+        assert_equal(self._steps[0].keyword, original_cell_value)
+        self._exec(Redo())
+        assert_equal(self._steps[0].keyword, 'Again changed Step')
 
     def test_redo_does_nothing_after_state_changing_command_that_is_not_undo(self):
         changed_cell_value_1 = 'Changed Step'
@@ -0,0 +1,112 @@
+#  Copyright 2008-2015 Nokia Networks
+#  Copyright 2016-     Robot Framework Foundation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import unittest
+import datafilereader
+
+from robotide.controller.ctrlcommands import ChangeTag, DeleteTag
+from robotide.robotapi import TagPatterns
+
+
+class TestTagIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.project = datafilereader.construct_project(
+            datafilereader.VIEW_ALL_TAGS_PATH)
+        self.suite = self.project.data
+        self.index = self.project.tag_index
+
+    def tearDown(self):
+        self.project.close()
+
+    def _test(self, name):
+        for test in self.suite.tests:
+            if test.name == name:
+                return test
+
+    def _names(self, tests):
+        return sorted(test.name for test in tests)
+
+    def _matching_per_test(self, includes, excludes):
+        includes, excludes = TagPatterns(includes), TagPatterns(excludes)
+        for test in self.project.all_testcases():
+            tags = [str(tag) for tag in test.tags]
+            if (not includes or includes.match(tags)) and \
+                    not excludes.match(tags):
+                yield test
+
+    def _tests_with_default_tags(self):
+        return [test for test in self.project.all_testcases()
+                if 'This is Default' in [str(t) for t in test.tags]]
+
+    def test_inherited_tags_are_indexed(self):
+        tests = list(self.project.all_testcases())
+        self.assertEqual(len(self.index.tests), len(tests))
+        self.assertEqual(self.index.count('this is enforced'), len(tests))
+        self.assertIn('Dummy Test #14',
+                      self._names(self.index.tests_with('This is Default')))
+        self.assertEqual(self._names(self.index.tests_with('This is Default')),
+                         self._names(self._tests_with_default_tags()))
+        self.assertEqual(self._names(self.index.tests_with('RANDOM')),
+                         ['Dummy Test #1'])
+
+    def test_items_have_tag_names_and_tests(self):
+        items = dict(self.index.items())
+        self.assertEqual(len(items), len(self.index))
+        self.assertEqual(self._names(items['abcd']), ['Dummy Test #6'])
+
+    def test_changing_test_tag_updates_index(self):
+        test = self._test('Dummy Test #6')
+        tag = [t for t in test.tags if t.name == 'abcd'][0]
+        tag.controller.execute(ChangeTag(tag, 'renamed'))
+        self.assertNotIn('abcd', self.index)
+        self.assertEqual(self._names(self.index.tests_with('renamed')),
+                         ['Dummy Test #6'])
+
+    def test_deleting_force_tag_updates_all_tests(self):
+        tag = self.index.tag_controllers('This is Enforced')[0]
+        tag.execute(DeleteTag())
+        self.assertNotIn('This is Enforced', self.index)
+        self.assertEqual(len(self.index.tests),
+                         len(list(self.project.all_testcases())))
+
+    def test_added_and_removed_tests(self):
+        tests = len(self.index.tests)
+        defaults = self.index.count('This is Default')
+        test = self.suite.tests.new('New Test')
+        self.assertEqual(len(self.index.tests), tests + 1)
+        self.assertEqual(self.index.count('This is Default'), defaults + 1)
+        test.delete()
+        self.assertEqual(len(self.index.tests), tests)
+        self.assertEqual(self.index.count('This is Default'), defaults)
+
+    def test_pattern_queries_match_per_test_matching(self):
+        for includes, excludes in [([], []),
+                                   (['random*'], []),
+                                   (['random?'], ['random9']),
+                                   (['RandomANDabcd', 'cde'], []),
+                                   (['random*ORanother*'], ['*a']),
+                                   (['*enforcedNOTrandom*'], []),
+                                   (['this_is_enforcedNOTrandom*'], []),
+                                   (['NOTrandom*'], []),
+                                   ([], ['random*', 'yo-*'])]:
+            self.assertEqual(
+                self._names(self.index.match(includes, excludes)),
+                self._names(self._matching_per_test(includes, excludes)),
+                (includes, excludes))
+
+
+if __name__ == '__main__':
+    unittest.main()
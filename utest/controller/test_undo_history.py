@@ -0,0 +1,151 @@
+#  Copyright 2008-2015 Nokia Networks
+#  Copyright 2016-     Robot Framework Foundation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import unittest
+
+from robotide.controller import Project
+from robotide.controller.basecontroller import UndoHistory, approximate_size
+from robotide.controller.ctrlcommands import (ChangeCellValue, Redo, Undo,
+                                              AddRow)
+
+from robotide.namespace import Namespace
+from robotide.spec.librarymanager import LibraryManager
+from robotide.utils.instrumentation import INSTRUMENTATION
+
+from controller.base_command_test import testcase_controller
+from resources import FakeSettings
+
+
+class TestUndoHistory(unittest.TestCase):
+
+    def test_oldest_entries_are_dropped_over_entry_budget(self):
+        history = UndoHistory(max_entries=3, max_bytes=10 ** 9)
+        for row in range(5):
+            history.push(AddRow(row))
+        self.assertEqual([history[i]._row for i in range(len(history))],
+                         [2, 3, 4])
+
+    def test_oldest_entries_are_dropped_over_memory_budget(self):
+        command = ChangeCellValue(0, 0, 'x' * 1000)
+        history = UndoHistory(max_entries=100,
+                              max_bytes=2.5 * approximate_size(command))
+        for _ in range(5):
+            history.push(ChangeCellValue(0, 0, 'x' * 1000))
+        self.assertEqual(len(history), 2)
+        self.assertEqual(history.size_in_bytes, 2 * approximate_size(command))
+
+    def test_latest_entry_is_kept_even_if_over_budget(self):
+        history = UndoHistory(max_entries=10, max_bytes=1)
+        history.push(AddRow(0))
+        history.push(AddRow(1))
+        self.assertEqual(len(history), 1)
+        self.assertEqual(history.pop()._row, 1)
+        self.assertEqual(history.size_in_bytes, 0)
+
+    def test_approximate_size_follows_values_of_commands(self):
+        self.assertTrue(approximate_size(ChangeCellValue(0, 0, 'x' * 1000)) >
+                        approximate_size(ChangeCellValue(0, 0, 'x')) + 900)
+
+
+class TestUndoHistoryOfCellEdits(unittest.TestCase):
+
+    def setUp(self):
+        self._ctrl = testcase_controller()
+
+    def _exec(self, command):
+        return self._ctrl.execute(command)
+
+    def _value(self, row=0, col=1):
+        return self._ctrl.steps[row].get_value(col)
+
+    def test_consecutive_edits_of_a_cell_are_one_entry(self):
+        original = self._value()
+        for value in ('a', 'ab', 'abc'):
+            self._exec(ChangeCellValue(0, 1, value))
+        self.assertEqual(self._ctrl.undo_history_size()['undo'], 1)
+        self._exec(Undo())
+        self.assertEqual(self._value(), original)
+        self.assertTrue(self._ctrl.is_undo_empty())
+        self._exec(Redo())
+        self.assertEqual(self._value(), 'abc')
+
+    def test_edits_of_different_cells_are_not_compacted(self):
+        self._exec(ChangeCellValue(0, 1, 'a'))
+        self._exec(ChangeCellValue(1, 1, 'b'))
+        self._exec(ChangeCellValue(0, 1, 'c'))
+        self.assertEqual(self._ctrl.undo_history_size()['undo'], 3)
+
+    def test_edit_after_undo_is_not_merged_to_older_entry(self):
+        original = self._value()
+        self._exec(ChangeCellValue(0, 1, 'a'))
+        self._exec(ChangeCellValue(1, 1, 'b'))
+        self._exec(Undo())
+        self._exec(ChangeCellValue(0, 1, 'c'))
+        self._exec(Undo())
+        self.assertEqual(self._value(), 'a')
+        self._exec(Undo())
+        self.assertEqual(self._value(), original)
+
+    def test_history_is_bounded(self):
+        self._ctrl.undo_history_entries = 2
+        self._ctrl.clear_undo()
+        for row in range(4):
+            self._exec(ChangeCellValue(row, 1, 'x'))
+        size = self._ctrl.undo_history_size()
+        self.assertEqual((size['undo'], size['redo']), (2, 0))
+        self.assertTrue(size['bytes'] > 0)
+
+
+class TestUndoHistoryBudgetsAndSize(unittest.TestCase):
+
+    def setUp(self):
+        self._library_manager = LibraryManager(':memory:')
+        self._library_manager.create_database()
+        self._project = Project(
+            Namespace(FakeSettings()),
+            FakeSettings({'undo history entries': 2,
+                          'undo history megabytes': 0.5}),
+            self._library_manager)
+        self._ctrl = testcase_controller(self._project)
+
+    def tearDown(self):
+        self._project.close()
+        self._library_manager.stop()
+
+    def test_budgets_are_read_from_settings(self):
+        self.assertEqual(self._project.undo_history_budget(100, 1),
+                         (2, 512 * 1024))
+        for row in range(4):
+            self._ctrl.execute(ChangeCellValue(row, 1, 'x'))
+        self.assertEqual(self._ctrl.undo_history_size()['undo'], 2)
+
+    def test_budgets_missing_from_settings_use_defaults(self):
+        project = Project(Namespace(FakeSettings()), FakeSettings(),
+                          self._library_manager)
+        self.assertEqual(project.undo_history_budget(100, 1024), (100, 1024))
+
+    def test_total_size_is_reported_as_gauges(self):
+        def gauges():
+            values = dict(INSTRUMENTATION.gauges)
+            return (values['Undo history entries'],
+                    values['Undo history bytes'])
+        entries, size = gauges()
+        self._ctrl.execute(ChangeCellValue(0, 1, 'x'))
+        self.assertEqual(gauges()[0], entries + 1)
+        self.assertTrue(gauges()[1] > size)
+
+
+if __name__ == '__main__':
+    unittest.main()
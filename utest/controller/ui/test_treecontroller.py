@@ -23,7 +23,7 @@ from robotide.controller.macrocontrollers import TestCaseController
 from robotide.controller.tablecontrollers import TestCaseTableController
 from robotide.controller.tags import Tag
 from robotide.controller.ui.treecontroller import TreeController, _History, \
-    TestSelectionController
+    TestSelectionController, TestResultQueue
 
 
 class ActionRegistererMock(object):
@@ -45,6 +45,97 @@ class TestTreeController(unittest.TestCase):
             [a.name for a in mocked_ar.action_collections])
 
 
+class _Handler(object):
+
+    def __init__(self, controller):
+        self.controller = controller
+
+
+class _Controller(object):
+    # Controllers comparing equal must still map to their own nodes.
+    __hash__ = None
+
+    def __eq__(self, other):
+        return True
+
+
+class TestNodeLookup(unittest.TestCase):
+
+    def setUp(self):
+        self._data = {}
+        tree = lambda: 0
+        tree.GetItemPyData = self._data.get
+        self.controller = TreeController(tree, None, None, None)
+
+    def _register(self, node, controller):
+        self._data[node] = _Handler(controller)
+        self.controller.register_node(node, controller)
+
+    def test_find_registered_node(self):
+        first, second = _Controller(), _Controller()
+        self._register('first', first)
+        self._register('second', second)
+        assert_equal(self.controller.find_node_by_controller(first), 'first')
+        assert_equal(self.controller.find_node_by_controller(second), 'second')
+        assert_equal(self.controller.find_node_by_controller(_Controller()),
+                     None)
+
+    def test_unregistered_node_is_not_found(self):
+        ctrl = _Controller()
+        self._register('node', ctrl)
+        self.controller.unregister_node('node')
+        assert_equal(self.controller.find_node_by_controller(ctrl), None)
+
+    def test_unregistering_old_node_keeps_new_one(self):
+        ctrl = _Controller()
+        self._register('old', ctrl)
+        self._register('new', ctrl)
+        self.controller.unregister_node('old')
+        assert_equal(self.controller.find_node_by_controller(ctrl), 'new')
+
+    def test_controllers_are_not_kept_alive(self):
+        self.controller.register_node('node', _Controller())
+        assert_equal(len(self.controller._nodes), 0)
+
+
+class TestTestResultQueue(unittest.TestCase):
+
+    def setUp(self):
+        self.scheduled = []
+        self.flushed = []
+        self.queue = TestResultQueue(
+            self.flushed.append, interval=10,
+            schedule=lambda delay, callback: self.scheduled.append(callback))
+
+    def _flush(self):
+        callbacks, self.scheduled[:] = self.scheduled[:], []
+        for callback in callbacks:
+            callback()
+
+    def test_changes_are_flushed_once_per_interval(self):
+        first, second = object(), object()
+        self.queue.add(first)
+        self.queue.add(second)
+        assert_equal(len(self.scheduled), 1)
+        self._flush()
+        assert_equal(self.flushed, [[first, second]])
+        self.queue.add(first)
+        assert_equal(len(self.scheduled), 1)
+
+    def test_test_is_flushed_once_in_order_of_latest_change(self):
+        first, second = object(), object()
+        for test in first, second, first:
+            self.queue.add(test)
+        self._flush()
+        assert_equal(self.flushed, [[second, first]])
+
+    def test_cleared_changes_are_not_flushed(self):
+        self.queue.add(object())
+        self.queue.clear()
+        self._flush()
+        assert_equal(self.flushed, [])
+
+
 class _BaseTreeControllerTest(object):
 
     def setUp(self):
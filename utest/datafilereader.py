@@ -67,6 +67,8 @@ SMALL_TEST_PATH = _makepath('small_test')
 
 IMPORTS = _makepath('imports')
 
+VIEW_ALL_TAGS_PATH = _makepath('view_all_tags', 'Tags_test.robot')
+
 
 def construct_project(datapath, temp_dir_for_excludes=None):
     # print("DEBUG: construct_project with argpath: %s\n" % datapath)
@@ -80,6 +80,45 @@ class TestKeywords(unittest.TestCase):
         assert_equal(kws.get('My kw').arguments, ['${arg}'])
         assert_equal(kws.get('Collision!').arguments, [])
 
+    def test_first_matching_embedded_keyword_is_returned(self):
+        kws = _Keywords([ItemMock('Open ${page}', [], 'first'),
+                         ItemMock('Open ${page} page', [], 'second'),
+                         ItemMock('${user} opens ${page}', [], 'third')])
+        assert_equal(kws.get('Open front page').longname, 'first')
+        assert_equal(kws.get('Given John opens it').longname, 'third')
+        assert_false(kws.get('Close front page'))
+
+    def test_embedded_keywords_added_after_lookup_are_found(self):
+        kws = _Keywords([ItemMock('Open ${page}', [], 'first')])
+        assert_false(kws.get('Close page'))
+        kws._add_keywords([ItemMock('Close ${page}', [], 'second')])
+        assert_equal(kws.get('Close page').longname, 'second')
+
+    def test_embedded_keywords_with_custom_regexps(self):
+        kws = _Keywords([ItemMock('Wait ${n:\\d+} seconds', [], 'digits'),
+                         ItemMock('Wait ${x:a|b} seconds', [], 'choice'),
+                         ItemMock('Wait ${anything} seconds', [], 'any')])
+        assert_equal(kws.get('Wait 10 seconds').longname, 'digits')
+        assert_equal(kws.get('Wait B seconds').longname, 'choice')
+        assert_equal(kws.get('Wait ab seconds').longname, 'any')
+
+    def test_embedded_keywords_starting_with_argument(self):
+        kws = _Keywords([ItemMock('Open ${page} now', [], 'first'),
+                         ItemMock('${verb} ${page}', [], 'second'),
+                         ItemMock('Open ${page}', [], 'third'),
+                         ItemMock('Go${where}', [], 'fourth')])
+        assert_equal(kws.get('Open page now').longname, 'first')
+        assert_equal(kws.get('Open page').longname, 'second')
+        assert_equal(kws.get('GoHome').longname, 'fourth')
+        assert_equal(kws.get('\u00d6ppen page').longname, 'second')
+
+    def test_many_embedded_keywords(self):
+        kws = _Keywords([ItemMock('Keyword %d with ${arg}' % index, [],
+                                  'kw%d' % index) for index in range(500)])
+        assert_equal(kws.get('Keyword 499 with value').longname, 'kw499')
+        assert_equal(kws.get('and keyword 7 with x').longname, 'kw7')
+        assert_false(kws.get('Keyword 500 with value'))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -64,6 +64,16 @@ class TestLibraryCache(unittest.TestCase):
         t2.join()
         self.assertEqual(['ok', 'ok'], self._thread_results)
 
+    def test_aliased_imports_share_keywords(self):
+        cache = LibraryCache({}, lambda:0, self._library_manager)
+        keywords = cache.get_library_keywords('TestLib')
+        aliased = cache.get_library_keywords('TestLib', alias='Alias')
+        self.assertIs(cache.get_library_keywords('TestLib'), keywords)
+        self.assertEqual([kw.name for kw in aliased],
+                         [kw.name for kw in keywords])
+        self.assertEqual(set(kw.source for kw in aliased), {'Alias'})
+        self.assertEqual(set(kw.source for kw in keywords), {'TestLib'})
+
     def _create_cache_with_auto_imports(self, auto_import):
         settings = {'auto imports': [auto_import]}
         return LibraryCache(settings, lambda:0, self._library_manager)
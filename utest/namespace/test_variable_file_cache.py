@@ -0,0 +1,91 @@
+#  Copyright 2008-2015 Nokia Networks
+#  Copyright 2016-     Robot Framework Foundation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import os
+import shutil
+import tempfile
+import traceback
+import unittest
+
+from robotide.namespace.cache import VariableFileCache
+from robotide.robotapi import DataError, VariableFileSetter
+
+
+class TestVariableFileCache(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, 'cached_varfile.py')
+        self.imports = []
+        self.cache = VariableFileCache(self._import)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def _import(self, path, args):
+        self.imports.append((path, args))
+        return VariableFileSetter(None)._import_if_needed(path, args)
+
+    def _write(self, content):
+        with open(self.path, 'w') as varfile:
+            varfile.write(content)
+
+    def test_unchanged_file_is_imported_once(self):
+        self._write('VALUE = 1\n')
+        self.assertEqual(self.cache.get(self.path, []), [('${VALUE}', 1)])
+        self.assertEqual(self.cache.get(self.path, []), [('${VALUE}', 1)])
+        self.assertEqual(len(self.imports), 1)
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 1))
+
+    def test_arguments_are_part_of_the_key(self):
+        self._write('def get_variables(arg):\n'
+                    '    return {"VALUE": arg}\n')
+        self.assertEqual(self.cache.get(self.path, ['a']), [('${VALUE}', 'a')])
+        self.assertEqual(self.cache.get(self.path, ['b']), [('${VALUE}', 'b')])
+        self.assertEqual(self.cache.get(self.path, ['a']), [('${VALUE}', 'a')])
+        self.assertEqual(len(self.imports), 2)
+
+    def test_changed_file_is_imported_again(self):
+        self._write('VALUE = 1\n')
+        self.cache.get(self.path, [])
+        self._write('VALUE = 1000\n')
+        self.assertEqual(self.cache.get(self.path, []), [('${VALUE}', 1000)])
+        self.assertEqual((self.cache.hits, self.cache.misses), (0, 2))
+
+    def test_failed_import_is_cached(self):
+        self._write('raise RuntimeError("broken")\n')
+        for _ in range(2):
+            self.assertRaises(DataError, self.cache.get, self.path, [])
+        self.assertEqual(len(self.imports), 1)
+
+    def test_tracebacks_of_cached_failure_do_not_grow(self):
+        self._write('raise RuntimeError("broken")\n')
+        lengths = set()
+        for _ in range(200):
+            try:
+                self.cache.get(self.path, [])
+            except DataError as error:
+                self.assertIn('broken', str(error))
+                lengths.add(len(traceback.extract_tb(error.__traceback__)))
+        self.assertEqual(len(lengths), 1)
+
+    def test_missing_file_is_not_cached(self):
+        for _ in range(2):
+            self.assertRaises(DataError, self.cache.get, self.path, [])
+        self.assertEqual(len(self.imports), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,93 @@
+#  Copyright 2008-2015 Nokia Networks
+#  Copyright 2016-     Robot Framework Foundation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import unittest
+
+from robotide.searchtests.searchindex import TestSearchIndex
+from robotide.searchtests.searchtests import TestSearchMatcher
+from searchtests.test_matcher import _TestSearchTest
+
+
+class _Suite(object):
+
+    def __init__(self, tests, suites=()):
+        self.tests = tests
+        self.suites = suites
+
+
+class TestTestSearchIndex(_TestSearchTest, unittest.TestCase):
+
+    def setUp(self):
+        self.login = self._test('Valid Login', tags=['smoke'],
+                                doc='Logs in with valid credentials')
+        self.logout = self._test('Logout', tags=['regression'],
+                                 doc='Logs out')
+        self.other = self._test('Other', tags=['slow one'], doc='')
+        self.index = TestSearchIndex(
+            _Suite([self.login], [_Suite([self.logout, self.other])]))
+
+    def _search(self, text):
+        matcher = TestSearchMatcher(text)
+        return set(entry.test for entry in
+                   self.index.candidates(matcher.words))
+
+    def test_index_contains_tests_of_all_suites(self):
+        self.assertEqual(len(self.index), 3)
+
+    def test_substring_matches_in_name_tags_and_doc(self):
+        self.assertEqual(self._search('LOG'), {self.login, self.logout})
+        self.assertEqual(self._search('oke'), {self.login})
+        self.assertEqual(self._search('credential'), {self.login})
+        self.assertEqual(self._search('slow'), {self.other})
+        self.assertEqual(self._search('nothing'), set())
+
+    def test_any_word_matches(self):
+        self.assertEqual(self._search('smoke regression'),
+                         {self.login, self.logout})
+
+    def test_typing_longer_words(self):
+        for text in ['l', 'lo', 'log', 'logo', 'logou', 'logout']:
+            self._search(text)
+        self.assertEqual(self._search('logout'), {self.logout})
+        self.assertEqual(self._search('login'), {self.login})
+
+    def test_results_match_matcher(self):
+        for text in ['log', 'valid out', 'one', 'in']:
+            matcher = TestSearchMatcher(text)
+            expected = set(t for t in (self.login, self.logout, self.other)
+                           if matcher.matches(t))
+            self.assertEqual(self._search(text), expected)
+
+    def test_updating_test(self):
+        len(self.index)
+        self.other.add_tag('newtag')
+        self.index.update_test(self.other)
+        self.assertEqual(self._search('newtag'), {self.other})
+
+    def test_removing_test(self):
+        len(self.index)
+        self.index.remove_test(self.logout)
+        self.assertEqual(self._search('logout'), set())
+        self.assertEqual(len(self.index), 2)
+
+    def test_invalidated_index_is_rebuilt(self):
+        len(self.index)
+        self.index.invalidate(_Suite([self.other]))
+        self.assertEqual(self._search('log'), set())
+        self.assertEqual(len(self.index), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
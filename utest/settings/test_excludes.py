@@ -94,6 +94,43 @@ class TestExcludes(unittest.TestCase):
         self.assertFalse(self.exclude.contains('foo/zar'))
         self.assertTrue(self.exclude.contains('foo/gar'))
 
+    def test_excludes_file_is_read_only_when_changed(self):
+        self.exclude.update_excludes([_join('foo')])
+        self.exclude.get_excludes()
+        reads = []
+        original = self.exclude._read_excludes
+        self.exclude._read_excludes = lambda: reads.append(1) or original()
+        for _ in range(5):
+            self.assertTrue(self.exclude.contains(_join('foo', 'bar')))
+            self.assertFalse(self.exclude.contains(_join('bar')))
+        self.assertEqual(len(reads), 0)
+        self.exclude.update_excludes([_join('bar')])
+        self.assertTrue(self.exclude.contains(_join('bar')))
+        self.assertEqual(len(reads), 1)
+
+    def test_external_modification_of_excludes_file_is_noticed(self):
+        self.exclude.update_excludes([_join('foo')])
+        self.assertFalse(self.exclude.contains(_join('quux', 'corge')))
+        with open(self.file_path, 'w') as exclude_file:
+            exclude_file.write(_join('quux') + '\n')
+        self.assertTrue(self.exclude.contains(_join('quux', 'corge')))
+        self.assertFalse(self.exclude.contains(_join('foo')))
+
+    def test_nested_prefixes(self):
+        self.exclude.update_excludes([_join('foo'), _join('foo', 'bar'),
+                                      _join('foo0')])
+        self.assertTrue(self.exclude.contains(_join('foo', 'baz')))
+        self.assertTrue(self.exclude.contains(_join('foo0', 'baz')))
+        self.assertFalse(self.exclude.contains(_join('fo', 'baz')))
+
+    def test_contains_with_given_excludes(self):
+        self.exclude.update_excludes([_join('foo')])
+        self.assertTrue(self.exclude.contains(_join('bar'),
+                                              excludes=[_join('bar')]))
+        self.assertFalse(self.exclude.contains(_join('foo'),
+                                               excludes=[_join('bar')]))
+
+
 def _join(*args):
     return os.path.join(*args) + sep
 
@@ -13,8 +13,10 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import gc
 import unittest
 import os
+import weakref
 
 from robotide.preferences import settings
 from robotide.preferences.settings import Settings, SectionError,\
@@ -290,6 +292,59 @@ class TestSections(TestSettingsHelper):
             self._read_settings()['Plugin 1']._config_obj, defaults)
 
 
+class TestDelayedSaving(TestSettingsHelper):
+
+    def setUp(self):
+        TestSettingsHelper.setUp(self)
+        self._write_settings("foo = 'bar'", self.user_settings_path)
+        self.settings = Settings(self.user_settings_path, save_delay=60)
+
+    def tearDown(self):
+        self.settings.flush()
+        TestSettingsHelper.tearDown(self)
+
+    def test_changes_are_not_written_before_delay(self):
+        self.settings['foo'] = 'new value'
+        self.assertEqual(self._read_settings()['foo'], 'bar')
+
+    def test_flush_writes_pending_changes_once(self):
+        for index in range(30):
+            self.settings['plugin %d' % index] = True
+        self.settings.flush()
+        self.settings.flush()
+        self.assertEqual(self.settings._writer.writes, 1)
+        self.assertEqual(self._read_settings()['plugin 29'], True)
+
+    def test_deferred_saving_writes_once_when_released(self):
+        with self.settings.deferred_saving():
+            with self.settings.deferred_saving():
+                self.settings['foo'] = 'first'
+            self.settings['foo'] = 'second'
+            self.assertEqual(self.settings._writer.writes, 0)
+        self.assertEqual(self.settings._writer.writes, 1)
+        self.assertEqual(self._read_settings()['foo'], 'second')
+
+    def test_writing_leaves_no_temporary_files(self):
+        directory = os.path.dirname(self.user_settings_path)
+        before = set(os.listdir(directory))
+        self.settings['foo'] = 'new value'
+        self.settings.flush()
+        self.assertEqual(set(os.listdir(directory)), before)
+
+    def test_pending_changes_are_written_at_exit(self):
+        self.settings['foo'] = 'new value'
+        settings._flush_writers()
+        self.assertEqual(self._read_settings()['foo'], 'new value')
+
+    def test_writers_are_not_kept_alive_for_exit(self):
+        writer = settings._SettingsWriter(self.settings._config_obj)
+        self.assertIn(writer, settings._SettingsWriter.instances)
+        reference = weakref.ref(writer)
+        del writer
+        gc.collect()
+        self.assertIsNone(reference())
+
+
 class TestInitializeSettings(TestSettingsHelper):
 
     def setUp(self):
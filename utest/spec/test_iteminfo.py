@@ -66,6 +66,38 @@ class TestKeywordInfo(unittest.TestCase):
         kw_info = ResourceUserKeywordInfo(uk)
         self.assertEqual(kw_info.longname, 'resource.UK')
 
+    def test_uk_arguments_are_parsed_again_only_when_changed(self):
+        uk = UserKeyword(_FakeTestCaseFile(), 'My User keyword')
+        uk.args.value = ['${arg1}', '@{varargs}']
+        kw_info = TestCaseUserKeywordInfo(uk)
+        self.assertIs(kw_info.arguments, kw_info.arguments)
+        assert_equal(kw_info.arguments, ['arg1', '*varargs'])
+        uk.args.value = ['${new}']
+        assert_equal(kw_info.arguments, ['new'])
+
+    def test_shortdoc_is_first_line_of_doc(self):
+        for doc, shortdoc in [('', ''), ('Single', 'Single'),
+                              ('First\r\nSecond', 'First'),
+                              ('\nSecond\x0cThird', 'Second')]:
+            kw_info = LibraryKeywordInfo('Kw', doc, 'ROBOT', 'Lib', [])
+            assert_equal(kw_info.shortdoc, shortdoc)
+
+    def test_aliased_libkw_shares_data_with_original(self):
+        kw_info = LibraryKeywordInfo('Kw', 'Doc', 'ROBOT', 'Lib', ['arg'])
+        aliased = kw_info.with_alias('Alias')
+        assert_equal(aliased.source, 'Alias')
+        assert_equal(kw_info.source, 'Lib')
+        self.assertIs(aliased.doc, kw_info.doc)
+        self.assertIs(aliased.arguments, kw_info.arguments)
+        self.assertIs(kw_info.with_alias(None), kw_info)
+        self.assertFalse(hasattr(kw_info, '__dict__'))
+        assert_in_details(aliased, 'Alias')
+
+    def test_details_are_rendered_once(self):
+        kw_info = LibraryKeywordInfo('Kw', '*Doc*', 'ROBOT', 'Lib', [])
+        self.assertIs(kw_info.details, kw_info.details)
+        assert_in_details(kw_info, '<b>Doc</b>')
+
 
 class TestVariableInfo(unittest.TestCase):
 
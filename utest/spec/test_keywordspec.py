@@ -14,14 +14,17 @@
 #  limitations under the License.
 
 import unittest
+import shutil
 import sys
 import os
+import tempfile
 
 from nose.tools import assert_equal
 
 from resources import DATAPATH
 from robotide.context import LIBRARY_XML_DIRECTORY
-from robotide.spec.xmlreaders import SpecInitializer
+from robotide.spec import xmlreaders
+from robotide.spec.xmlreaders import SpecIndex, SpecInitializer
 from robotide.utils import overrides
 
 sys.path.append(os.path.join(DATAPATH, 'libs'))
@@ -125,6 +128,73 @@ class TestSpecInitializer(unittest.TestCase):
         self.assertEqual(specinitializer.directory, 'my_dir')
 
 
+SPEC = """<?xml version="1.0" encoding="UTF-8"?>
+<keywordspec name="%s" type="library">
+<version>%s</version>
+<kw name="Keyword"><doc></doc></kw>
+</keywordspec>
+"""
+
+
+class TestSpecIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.index_file = os.path.join(self.directory, 'index.json')
+        self._orig_reader = xmlreaders._read_name_and_version
+        self.reads = []
+        xmlreaders._read_name_and_version = self._read
+
+    def tearDown(self):
+        xmlreaders._read_name_and_version = self._orig_reader
+        shutil.rmtree(self.directory)
+
+    def _read(self, path):
+        self.reads.append(os.path.basename(path))
+        return self._orig_reader(path)
+
+    def _write_spec(self, filename, name, version):
+        with open(os.path.join(self.directory, filename), 'w') as spec:
+            spec.write(SPEC % (name, version))
+
+    def test_newest_version_is_found(self):
+        self._write_spec('a.xml', 'Lib', '1.0')
+        self._write_spec('b.xml', 'Lib', '2.0')
+        self._write_spec('c.xml', 'Other', '3.0')
+        self.assertEqual(SpecIndex().find(self.directory, 'Lib'),
+                         os.path.join(self.directory, 'b.xml'))
+        self.assertEqual(SpecIndex().find(self.directory, 'Missing'), None)
+
+    def test_unchanged_files_are_read_only_once(self):
+        self._write_spec('a.xml', 'Lib', '1.0')
+        self._write_spec('b.xml', 'Other', '1.0')
+        index = SpecIndex(self.index_file)
+        index.find(self.directory, 'Lib')
+        index.find(self.directory, 'Other')
+        SpecIndex(self.index_file).find(self.directory, 'Lib')
+        self.assertEqual(sorted(self.reads), ['a.xml', 'b.xml'])
+
+    def test_changed_and_removed_files_are_refreshed(self):
+        self._write_spec('a.xml', 'Lib', '1.0')
+        self._write_spec('b.xml', 'Lib', '2.0')
+        index = SpecIndex(self.index_file)
+        index.find(self.directory, 'Lib')
+        self._write_spec('a.xml', 'Lib', '10.0')
+        self.assertEqual(index.find(self.directory, 'Lib'),
+                         os.path.join(self.directory, 'a.xml'))
+        os.remove(os.path.join(self.directory, 'a.xml'))
+        self.assertEqual(index.find(self.directory, 'Lib'),
+                         os.path.join(self.directory, 'b.xml'))
+        self.assertEqual(sorted(self.reads), ['a.xml', 'a.xml', 'b.xml'])
+
+    def test_corrupted_index_is_ignored(self):
+        with open(self.index_file, 'w') as index:
+            index.write('{not json')
+        self._write_spec('a.xml', 'Lib', '1.0')
+        self.assertEqual(SpecIndex(self.index_file).find(self.directory, 'Lib'),
+                         os.path.join(self.directory, 'a.xml'))
+
+
 if __name__ == '__main__':
     unittest.main()
 
@@ -0,0 +1,227 @@
+#  Copyright 2008-2015 Nokia Networks
+#  Copyright 2016-     Robot Framework Foundation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import os
+import shutil
+import sys
+import tempfile
+import textwrap
+import unittest
+
+from resources import DATAPATH
+from robotide.spec.libraryfetcher import (get_import_result,
+                                          get_static_import_result)
+
+
+CLASS_LIBRARY = '''
+from robotide.lib.robot.api.deco import keyword
+
+__version__ = '1.0'
+
+
+class _Base(object):
+
+    def inherited(self, arg, default=1, *args, **kwargs):
+        """Inherited documentation.
+
+        Tags: foo, bar
+        """
+
+    def overridden(self):
+        """Documentation from base."""
+
+
+class ClassLibrary(_Base):
+    """Library documentation."""
+    ROBOT_LIBRARY_DOC_FORMAT = 'html'
+    ROBOT_LIBRARY_VERSION = __version__
+
+    def __init__(self, arg=None):
+        self._arg = arg
+
+    def overridden(self):
+        pass
+
+    @keyword('Custom Name')
+    def _private_with_name(self, value=None):
+        pass
+
+    @staticmethod
+    def static(a, b):
+        pass
+
+    @property
+    def attribute(self):
+        return 1
+
+    def _private(self):
+        pass
+'''
+
+MODULE_LIBRARY = '''
+import os
+
+__all__ = ['first', 'second_keyword']
+
+
+def first(a, b='x', *rest):
+    """First."""
+
+
+def second_keyword():
+    pass
+
+
+def not_exposed():
+    pass
+'''
+
+DYNAMIC_LIBRARY = '''
+class DynamicLibrary(object):
+
+    def get_keyword_names(self):
+        return ['Keyword']
+
+    def run_keyword(self, name, args):
+        pass
+'''
+
+IMPORTING_LIBRARY = '''
+from os.path import join
+
+
+def keyword():
+    pass
+'''
+
+DECORATED_LIBRARY = '''
+import functools
+
+
+class DecoratedLibrary(object):
+
+    @functools.lru_cache()
+    def keyword(self, arg):
+        pass
+'''
+
+MODULE_LIBRARY_WITH_CALLS = '''
+def _make():
+    def made():
+        pass
+    return made
+
+
+VALUES = [1, 'two', {'three': (3.0, None)}]
+
+
+def kw():
+    pass
+
+
+made = _make()
+'''
+
+CLASS_LIBRARY_WITH_CALLS = '''
+def some_wrapper(function):
+    return function
+
+
+class ClassLibraryWithCalls(object):
+
+    def _impl(self):
+        pass
+
+    kw = some_wrapper(_impl)
+'''
+
+
+class TestStaticImportResult(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+        for name in ('ClassLibrary', 'ModuleLibrary', 'ModuleLibraryWithCalls',
+                     'ClassLibraryWithCalls'):
+            sys.modules.pop(name, None)
+
+    def _write(self, name, source):
+        path = os.path.join(self.directory, name + '.py')
+        with open(path, 'w') as library:
+            library.write(textwrap.dedent(source))
+        return path
+
+    def _as_tuples(self, keywords):
+        return [(kw.name, kw.doc, kw.doc_format, kw.source,
+                 tuple(kw.arguments)) for kw in keywords]
+
+    def _assert_same_as_import(self, path):
+        static = get_static_import_result(path)
+        self.assertIsNotNone(static)
+        self.assertEqual(self._as_tuples(static),
+                         self._as_tuples(get_import_result(path, [])))
+        return static
+
+    def test_class_library(self):
+        keywords = self._assert_same_as_import(
+            self._write('ClassLibrary', CLASS_LIBRARY))
+        self.assertEqual([kw.name for kw in keywords],
+                         ['Custom Name', 'Inherited', 'Overridden', 'Static'])
+
+    def test_module_library_with_all(self):
+        keywords = self._assert_same_as_import(
+            self._write('ModuleLibrary', MODULE_LIBRARY))
+        self.assertEqual([kw.name for kw in keywords],
+                         ['First', 'Second Keyword'])
+
+    def test_libraries_in_test_data(self):
+        for name in ('AnotherArgLib.py', 'TestLib.py'):
+            self._assert_same_as_import(os.path.join(DATAPATH, 'libs', name))
+
+    def test_libraries_needing_import_are_not_resolved(self):
+        for name, source in [('DynamicLibrary', DYNAMIC_LIBRARY),
+                             ('ImportingLibrary', IMPORTING_LIBRARY),
+                             ('DecoratedLibrary', DECORATED_LIBRARY)]:
+            self.assertIsNone(
+                get_static_import_result(self._write(name, source)), name)
+
+    def test_libraries_binding_call_results_are_imported(self):
+        for name, source, expected in [
+                ('ModuleLibraryWithCalls', MODULE_LIBRARY_WITH_CALLS,
+                 ['Kw', 'Made']),
+                ('ClassLibraryWithCalls', CLASS_LIBRARY_WITH_CALLS, ['Kw'])]:
+            path = self._write(name, source)
+            self.assertIsNone(get_static_import_result(path), name)
+            self.assertEqual([kw.name for kw in get_import_result(path, [])],
+                             expected)
+
+    def test_non_existing_and_standard_libraries_are_not_resolved(self):
+        self.assertIsNone(get_static_import_result('NonExistingLibrary'))
+        self.assertIsNone(get_static_import_result('BuiltIn'))
+
+    def test_library_by_module_name(self):
+        self._write('ModuleLibrary', MODULE_LIBRARY)
+        sys.path.insert(0, self.directory)
+        try:
+            keywords = self._assert_same_as_import('ModuleLibrary')
+        finally:
+            sys.path.remove(self.directory)
+        self.assertEqual(keywords[0].source, 'ModuleLibrary')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,95 @@
+#  Copyright 2008-2015 Nokia Networks
+#  Copyright 2016-     Robot Framework Foundation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import gc
+import sys
+import tracemalloc
+import unittest
+
+from robotide.robotapi import (ForLoop, Step, TestCase, TestCaseFile,
+                               UserKeyword)
+
+from datafilereader import KW1000_TESTCASEFILE, KW4000_TESTCASEFILE
+
+
+class TestCompactModel(unittest.TestCase):
+
+    def setUp(self):
+        self.test = TestCase(None, 'Test')
+
+    def test_steps_have_no_instance_dict(self):
+        for item in (Step(['Log', 'x']), ForLoop(self.test, ['${i}', 'IN', 'a']),
+                     self.test, UserKeyword(None, 'Keyword'),
+                     self.test.setup, self.test.doc):
+            self.assertFalse(hasattr(item, '__dict__'), type(item).__name__)
+
+    def test_settings_are_created_on_first_access(self):
+        self.assertIsNone(getattr(self.test, '_tags', None))
+        tags = self.test.tags
+        self.assertIs(self.test.tags, tags)
+        self.assertIs(tags.parent, self.test)
+        self.assertEqual(tags.setting_name, '[Tags]')
+        self.assertFalse(tags.is_set())
+
+    def test_settings_can_be_replaced(self):
+        keyword = UserKeyword(None, 'Keyword')
+        keyword.args.populate(['${arg}'])
+        keyword.return_ = keyword.return_
+        self.assertEqual(keyword.args.value, ['${arg}'])
+        self.assertEqual([s.setting_name for s in keyword.settings],
+                         ['[Arguments]', '[Documentation]', '[Tags]',
+                          '[Timeout]', '[Teardown]', '[Return]'])
+
+    def test_step_cells_are_interned(self):
+        first = Step([''.join(['${x}=']), ''.join(['Get', ' Value']), 'a'])
+        second = Step([''.join(['${x}=']), ''.join(['Get', ' Value']), 'a'])
+        self.assertIs(first.name, second.name)
+        self.assertIs(first.assign[0], second.assign[0])
+
+    def test_copied_test_keeps_settings_and_steps(self):
+        source = TestCaseFile(source=KW1000_TESTCASEFILE).populate()
+        test = source.testcase_table.tests[0]
+        test.tags.populate(['foo'])
+        copy = test.copy('Copy')
+        self.assertEqual(copy.name, 'Copy')
+        self.assertEqual(copy.tags.value, ['foo'])
+        self.assertEqual([s.as_list() for s in copy.steps],
+                         [s.as_list() for s in test.steps])
+
+
+def _count_steps(datafile):
+    tables = (datafile.testcase_table.tests, datafile.keyword_table.keywords)
+    return sum(len(item.steps) for table in tables for item in table)
+
+
+def measure_bytes_per_step(path=KW4000_TESTCASEFILE):
+    """Returns memory held by the parsed model of `path` per step."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        datafile = TestCaseFile(source=path).populate()
+        gc.collect()
+        size, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return size / _count_steps(datafile), _count_steps(datafile)
+
+
+if __name__ == '__main__':
+    if sys.argv[1:] == ['--benchmark']:
+        per_step, steps = measure_bytes_per_step()
+        print('%d steps, %.0f bytes per step' % (steps, per_step))
+    else:
+        unittest.main()
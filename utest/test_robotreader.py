@@ -0,0 +1,123 @@
+#  Copyright 2008-2015 Nokia Networks
+#  Copyright 2016-     Robot Framework Foundation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import io
+import os
+import random
+import unittest
+
+from robotide.lib.robot.parsing.datarow import DataRow
+from robotide.lib.robot.parsing.model import ResourceFile
+from robotide.lib.robot.parsing.robotreader import RobotReader
+from robotide.lib.robot.parsing.tsvreader import TsvReader
+
+from resources import DATAPATH
+
+ROWS = [u'', u'*** Test Cases ***', u'Test  Log  Hello world',
+        u'  Log  Hello', u' Log  Hello', u'    Log    a  b',
+        u'\tLog\tHello', u'Log\xa0\xa0Hello', u'Log  Hello\xa0world',
+        u'Log  Hello   world', u'Log  \\  ...  x', u'Log  # comment  x',
+        u'| Log | Hello |', u'|', u'| | Log | a  b |', u'|  Log  |  x',
+        u'| Log |\tx |', u'| Log | a \x1c b |', u'| a | # c |',
+        u'Log  a\u2003b', u'| Log|x | y |', u'...  more  cells']
+TSV_ROWS = [u'T1\tLog Many\ta  b', u'\tLog\t"quoted"', u'\tLog\t\tx',
+            u'\t\tLog  x', u'| Log | x |', u'Log\xa0\xa0Hello\t x ']
+CELL_CHARACTERS = u'    \t\xa0|a#\\.\x1c\u2003'
+
+
+def reference_tokenize(row, reader_class=RobotReader):
+    reader = reader_class()
+    return list(reader._check_deprecations(reader.split_row(row), '', 0))
+
+
+def reference_parse(row):
+    data, comments = [], []
+    for cell in row:
+        cell = ' '.join(cell.split())
+        if cell and cell[0] == '#' or comments:
+            comments.append(cell)
+        else:
+            data.append(cell)
+    purge = DataRow([])._purge_empty_cells
+    return purge(data), purge(comments)
+
+
+def robot_data_rows(extensions=('.robot', '.txt', '.resource')):
+    for dirpath, _, filenames in os.walk(DATAPATH):
+        for name in filenames:
+            if name.endswith(extensions):
+                path = os.path.join(dirpath, name)
+                with io.open(path, encoding='UTF-8', errors='replace') as data:
+                    for line in data:
+                        yield line.rstrip()
+
+
+def random_rows(count=5000, seed=1):
+    rnd = random.Random(seed)
+    for _ in range(count):
+        yield u''.join(rnd.choice(CELL_CHARACTERS)
+                       for _ in range(rnd.randint(0, 20))).rstrip()
+
+
+class TestTokenizing(unittest.TestCase):
+    _reader_class = RobotReader
+
+    def setUp(self):
+        self._reader = self._reader_class()
+
+    def _assert_identical(self, rows):
+        for row in rows:
+            tokens = self._reader.tokenize(row)
+            self.assertEqual(tokens,
+                             reference_tokenize(row, self._reader_class),
+                             repr(row))
+            for cells in (tokens, self._reader.split_row(row)):
+                datarow = DataRow(cells)
+                self.assertEqual((datarow.cells, datarow.comments),
+                                 reference_parse(cells), repr(row))
+
+    def test_edge_cases(self):
+        self._assert_identical(ROWS)
+
+    def test_random_rows(self):
+        self._assert_identical(random_rows())
+
+    def test_test_data(self):
+        self._assert_identical(robot_data_rows())
+
+
+class TestTsvTokenizing(TestTokenizing):
+    _reader_class = TsvReader
+
+    def test_edge_cases(self):
+        self._assert_identical(ROWS + TSV_ROWS)
+
+    def test_cells_are_split_only_by_tabs(self):
+        self.assertEqual(self._reader.tokenize(u'T1\tLog Many\ta  b'),
+                         ['T1', 'Log Many', 'a b'])
+        self.assertEqual(self._reader.tokenize(u'\tLog\t"quoted"'),
+                         ['', 'Log', 'quoted'])
+
+    def test_test_data(self):
+        self._assert_identical(robot_data_rows(('.tsv',)))
+
+    def test_tsv_file(self):
+        resource = ResourceFile(source=os.path.join(
+            DATAPATH, 'all_files', '_hidden_resource.tsv')).populate()
+        self.assertEqual(len(resource.keyword_table.keywords), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,118 @@
+#  Copyright 2008-2015 Nokia Networks
+#  Copyright 2016-     Robot Framework Foundation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import io
+import os
+import shutil
+import sys
+import tempfile
+import time
+import unittest
+
+from robotide.lib.robot.parsing.model import ResourceFile
+from robotide.lib.robot.writer import aligners
+
+
+def write_aligned_resource(path, keywords=100, steps=10):
+    """Writes a resource file whose keyword table has column headers."""
+    with io.open(path, 'w', encoding='UTF-8') as output:
+        output.write(u'*** Keywords ***    Step    Input    Expected\n')
+        for kw in range(keywords):
+            name = 'Keyword %d' % kw if kw % 3 else \
+                'Keyword with a name longer than the first column %d' % kw
+            output.write(u'%s\n' % name)
+            output.write(u'    [Arguments]    ${arg%d}\n' % kw)
+            for step in range(steps):
+                output.write(u'    Log Many    %s    value  with  spaces\n'
+                             % ('x' * (step * kw % 23)))
+            output.write(u'    ${result}=    Set Variable    ${EMPTY}    \\\n')
+        output.write(u'\n*** Variables ***\n${VAR}    value\n')
+
+
+def serialize(datafile, **options):
+    output = io.StringIO()
+    datafile.save(output=output, **options)
+    return output.getvalue()
+
+
+class TestStreamingWriter(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, 'aligned.robot')
+        write_aligned_resource(self.path, keywords=6, steps=3)
+        self.datafile = ResourceFile(source=self.path).populate()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_aligned_table(self):
+        lines = serialize(self.datafile).splitlines()
+        lines = lines[lines.index('*** Keywords ***      Step           '
+                                  'Input           Expected'):]
+        self.assertEqual(lines[1], 'Keyword with a name longer than the '
+                                   'first column 0')
+        self.assertEqual(lines[2], '                      [Arguments]    '
+                                   '${arg0}')
+        self.assertEqual(lines[8], 'Keyword 1             [Arguments]    '
+                                   '${arg1}')
+        self.assertEqual(lines[10], '                      Log Many       '
+                                    'x               value       with'
+                                    '      spaces')
+
+    def test_widths_are_counted_once_per_table(self):
+        counted = []
+        original = aligners.ColumnAligner._count_widths
+
+        def count_widths(aligner, *args):
+            counted.append(args)
+            return original(aligner, *args)
+        aligners.ColumnAligner._count_widths = count_widths
+        try:
+            serialize(self.datafile)
+            serialize(self.datafile, pipe_separated=True)
+        finally:
+            aligners.ColumnAligner._count_widths = original
+        self.assertEqual(len(counted), 2)
+
+    def test_widths_from_extracted_rows_match_counting_from_table(self):
+        table = self.datafile.keyword_table
+        rows = list(aligners.DataExtractor(lambda t, n: True)
+                    .rows_from_table(table))
+        self.assertEqual(aligners.ColumnAligner(18, table, rows)._widths,
+                         aligners.ColumnAligner(18, table)._widths)
+
+
+def benchmark(keywords=2000, steps=10):
+    directory = tempfile.mkdtemp()
+    try:
+        path = os.path.join(directory, 'aligned.robot')
+        write_aligned_resource(path, keywords, steps)
+        datafile = ResourceFile(source=path).populate()
+        for options in ({}, {'pipe_separated': True}, {'format': 'tsv'},
+                        {'format': 'html'}):
+            start = time.perf_counter()
+            serialize(datafile, **options)
+            print('%-26s %8.1f ms' % (options or 'space separated',
+                                      (time.perf_counter() - start) * 1000))
+    finally:
+        shutil.rmtree(directory)
+
+
+if __name__ == '__main__':
+    if sys.argv[1:2] == ['--benchmark']:
+        benchmark(*[int(arg) for arg in sys.argv[2:]])
+    else:
+        unittest.main()
@@ -16,8 +16,9 @@
 import unittest
 from nose.tools import assert_equal, assert_true
 
-from robotide.ui.keywordsearch import _KeywordData, _SearchCriteria,\
-    ALL_KEYWORDS, ALL_USER_KEYWORDS, ALL_LIBRARY_KEYWORDS, _SortOrder
+from robotide.ui.keywordsearch import _KeywordData, _KeywordTable, \
+    _SearchCriteria, ALL_KEYWORDS, ALL_USER_KEYWORDS, ALL_LIBRARY_KEYWORDS, \
+    _SortOrder
 from robotide.spec.iteminfo import ItemInfo
 
 test_kws = [ItemInfo(name, source, desc) for name, source, desc in
@@ -38,6 +39,10 @@ class Keyword(object):
         self.source = source
         self.doc = doc
 
+    @property
+    def details(self):
+        return self.doc
+
     def is_user_keyword(self):
         return self.source.endswith('.txt')
 
@@ -93,6 +98,49 @@ class TestSearchCriteria(unittest.TestCase):
         assert_equal(criteria.matches(keyword), expected)
 
 
+class TestKeywordTable(unittest.TestCase):
+    keywords = [Keyword(name, source, doc) for name, source, doc in
+                [('Should Be Equal', 'BuiltIn', 'Fails unless equal'),
+                 ('get bar', 'resource.txt', 'getting bar'),
+                 ('Get File', 'OperatingSystem', 'Returns contents'),
+                 ('Bar', 'OBarsystem', 'Doc'),
+                 ('User Keyword', 'resource.txt', 'Quuz'),
+                 ('', 'empty.txt', ''),
+                 ('Data End', 'source.txt', 'start')]]
+
+    def test_search_matches_criteria(self):
+        table = _KeywordTable(self.keywords)
+        for pattern in ['', 'bar', 'B A R', 'get', 'ta e', 'tends', 'rt',
+                        'quuz', 'doc', 'nomatch', 'equalfails']:
+            for search_docs in True, False:
+                for source in (ALL_KEYWORDS, ALL_USER_KEYWORDS,
+                               ALL_LIBRARY_KEYWORDS, 'resource.txt'):
+                    criteria = _SearchCriteria(pattern, search_docs, source)
+                    assert_equal(table.search(criteria),
+                                 [kw for kw in self.keywords
+                                  if criteria.matches(kw)])
+
+    def test_search_keeps_original_order(self):
+        table = _KeywordTable(self.keywords)
+        result = table.search(_SearchCriteria('e', False))
+        assert_equal(result, [kw for kw in self.keywords if 'e' in
+                              kw.name.lower().replace(' ', '')])
+
+    def test_lowered_values(self):
+        table = _KeywordTable(self.keywords)
+        assert_equal(table.lower(self.keywords[0], 'name'), 'should be equal')
+        assert_equal(table.lower(self.keywords[0], 'details'),
+                     'fails unless equal')
+        assert_equal(table.lower(Keyword('Other', 'x', ''), 'name'), 'other')
+
+    def test_sort_by_search_with_table(self):
+        order = _SortOrder()
+        order.searched('bar')
+        kw_data = _KeywordData(self.keywords, order, 'bar',
+                               _KeywordTable(self.keywords))
+        assert_equal([kw.name for kw in kw_data], ['Bar', 'get bar'])
+
+
 class TestKeyWordData(unittest.TestCase):
 
     def test_sort_by_search(self):
@@ -0,0 +1,131 @@
+#  Copyright 2008-2015 Nokia Networks
+#  Copyright 2016-     Robot Framework Foundation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import unittest
+
+from robotide.publish import PUBLISHER
+from robotide.publish.messages import (
+    RideItemStepsChanged, RideUserKeywordAdded, RideSuiteAdded,
+    RideDataChanged, RideDataChangedToDirty, RideTestCaseAdded,
+    RideImportSettingChanged, RideLogMessage, RideSettingsChanged,
+    RideTreeSelection)
+from robotide.ui.preview import (PreviewCache, _changed_datafile,
+                                 _data_changed_topics)
+
+
+class _Datafile(object):
+
+    def __init__(self, name):
+        self.name = name
+        self.data = object()
+        self.datafile_controller = self
+
+
+class TestPreviewCache(unittest.TestCase):
+
+    def setUp(self):
+        self.cache = PreviewCache()
+        self.renders = []
+        self.first, self.second = _Datafile('first'), _Datafile('second')
+
+    def _get(self, datafile, file_format='HTML'):
+        def render():
+            self.renders.append((datafile.name, file_format))
+            return '%s as %s' % (datafile.name, file_format)
+        return self.cache.get(datafile, file_format, render)
+
+    def test_previews_are_rendered_once_per_datafile_and_format(self):
+        for _ in range(3):
+            self.assertEqual(self._get(self.first), 'first as HTML')
+            self._get(self.first, 'Text (Pipes)')
+            self._get(self.second)
+        self.assertEqual(self.renders, [('first', 'HTML'),
+                                        ('first', 'Text (Pipes)'),
+                                        ('second', 'HTML')])
+
+    def test_invalidating_datafile(self):
+        self._get(self.first)
+        self._get(self.second)
+        self.cache.invalidate(self.first)
+        self._get(self.first)
+        self._get(self.second)
+        self.assertEqual(len(self.renders), 3)
+
+    def test_invalidating_with_model(self):
+        self._get(self.first)
+        self.cache.invalidate(self.first.data)
+        self._get(self.first)
+        self.assertEqual(len(self.renders), 2)
+
+    def test_invalidating_all(self):
+        self._get(self.first)
+        self._get(self.second)
+        self.cache.invalidate()
+        self._get(self.first)
+        self._get(self.second)
+        self.assertEqual(len(self.renders), 4)
+
+    def test_least_recently_used_previews_are_dropped(self):
+        self.cache.max_size = 2
+        third = _Datafile('third')
+        for datafile in (self.first, self.second, self.first, third):
+            self._get(datafile)
+        self._get(self.first)
+        self._get(self.second)
+        self.assertEqual([name for name, _ in self.renders],
+                         ['first', 'second', 'third', 'second'])
+
+
+class TestChangedDatafile(unittest.TestCase):
+
+    def test_datafile_from_message(self):
+        datafile = _Datafile('file')
+        self.assertIs(_changed_datafile(RideUserKeywordAdded(
+            datafile=datafile, name='kw', item=None)), datafile)
+        self.assertIs(_changed_datafile(RideItemStepsChanged(item=datafile)),
+                      datafile)
+
+    def test_unknown_datafile(self):
+        self.assertIsNone(_changed_datafile(RideSuiteAdded(parent=None,
+                                                           suite=None)))
+
+
+class TestDataChangedTopics(unittest.TestCase):
+
+    def setUp(self):
+        self.received = []
+        for topic in _data_changed_topics():
+            PUBLISHER.subscribe(self.received.append, topic, key=self)
+
+    def tearDown(self):
+        PUBLISHER.unsubscribe_all(key=self)
+
+    def test_data_changes_are_received_once(self):
+        messages = [RideDataChanged, RideDataChangedToDirty, RideTestCaseAdded,
+                    RideUserKeywordAdded, RideItemStepsChanged,
+                    RideImportSettingChanged, RideSuiteAdded]
+        for message in messages:
+            PUBLISHER.publish(message.topic, message)
+        self.assertEqual(self.received, messages)
+
+    def test_other_messages_are_not_received(self):
+        for message in (RideLogMessage, RideSettingsChanged,
+                        RideTreeSelection):
+            PUBLISHER.publish(message.topic, message)
+        self.assertEqual(self.received, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
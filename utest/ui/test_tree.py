@@ -19,7 +19,7 @@ from wx._core import wxAssertionError
 
 from robotide.robotapi import (TestDataDirectory, TestCaseFile, ResourceFile,
                                TestCase, UserKeyword)
-from nose.tools import assert_equal
+from nose.tools import assert_equal, assert_true, assert_false
 from robotide.spec.librarymanager import LibraryManager
 from robotide.ui.images import TreeImageList
 
@@ -77,6 +77,7 @@ class _FakeEditor(object):
 
 
 class _BaseSuiteTreeTest(unittest.TestCase):
+    _virtual = False
 
     def setUp(self):
         # frame = _FakeMainFrame(None)
@@ -88,6 +89,7 @@ class _BaseSuiteTreeTest(unittest.TestCase):
         images = TreeImageList()
         self._tree._images = images
         self._tree.SetImageList(images)
+        self._tree._use_virtual_tree = lambda model: self._virtual
         self._tree.populate(self._model)
         self._expand_all()
 
@@ -149,6 +151,54 @@ class _BaseSuiteTreeTest(unittest.TestCase):
         self._tree.SelectItem(self._get_node(label))
 
 
+class TestVirtualTree(_BaseSuiteTreeTest):
+    _virtual = True
+
+    def _create_model(self):
+        model = _BaseSuiteTreeTest._create_model(self)
+        nested = self._create_directory_suite('/top_suite/nested')
+        inner = self._create_directory_suite('/top_suite/nested/inner')
+        inner.children = [self._create_file_suite('deeper_suite.txt')]
+        nested.children = [self._create_file_suite('deep_suite.txt'), inner]
+        model.data.data.children.append(nested)
+        model._controller = TestDataDirectoryController(model.data.data)
+        return model
+
+    def _expand_all(self):
+        pass
+
+    def _labels(self):
+        return [self._tree.GetItemText(node)
+                for node in self._tree._datafile_nodes]
+
+    def test_children_of_collapsed_suites_are_not_rendered(self):
+        assert_true('Nested' in self._labels())
+        assert_false('Deep Suite' in self._labels())
+
+    def test_children_are_rendered_when_expanded(self):
+        self._tree._expand_and_render_children(self._get_node('Nested'))
+        assert_true('Deep Suite' in self._labels())
+
+    def test_children_are_rendered_when_looked_up(self):
+        deep = self._model.data.children[-1].children[0]
+        node = self._tree._get_datafile_node(deep.data)
+        assert_equal(self._tree.GetItemText(node), 'Deep Suite')
+
+    def test_path_to_nested_children_is_rendered_once(self):
+        rendered = []
+        render = self._tree._render_lazy_datafiles
+
+        def render_and_record(node):
+            if node in self._tree._lazy_nodes:
+                rendered.append(self._tree.GetItemText(node))
+            render(node)
+        self._tree._render_lazy_datafiles = render_and_record
+        deeper = self._model.data.children[-1].children[1].children[0]
+        node = self._tree._find_datafile_node(deeper)
+        assert_equal(self._tree.GetItemText(node), 'Deeper Suite')
+        assert_equal(rendered, ['Nested', 'Inner'])
+
+
 class TestPopulating(_BaseSuiteTreeTest):
 
     def test_suite_count_and_names(self):
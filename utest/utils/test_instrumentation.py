@@ -0,0 +1,114 @@
+#  Copyright 2008-2015 Nokia Networks
+#  Copyright 2016-     Robot Framework Foundation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import json
+import os
+import tempfile
+import unittest
+
+from robotide.utils.instrumentation import Instrumentation, Probe
+
+
+class TestProbe(unittest.TestCase):
+
+    def test_percentiles(self):
+        probe = Probe('x')
+        for ms in range(1, 101):
+            probe.record(ms / 1000.0)
+        self.assertEqual(probe.calls, 100)
+        self.assertAlmostEqual(probe.percentile(50), 0.050, places=3)
+        self.assertAlmostEqual(probe.percentile(95), 0.095, places=3)
+
+    def test_only_latest_samples_are_kept(self):
+        probe = Probe('x', samples=3)
+        for seconds in (9, 9, 9, 1, 1, 1):
+            probe.record(seconds)
+        self.assertEqual(probe.calls, 6)
+        self.assertEqual(probe.percentile(95), 1)
+
+    def test_hit_rate(self):
+        probe = Probe('x')
+        self.assertIsNone(probe.hit_rate)
+        probe.hits, probe.misses = 3, 1
+        self.assertEqual(probe.hit_rate, 0.75)
+
+
+class TestInstrumentation(unittest.TestCase):
+
+    def setUp(self):
+        self.instrumentation = Instrumentation()
+
+        @self.instrumentation.timed('function')
+        def function(value):
+            return value * 2
+
+        @self.instrumentation.timed('generator')
+        def generator(count):
+            for index in range(count):
+                yield index
+
+        self.function = function
+        self.generator = generator
+
+    def test_nothing_is_recorded_when_disabled(self):
+        self.assertEqual(self.function(2), 4)
+        self.assertEqual(list(self.generator(3)), [0, 1, 2])
+        self.instrumentation.hit('cache')
+        self.assertEqual(self.instrumentation.probes, [])
+
+    def test_calls_and_cache_lookups_are_recorded_when_enabled(self):
+        self.instrumentation.enable()
+        self.assertEqual(self.function(2), 4)
+        self.assertEqual(list(self.generator(3)), [0, 1, 2])
+        self.instrumentation.hit('cache')
+        self.instrumentation.miss('cache')
+        probes = dict((p.name, p) for p in self.instrumentation.probes)
+        self.assertEqual(probes['function'].calls, 1)
+        self.assertEqual(probes['generator'].calls, 1)
+        self.assertEqual(probes['cache'].hit_rate, 0.5)
+
+    def test_reset(self):
+        self.instrumentation.enable()
+        self.function(1)
+        self.instrumentation.reset()
+        self.assertEqual(self.instrumentation.probes, [])
+
+    def test_gauges_are_read_when_requested(self):
+        values = [1]
+        self.instrumentation.gauge('size', lambda: values[-1])
+        values.append(5)
+        self.assertEqual(self.instrumentation.gauges, [('size', 5)])
+        self.instrumentation.reset()
+        self.assertEqual(self.instrumentation.gauges, [('size', 5)])
+
+    def test_snapshot_to_json(self):
+        self.instrumentation.enable()
+        self.function(1)
+        self.instrumentation.gauge('size', lambda: 42)
+        path = os.path.join(tempfile.gettempdir(), 'ride-perf-test.json')
+        try:
+            self.instrumentation.write_json(path)
+            with open(path) as snapshot:
+                data = json.load(snapshot)
+        finally:
+            os.remove(path)
+        self.assertTrue(data['enabled'])
+        self.assertEqual([p['name'] for p in data['probes']], ['function'])
+        self.assertEqual(data['probes'][0]['calls'], 1)
+        self.assertEqual(data['gauges'], {'size': 42})
+
+
+if __name__ == '__main__':
+    unittest.main()
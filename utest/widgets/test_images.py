@@ -0,0 +1,64 @@
+#  Copyright 2008-2015 Nokia Networks
+#  Copyright 2016-     Robot Framework Foundation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import unittest
+
+from robotide.widgets.images import ImageProvider
+
+
+class _CountingProvider(ImageProvider):
+    _cache = {}
+    loaded = []
+
+    def _load_image(self, name):
+        self.loaded.append(name)
+        return 'bitmap of %s' % name
+
+    def _img_from_art_provider(self, source):
+        self.loaded.append(source)
+        return 'art of %s' % source
+
+
+class TestImageProvider(unittest.TestCase):
+
+    def setUp(self):
+        _CountingProvider._cache.clear()
+        del _CountingProvider.loaded[:]
+
+    def test_nothing_is_decoded_on_creation(self):
+        _CountingProvider()
+        self.assertEqual(_CountingProvider.loaded, [])
+
+    def test_images_are_decoded_once_and_shared(self):
+        first, second = _CountingProvider(), _CountingProvider()
+        self.assertEqual(first.TOOLBAR_PLAY, 'bitmap of control_play.png')
+        self.assertEqual(second.TOOLBAR_CONTINUE, first.TOOLBAR_PLAY)
+        self.assertEqual(second.get_image_by_name('TOOLBAR_PLAY'),
+                         first.TOOLBAR_PLAY)
+        self.assertEqual(_CountingProvider.loaded, ['control_play.png'])
+
+    def test_art_provider_images_are_cached_per_size(self):
+        small, large = _CountingProvider(), _CountingProvider((32, 32))
+        small.DATADIRIMG, small.DATADIRIMG, large.DATADIRIMG
+        self.assertEqual(len(_CountingProvider.loaded), 2)
+
+    def test_unknown_images(self):
+        self.assertIsNone(_CountingProvider().get_image_by_name('NOT_THERE'))
+        self.assertRaises(AttributeError, getattr, _CountingProvider(),
+                          'NOT_THERE')
+
+
+if __name__ == '__main__':
+    unittest.main()